@@ -1,12 +1,17 @@
 // Dataset Explorer - Chart.js implementation
-// Loads CSV data and displays all datapoints in a scatter plot
+// Loads precomputed binary point data (scripts/build_explorer_data.py) and
+// displays all datapoints in a scatter plot. Falls back to parsing the CSV.
 
 (function() {
   'use strict';
 
   const CSV_PATH = 'language_analysis_masterframe25OCT.csv';
+  const DATA_DIR = 'assets/data/explorer/';
   let chart = null;
   let allData = [];
+  let manifest = null;
+  let dictionary = null;
+  let dictionaryRequest = null;
 
   // Color mapping for relationship types
   const relationshipColors = {
@@ -31,20 +36,90 @@
     );
   }
 
+  // Build a Chart.js dataset shell for a relationship type
+  function createDataset(type) {
+    return {
+      label: type.replace(/_/g, ' ').replace(/\b\w/g, l => l.toUpperCase()),
+      data: [],
+      backgroundColor: relationshipColors[type] || 'rgba(128, 128, 128, 0.6)',
+      borderColor: relationshipColors[type] || 'rgba(128, 128, 128, 0.8)',
+      pointRadius: 3,
+      pointHoverRadius: 5
+    };
+  }
+
+  function fetchOk(path) {
+    return fetch(path).then(response => {
+      if (!response.ok) {
+        throw new Error(`HTTP error! status: ${response.status}`);
+      }
+      return response;
+    });
+  }
+
+  // Decode one relationship binary: uint16 x values followed by uint16 y values
+  function decodePoints(buffer, entry) {
+    const view = new DataView(buffer);
+    const count = entry.count;
+    const points = new Array(count);
+    for (let i = 0; i < count; i++) {
+      points[i] = {
+        x: view.getUint16(i * 2, true) / manifest.x.scale,
+        y: view.getUint16((count + i) * 2, true) / manifest.y.scale,
+        index: entry.offset + i
+      };
+    }
+    return points;
+  }
+
+  // Load per-relationship binaries listed in the manifest
+  function loadBinaryDatasets() {
+    return fetchOk(DATA_DIR + 'manifest.json')
+      .then(response => response.json())
+      .then(loaded => {
+        manifest = loaded;
+        return Promise.all(manifest.relationships.map(entry =>
+          fetchOk(`${DATA_DIR}${entry.file}?v=${manifest.source}`)
+            .then(response => response.arrayBuffer())
+            .then(buffer => {
+              const dataset = createDataset(entry.type);
+              dataset.data = decodePoints(buffer, entry);
+              return dataset;
+            })
+        ));
+      });
+  }
+
+  // Fetch the word/domain dictionary for tooltips once, off the critical path
+  function loadDictionary() {
+    if (!manifest || dictionaryRequest) return;
+    dictionaryRequest = fetchOk(`${DATA_DIR}${manifest.dictionary}?v=${manifest.source}`)
+      .then(response => response.json())
+      .then(loaded => {
+        dictionary = loaded;
+        if (chart) chart.update('none');
+      })
+      .catch(error => console.error('Error loading word dictionary:', error));
+  }
+
+  // Word details for a tooltip point, from CSV rows or the lazy dictionary
+  function pointDetails(point) {
+    if (point.index === undefined) return point;
+    if (!dictionary) {
+      loadDictionary();
+      return { english_word: '…', spanish_word: '…', cultural_domain: '…' };
+    }
+    const row = dictionary.rows[point.index];
+    return { english_word: row[0], spanish_word: row[1], cultural_domain: dictionary.domains[row[2]] };
+  }
+
   // Group data by relationship type
   function groupDataByRelationship(data) {
     const grouped = {};
     data.forEach(row => {
       const type = row.relationship_type || 'unknown';
       if (!grouped[type]) {
-        grouped[type] = {
-          label: type.replace(/_/g, ' ').replace(/\b\w/g, l => l.toUpperCase()),
-          data: [],
-          backgroundColor: relationshipColors[type] || 'rgba(128, 128, 128, 0.6)',
-          borderColor: relationshipColors[type] || 'rgba(128, 128, 128, 0.8)',
-          pointRadius: 3,
-          pointHoverRadius: 5
-        };
+        grouped[type] = createDataset(type);
       }
       grouped[type].data.push({
         x: row.levenshtein_similarity,
@@ -118,12 +193,13 @@
               },
               label: function(context) {
                 const point = context.raw;
+                const details = pointDetails(point);
                 return [
-                  `English: ${point.english_word}`,
-                  `Spanish: ${point.spanish_word}`,
+                  `English: ${details.english_word}`,
+                  `Spanish: ${details.spanish_word}`,
                   `Similarity: ${point.x.toFixed(2)}`,
                   `Complexity: ${point.y.toFixed(2)}`,
-                  `Domain: ${point.cultural_domain || 'N/A'}`
+                  `Domain: ${details.cultural_domain || 'N/A'}`
                 ];
               }
             },
@@ -197,16 +273,24 @@
         return;
       }
 
-      fetch(CSV_PATH)
-        .then(response => {
-          if (!response.ok) {
-            throw new Error(`HTTP error! status: ${response.status}`);
-          }
-          return response.text();
+      loadBinaryDatasets()
+        .then(datasets => {
+          allData = datasets;
+          // Prefetch tooltip words once the browser is idle
+          (window.requestIdleCallback || (callback => setTimeout(callback, 1000)))(loadDictionary);
+          return datasets;
+        })
+        .catch(error => {
+          console.warn('Precomputed explorer data unavailable, parsing CSV instead:', error);
+          manifest = null;
+          return fetchOk(CSV_PATH)
+            .then(response => response.text())
+            .then(csvText => {
+              allData = parseCSV(csvText);
+              return groupDataByRelationship(allData);
+            });
         })
-        .then(csvText => {
-          allData = parseCSV(csvText);
-          const datasets = groupDataByRelationship(allData);
+        .then(datasets => {
           // Small delay to ensure container dimensions are stable
           setTimeout(() => {
             createChart(datasets);
@@ -236,7 +320,7 @@
     clearTimeout(resizeTimeout);
     resizeTimeout = setTimeout(function() {
       if (chart && allData.length > 0) {
-        const datasets = groupDataByRelationship(allData);
+        const datasets = manifest ? allData : groupDataByRelationship(allData);
         createChart(datasets);
       }
     }, 250);
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""Benchmark the pipeline on synthetic masterframes scaled up from the real one.
+
+The synthetic frame at scale ``k`` holds the real rows followed by
+``(k - 1) * n`` rows resampled from them. In the resampled rows, attestation
+years and frequency scores are perturbed and the complexity columns are
+recomputed (``complexity.ComplexityEngine``). The relationship mix, domain
+mix, attestation spread and complexity ranges therefore follow the real data.
+Generated CSVs are kept under ``.cache/bench``.
+
+Each step is timed over ``--repeat`` runs; the best and the median are both
+recorded. Its peak Python/numpy allocation is measured in a separate
+``tracemalloc`` run. Results are written as JSON and compared against
+``benchmark_baseline.json``: a step regresses when its median time or peak
+memory grows by more than the tolerance factor *and* by more than a small
+absolute amount, so millisecond-scale steps do not flag on noise.
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from masterframe import CACHE_DIR, DATA_PATH, NUMERIC_COLUMNS, SCHEMA, build_cache, float64_values, load_masterframe
+
+BENCH_DIR = CACHE_DIR / "bench"
+RESULTS_PATH = BENCH_DIR / "results.json"
+BASELINE_PATH = Path(__file__).resolve().with_name("benchmark_baseline.json")
+SCALES = (1, 10, 100, 1000)
+REPEAT = 3
+RANDOM_SEED = 2025
+YEAR_NOISE = 25  # +/- years on resampled attestation dates
+FREQUENCY_NOISE = 0.25  # standard deviation on resampled frequency scores
+TOLERANCE = 1.5  # slower / larger than baseline by this factor counts as a regression
+MIN_SECONDS_DELTA = 0.05  # ... provided it is also this much slower
+MIN_MIB_DELTA = 1.0  # ... or this much larger
+
+
+def synthesize_masterframe(scale: int, seed: int = RANDOM_SEED, source: Path = DATA_PATH) -> pd.DataFrame:
+    """The real masterframe plus ``scale - 1`` resampled copies of its size."""
+    from complexity import ComplexityEngine
+
+    real = load_masterframe(csv_path=source)
+    extra = (scale - 1) * len(real)
+    if extra <= 0:
+        return real
+    rng = np.random.default_rng(seed)
+    sampled = real.iloc[rng.integers(0, len(real), extra)].reset_index(drop=True)
+
+    for column in ["first_attestation_english", "first_attestation_spanish"]:
+        years = float64_values(sampled[column]) + rng.integers(-YEAR_NOISE, YEAR_NOISE + 1, extra)
+        sampled[column] = np.clip(years, SCHEMA[column]["min"], SCHEMA[column]["max"])
+    frequency = float64_values(sampled["complexity_frequency_complexity"]) + rng.normal(0, FREQUENCY_NOISE, extra)
+    sampled["complexity_frequency_complexity"] = np.clip(frequency, 0.0, 7.0).round(2)
+    for column, values in ComplexityEngine(sampled).frame().items():
+        sampled[column] = values.to_numpy()
+
+    df = pd.concat([real, sampled], ignore_index=True)
+    for column in NUMERIC_COLUMNS:
+        values = float64_values(df[column])
+        decimals = SCHEMA[column].get("decimals")
+        df[column] = values.round(decimals) if decimals is not None else pd.array(values).astype("Int64")
+    return df
+
+
+def synthetic_csv(scale: int, seed: int = RANDOM_SEED) -> Path:
+    """Path of the scale-``scale`` CSV, generating it on first use."""
+    path = BENCH_DIR / f"masterframe_x{scale}_seed{seed}.csv"
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        synthesize_masterframe(scale, seed).to_csv(tmp_path, index=False)
+        os.replace(tmp_path, path)
+    return path
+
+
+@dataclass
+class Step:
+    """A benchmarked workload; ``prepare`` is untimed and feeds ``run``."""
+
+    name: str
+    prepare: Callable[[Path], object]
+    run: Callable[[object], object]
+
+
+def _business_impact_input(csv_path: Path) -> pd.DataFrame:
+    from calculate_business_impact import METRIC_COLUMNS
+
+    return load_masterframe(METRIC_COLUMNS, csv_path)
+
+
+def _business_impact(df: pd.DataFrame) -> object:
+    from calculate_business_impact import compute_business_impact
+
+    return compute_business_impact(df)
+
+
+def _plot(csv_path: Path) -> object:
+    from regenerate_interactive_plot import DOMAIN_MAP, apply_jitter, build_figure, load_dataset
+
+    return build_figure(apply_jitter(load_dataset(list(DOMAIN_MAP), csv_path)))
+
+
+def _executive_summary(df: pd.DataFrame) -> object:
+    from calculate_business_impact import compute_business_impact
+    from generate_executive_summary import create_executive_summary, metrics_from_frame
+
+    metrics = metrics_from_frame(df, compute_business_impact(df), "Benchmark")
+    with tempfile.TemporaryDirectory() as tmp_dir, contextlib.redirect_stdout(io.StringIO()):
+        return create_executive_summary(os.path.join(tmp_dir, "summary.pdf"), metrics)
+
+
+def _cached(csv_path: Path) -> Path:
+    build_cache(csv_path)
+    return csv_path
+
+
+STEPS: Dict[str, Step] = {
+    step.name: step
+    for step in [
+        Step("csv_load", lambda path: path, lambda path: load_masterframe(csv_path=path, use_cache=False)),
+        Step("cache_load", _cached, lambda path: load_masterframe(csv_path=path)),
+        Step("business_impact", _business_impact_input, _business_impact),
+        Step("plot", _cached, _plot),
+        Step("executive_summary", lambda path: load_masterframe(csv_path=_cached(path)), _executive_summary),
+    ]
+}
+
+
+def measure(step: Step, csv_path: Path, repeat: int = REPEAT) -> Dict[str, float]:
+    """Best and median wall time over ``repeat`` runs and the traced peak allocation of one more."""
+    state = step.prepare(csv_path)
+    step.run(state)  # warm up imports and caches
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        step.run(state)
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        step.run(state)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"seconds": min(timings), "median_seconds": float(np.median(timings)), "peak_mib": peak / 2**20}
+
+
+def run_benchmarks(
+    scales: Sequence[int] = SCALES,
+    steps: Sequence[str] = tuple(STEPS),
+    repeat: int = REPEAT,
+    seed: int = RANDOM_SEED,
+) -> Dict[str, object]:
+    results: List[Dict[str, object]] = []
+    for scale in scales:
+        csv_path = synthetic_csv(scale, seed)
+        rows = len(load_masterframe(["relationship_type"], _cached(csv_path)))
+        for name in steps:
+            measurement = measure(STEPS[name], csv_path, repeat)
+            results.append({"step": name, "scale": scale, "rows": rows, **measurement})
+            print(f"  x{scale:<5} {name:<18} {measurement['seconds']:9.3f}s {measurement['peak_mib']:9.1f} MiB",
+                  flush=True)
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "machine": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+        },
+        "repeat": repeat,
+        "seed": seed,
+        "results": results,
+    }
+
+
+def compare(results: Dict[str, object], baseline: Dict[str, object], tolerance: float = TOLERANCE) -> pd.DataFrame:
+    """Time and memory ratios against ``baseline`` for the (step, scale) pairs both contain.
+
+    Times are medians where both sides recorded them (older baselines only
+    have the best time). A ratio above ``tolerance`` is a regression only if
+    the absolute growth also exceeds ``MIN_SECONDS_DELTA`` / ``MIN_MIB_DELTA``.
+    """
+    key = ["step", "scale"]
+    current = pd.DataFrame(results["results"]).set_index(key)
+    reference = pd.DataFrame(baseline["results"]).set_index(key)
+    timing = "median_seconds" if "median_seconds" in current and "median_seconds" in reference else "seconds"
+    joined = current.join(reference, rsuffix="_baseline", how="inner")
+    table = pd.DataFrame({
+        "seconds": joined[timing],
+        "time_ratio": joined[timing] / joined[f"{timing}_baseline"],
+        "peak_mib": joined["peak_mib"],
+        "memory_ratio": joined["peak_mib"] / joined["peak_mib_baseline"],
+    })
+    slower = (table["time_ratio"] > tolerance) & (joined[timing] - joined[f"{timing}_baseline"] > MIN_SECONDS_DELTA)
+    larger = (table["memory_ratio"] > tolerance) & (joined["peak_mib"] - joined["peak_mib_baseline"] > MIN_MIB_DELTA)
+    table["regression"] = slower | larger
+    return table
+
+
+def _write_json(path: Path, payload: Dict[str, object]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=list(SCALES))
+    parser.add_argument("--steps", nargs="+", choices=list(STEPS), default=list(STEPS))
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--seed", type=int, default=RANDOM_SEED)
+    parser.add_argument("--output", type=Path, default=RESULTS_PATH)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE,
+                        help=f"Allowed slowdown / growth factor (default: {TOLERANCE})")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--check", action="store_true", help="Exit with status 1 on a regression")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = parse_args(argv)
+    print(f"Benchmarking scales {', '.join(f'x{scale}' for scale in args.scales)}:")
+    results = run_benchmarks(args.scales, args.steps, args.repeat, args.seed)
+    _write_json(args.output, results)
+    print(f"Results written to {args.output}")
+
+    if args.save_baseline:
+        _write_json(args.baseline, results)
+        print(f"Baseline saved to {args.baseline}")
+        return
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+        return
+    table = compare(results, json.loads(args.baseline.read_text(encoding="utf-8")), args.tolerance)
+    print(f"\nAgainst {args.baseline.name} (tolerance x{args.tolerance:g}):")
+    print(table.to_string(float_format=lambda value: f"{value:.3f}"))
+    if args.check and table["regression"].any():
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
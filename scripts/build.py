@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""Incremental site build: CSV -> metrics -> PDF / interactive plot / explorer data.
+
+Every target declares its input files, the code it runs, its parameters and
+the targets it depends on. A target is rebuilt only when the signature over
+those (plus the content of its dependencies' outputs) changes or an output
+is missing or was modified since it was built. Independent targets run in parallel worker
+processes. File hashes are cached by size and mtime, so a no-op build reads
+no data file contents (only the scripts' import statements) and does not
+import pandas.
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import contextlib
+import hashlib
+import importlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+ROOT = SCRIPTS_DIR.parent
+DATA_PATH = ROOT / "language_analysis_masterframe25OCT.csv"
+BUILD_DIR = ROOT / ".cache" / "build"
+STATE_PATH = BUILD_DIR / "state.json"
+HASH_CHUNK_SIZE = 1 << 20  # bytes
+
+
+@dataclass
+class Target:
+    """One build step: ``module.function(*args)`` run from ``scripts/``.
+
+    The target's code is ``module`` plus every sibling script it imports,
+    transitively; ``code`` lists extra modules it depends on without importing.
+    """
+
+    name: str
+    module: str
+    function: str
+    outputs: List[Path]
+    inputs: List[Path] = field(default_factory=list)
+    code: List[str] = field(default_factory=list)
+    deps: List[str] = field(default_factory=list)
+    args: Tuple[object, ...] = ()
+    stdout: Optional[Path] = None
+
+    def code_paths(self) -> List[Path]:
+        modules = sibling_modules([self.module, *self.code])
+        return [SCRIPTS_DIR / f"{module}.py" for module in sorted(modules)]
+
+
+def sibling_modules(roots: Sequence[str]) -> set:
+    """``roots`` and the ``scripts/`` modules they import, transitively.
+
+    Imports are read with ``ast``, including those inside functions, so
+    nothing is executed.
+    """
+    found: set = set()
+    stack = list(roots)
+    while stack:
+        module = stack.pop()
+        path = SCRIPTS_DIR / f"{module}.py"
+        if module in found or not path.is_file():
+            continue
+        found.add(module)
+        for node in ast.walk(ast.parse(path.read_text(encoding="utf-8"), filename=str(path))):
+            if isinstance(node, ast.Import):
+                stack.extend(alias.name.split(".")[0] for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                stack.append(node.module.split(".")[0])
+    return found
+
+
+TARGETS: Dict[str, Target] = {
+    target.name: target
+    for target in [
+        Target(
+            name="cache",
+            module="masterframe",
+            function="build_cache",
+            inputs=[DATA_PATH],
+            # The cache file name carries a schema digest only masterframe can compute;
+            # load_masterframe rebuilds a missing cache on its own.
+            outputs=[],
+            args=(DATA_PATH,),
+        ),
+        Target(
+            name="metrics",
+            module="calculate_business_impact",
+            function="main",
+            inputs=[DATA_PATH],
+            deps=["cache"],
+            outputs=[BUILD_DIR / "business_impact.txt"],
+            stdout=BUILD_DIR / "business_impact.txt",
+            args=([],),
+        ),
+        Target(
+            name="summary_pdf",
+            module="generate_executive_summary",
+            function="create_executive_summary",
+            # Renders site_metrics() computed from the masterframe, not the metrics report.
+            inputs=[DATA_PATH],
+            deps=["cache"],
+            outputs=[ROOT / "assets" / "docs" / "executive_summary.pdf"],
+            args=(str(ROOT / "assets" / "docs" / "executive_summary.pdf"),),
+        ),
+        Target(
+            name="plot",
+            module="regenerate_interactive_plot",
+            function="main",
+            inputs=[DATA_PATH],
+            deps=["cache"],
+            outputs=[ROOT / "assets" / "interactive_option_8_enhanced.html"],
+            args=([],),
+        ),
+        Target(
+            name="explorer",
+            module="build_explorer_data",
+            function="main",
+            inputs=[DATA_PATH],
+            deps=["cache"],
+            outputs=[
+                ROOT / "assets" / "data" / "explorer" / name
+                for name in [
+                    "manifest.json",
+                    "dictionary.json",
+                    "cognates.bin",
+                    "false_friends.bin",
+                    "loanword_en_to_es.bin",
+                    "loanword_es_to_en.bin",
+                ]
+            ],
+            args=([],),
+        ),
+        Target(
+            name="similar_words",
+            module="similar_words",
+            function="main",
+            inputs=[DATA_PATH],
+            deps=["cache"],
+            outputs=[ROOT / "assets" / "data" / "similar_words.json"],
+            args=([],),
+        ),
+    ]
+}
+
+
+class HashCache:
+    """sha256 of files, reused while a file's size and mtime are unchanged."""
+
+    def __init__(self, entries: Optional[Dict[str, List[object]]] = None) -> None:
+        self.entries = dict(entries or {})
+
+    def digest(self, path: Path) -> Optional[str]:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        key = str(path.relative_to(ROOT))
+        cached = self.entries.get(key)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return str(cached[2])
+        digest = hashlib.sha256()
+        with open(path, "rb") as handle:
+            for chunk in iter(lambda: handle.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        self.entries[key] = [stat.st_size, stat.st_mtime_ns, digest.hexdigest()]
+        return digest.hexdigest()
+
+
+def load_state(path: Path = STATE_PATH) -> Dict[str, Dict[str, object]]:
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return {"hashes": {}, "targets": {}}
+
+
+def save_state(state: Dict[str, Dict[str, object]], path: Path = STATE_PATH) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(state, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def signature(target: Target, hashes: HashCache) -> str:
+    """Hash of a target's inputs, code, parameters and dependency outputs.
+
+    Dependencies enter through the content of their outputs, so a rebuilt
+    dependency that produced identical files does not invalidate this target.
+    """
+    payload = {
+        "call": [target.module, target.function, repr(target.args), str(target.stdout)],
+        "inputs": {str(path): hashes.digest(path) for path in target.inputs},
+        "code": {str(path): hashes.digest(path) for path in target.code_paths()},
+        "deps": {str(path): hashes.digest(path) for dep in target.deps for path in TARGETS[dep].outputs},
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def build_order(names: Sequence[str]) -> List[str]:
+    """``names`` and their transitive dependencies, dependencies first."""
+    order: List[str] = []
+    visiting: set = set()
+
+    def visit(name: str) -> None:
+        if name in order:
+            return
+        if name in visiting:
+            raise ValueError(f"Dependency cycle through target {name!r}")
+        if name not in TARGETS:
+            raise KeyError(f"Unknown target {name!r}; choose from {', '.join(TARGETS)}")
+        visiting.add(name)
+        for dep in TARGETS[name].deps:
+            visit(dep)
+        visiting.discard(name)
+        order.append(name)
+
+    for name in names:
+        visit(name)
+    return order
+
+
+def run_target(name: str) -> float:
+    """Run one target in the current process and return its wall time."""
+    target = TARGETS[name]
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    for output in target.outputs:
+        output.parent.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    function = getattr(importlib.import_module(target.module), target.function)
+    if target.stdout is None:
+        with contextlib.redirect_stdout(sys.stderr):
+            function(*target.args)
+    else:
+        with open(target.stdout, "w", encoding="utf-8") as handle, contextlib.redirect_stdout(handle):
+            function(*target.args)
+    return time.perf_counter() - start
+
+
+def build(
+    names: Sequence[str] = tuple(TARGETS),
+    jobs: Optional[int] = None,
+    force: bool = False,
+    dry_run: bool = False,
+) -> Dict[str, str]:
+    """Bring ``names`` up to date and return each target's status.
+
+    A target is checked once all its dependencies are settled; stale targets
+    whose dependencies are done run concurrently on up to ``jobs`` processes.
+    """
+    state = load_state()
+    hashes = HashCache(state.get("hashes"))
+    recorded: Dict[str, Dict[str, object]] = state.setdefault("targets", {})
+    pending = build_order(names)
+    status: Dict[str, str] = {}
+    signatures: Dict[str, str] = {}
+
+    def is_fresh(name: str) -> bool:
+        target = TARGETS[name]
+        signatures[name] = signature(target, hashes)
+        previous = recorded.get(name, {})
+        outputs = previous.get("outputs", {})
+        return (
+            not force
+            and previous.get("signature") == signatures[name]
+            and all(outputs.get(str(path)) == hashes.digest(path) for path in target.outputs)
+        )
+
+    def finish(name: str, seconds: float) -> None:
+        recorded[name] = {
+            "signature": signatures[name],
+            "outputs": {str(path): hashes.digest(path) for path in TARGETS[name].outputs},
+        }
+        status[name] = f"rebuilt in {seconds:.2f}s"
+        save_state({"hashes": hashes.entries, "targets": recorded})
+
+    def ready() -> List[str]:
+        """Pending targets whose dependencies are settled; fresh ones are settled here."""
+        runnable: List[str] = []
+        for name in list(pending):
+            deps = TARGETS[name].deps
+            if any(dep in pending or dep in runnable or status.get(dep, "running") == "running" for dep in deps):
+                continue
+            pending.remove(name)
+            if dry_run and any(status[dep] != "up to date" for dep in deps):
+                status[name] = "may rebuild"
+            elif is_fresh(name):
+                status[name] = "up to date"
+            elif dry_run:
+                status[name] = "would rebuild"
+            else:
+                runnable.append(name)
+        return runnable
+
+    jobs = jobs or os.cpu_count() or 1
+    if dry_run or jobs <= 1:
+        while pending:
+            for name in ready():
+                finish(name, run_target(name))
+        save_state({"hashes": hashes.entries, "targets": recorded})
+        return status
+
+    running: Dict[Future, str] = {}
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        while pending or running:
+            for name in ready():
+                running[pool.submit(run_target, name)] = name
+                status[name] = "running"
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                finish(running.pop(future), future.result())
+    save_state({"hashes": hashes.entries, "targets": recorded})
+    return status
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("targets", nargs="*", help=f"Targets to build (default: all of {', '.join(TARGETS)})")
+    parser.add_argument("--jobs", "-j", type=int, help="Worker processes (default: all cores)")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if up to date")
+    parser.add_argument("--dry-run", action="store_true", help="Only report what would be rebuilt")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = parse_args(argv)
+    start = time.perf_counter()
+    status = build(args.targets or tuple(TARGETS), jobs=args.jobs, force=args.force, dry_run=args.dry_run)
+    for name, message in status.items():
+        print(f"  - {name}: {message}")
+    print(f"Build finished in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
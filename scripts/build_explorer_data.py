@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Build the precomputed binary artifacts loaded by ``js/dataset-explorer.js``.
+
+Instead of fetching and parsing the whole masterframe CSV in the browser, the
+explorer loads:
+
+* ``manifest.json`` - relationship types, point counts, scales and file names;
+* ``<relationship_type>.bin`` - little-endian ``uint16`` x values followed by
+  ``uint16`` y values, quantized to the published CSV precision; and
+* ``dictionary.json`` - english/spanish word and domain per point, fetched
+  lazily for tooltips. Rows are ordered like the concatenated ``.bin`` files,
+  so point ``i`` of a relationship is row ``offset + i``.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from masterframe import DATA_PATH, RELATIONSHIP_TYPES, ROOT, SCHEMA, file_fingerprint, float64_values, load_masterframe
+
+OUTPUT_DIR = ROOT / "assets" / "data" / "explorer"
+FORMAT_VERSION = 1
+
+X_COLUMN = "levenshtein_similarity"
+Y_COLUMN = "complexity_overall_complexity"
+EXPLORER_COLUMNS = ["english_word", "spanish_word", "relationship_type", "cultural_domain", X_COLUMN, Y_COLUMN]
+
+
+def quantize(values: np.ndarray, column: str) -> np.ndarray:
+    """Scale ``values`` to ``uint16`` using the column's published decimals."""
+    scale = 10 ** SCHEMA[column]["decimals"]
+    scaled = np.round(values * scale)
+    if scaled.min() < 0 or scaled.max() > np.iinfo(np.uint16).max:
+        raise ValueError(f"{column} does not fit uint16 at scale {scale}")
+    return scaled.astype("<u2")
+
+
+def _write_json(path: Path, payload: object) -> None:
+    path.write_text(json.dumps(payload, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+
+
+def build_explorer_data(csv_path: Path = DATA_PATH, output_dir: Path = OUTPUT_DIR) -> Dict[str, object]:
+    """Write the manifest, per-relationship binaries and tooltip dictionary."""
+    df = load_masterframe(EXPLORER_COLUMNS, csv_path)
+    x = float64_values(df[X_COLUMN])
+    y = float64_values(df[Y_COLUMN])
+    keep = ~(np.isnan(x) | np.isnan(y))
+    df, x, y = df[keep], x[keep], y[keep]
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    relationship = df["relationship_type"].astype(str).to_numpy()
+    domain_codes = df["cultural_domain"].cat.codes.to_numpy()
+    domains = list(df["cultural_domain"].cat.categories)
+
+    entries: List[Dict[str, object]] = []
+    dictionary_rows: List[List[object]] = []
+    for relationship_type in RELATIONSHIP_TYPES:
+        mask = relationship == relationship_type
+        if not mask.any():
+            continue
+        path = output_dir / f"{relationship_type}.bin"
+        path.write_bytes(quantize(x[mask], X_COLUMN).tobytes() + quantize(y[mask], Y_COLUMN).tobytes())
+        entries.append({
+            "type": relationship_type,
+            "count": int(mask.sum()),
+            "offset": len(dictionary_rows),
+            "file": path.name,
+        })
+        dictionary_rows.extend(
+            [english, spanish, int(code)]
+            for english, spanish, code in zip(
+                df["english_word"].to_numpy()[mask],
+                df["spanish_word"].to_numpy()[mask],
+                domain_codes[mask],
+            )
+        )
+
+    _write_json(output_dir / "dictionary.json", {"domains": domains, "rows": dictionary_rows})
+    manifest = {
+        "version": FORMAT_VERSION,
+        "source": str(file_fingerprint(csv_path)["sha256"])[:16],
+        "x": {"column": X_COLUMN, "scale": 10 ** SCHEMA[X_COLUMN]["decimals"]},
+        "y": {"column": Y_COLUMN, "scale": 10 ** SCHEMA[Y_COLUMN]["decimals"]},
+        "dtype": "uint16le",
+        "relationships": entries,
+        "dictionary": "dictionary.json",
+    }
+    _write_json(output_dir / "manifest.json", manifest)
+    return manifest
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output-dir", type=Path, default=OUTPUT_DIR)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = parse_args(argv)
+    manifest = build_explorer_data(output_dir=args.output_dir)
+    sizes = {path.name: path.stat().st_size for path in sorted(args.output_dir.iterdir())}
+    points = sum(entry["count"] for entry in manifest["relationships"])
+    print(f"Explorer data for {points} points written to {args.output_dir}:")
+    for name, size in sizes.items():
+        print(f"  - {name}: {size / 1024:.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,170 +2,654 @@
 """
 Calculate Business Impact Metrics for Language Learning Applications
 Based on actual frequency distribution and domain FFR data
+
+Import ``compute_business_impact`` to get the metrics as a ``BusinessImpact``
+object, or ``sweep_business_impact`` for the same metrics over whole arrays of
+thresholds; run the module as a script to print the full report.
 """
+from __future__ import annotations
 
-import pandas as pd
-import numpy as np
+import argparse
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
 
-# Load data
-data_file = Path(__file__).parent.parent / "language_analysis_masterframe25OCT.csv"
-df = pd.read_csv(data_file)
-
-print("=" * 80)
-print("BUSINESS IMPACT ANALYSIS: Language Learning Application Metrics")
-print("=" * 80)
-print()
-
-# 1. HIGH-FFR DOMAIN IMPACT ANALYSIS
-print("1. HIGH-FFR DOMAIN PRIORITIZATION IMPACT")
-print("-" * 80)
-
-# Calculate FFR by domain
-domain_stats = df.groupby('cultural_domain').agg({
-    'relationship_type': lambda x: (x == 'false_friends').sum(),
-    'english_word': 'count'
-}).rename(columns={'relationship_type': 'false_friends', 'english_word': 'total'})
-
-domain_stats['ffr'] = (domain_stats['false_friends'] / domain_stats['total'] * 100)
-domain_stats = domain_stats.sort_values('ffr', ascending=False)
-
-# Identify high-risk domains (FFR >= 10%)
-high_risk_domains = domain_stats[domain_stats['ffr'] >= 10.0]
-print(f"\nHigh-Risk Domains (FFR >= 10%):")
-for domain, row in high_risk_domains.iterrows():
-    print(f"  - {domain}: {row['ffr']:.2f}% FFR ({int(row['false_friends'])} false friends / {int(row['total'])} pairs)")
-
-# Calculate total false friends in high-risk domains
-total_ff = domain_stats['false_friends'].sum()
-high_risk_ff = high_risk_domains['false_friends'].sum()
-high_risk_coverage = (high_risk_ff / total_ff * 100)
-
-print(f"\nHigh-Risk Domain Coverage:")
-print(f"  - False friends in high-risk domains: {int(high_risk_ff)} / {int(total_ff)}")
-print(f"  - Coverage: {high_risk_coverage:.1f}% of all false friends")
-print(f"  - Impact: Targeting these {len(high_risk_domains)} domains addresses {high_risk_coverage:.1f}% of false friend risk")
-
-# 2. HIGH-FREQUENCY FALSE FRIENDS IMPACT
-print("\n2. HIGH-FREQUENCY FALSE FRIENDS IMPACT")
-print("-" * 80)
-
-# Get false friends only
-false_friends = df[df['relationship_type'] == 'false_friends'].copy()
-true_cognates = df[df['relationship_type'] == 'cognates'].copy()
-
-# Define "high frequency" as frequency score <= 3.0 (lower = more frequent)
-high_freq_threshold = 3.0
-
-ff_high_freq = false_friends[false_friends['complexity_frequency_complexity'] <= high_freq_threshold]
-ff_all = false_friends
-
-print(f"\nFalse Friends Frequency Distribution:")
-print(f"  - Mean frequency score (False Friends): {false_friends['complexity_frequency_complexity'].mean():.2f}")
-print(f"  - Mean frequency score (True Cognates): {true_cognates['complexity_frequency_complexity'].mean():.2f}")
-print(f"  - Threshold for 'high frequency': ≤ {high_freq_threshold}")
-
-high_freq_percentage = (len(ff_high_freq) / len(ff_all) * 100)
-print(f"\nHigh-Frequency False Friends:")
-print(f"  - Count: {len(ff_high_freq)} / {len(ff_all)}")
-print(f"  - Percentage: {high_freq_percentage:.1f}%")
-print(f"  - Impact: Prioritizing high-frequency false friends targets {high_freq_percentage:.1f}% of all false friends")
-
-# Daily usage scenario estimate
-# Calculate cumulative frequency weight
-# Assume frequency distribution follows Zipf's law approximation
+from masterframe import (
+    CULTURAL_DOMAINS,
+    DATA_PATH,
+    RELATIONSHIP_TYPES,
+    SCHEMA,
+    format_memory_savings,
+    iter_masterframe_chunks,
+    load_masterframe,
+)
+from instrumentation import configure as configure_profiling, span
+from language_pairs import PAIRS_DIR, load_pair, pair_option
+
+FALSE_FRIENDS = 'false_friends'
+COGNATES = 'cognates'
+FREQUENCY_COLUMN = 'complexity_frequency_complexity'
+
+# Report defaults
+HIGH_FREQ_THRESHOLD = 3.0  # frequency score <= 3.0 (lower = more frequent)
+FFR_THRESHOLD = 10.0  # % false friends for a domain to count as high-risk
 # Words with freq_score <= 2.0 = very high freq (daily multiple times)
 # Words with freq_score <= 3.0 = high freq (daily)
 # Words with freq_score <= 4.0 = medium freq (weekly)
-
-ff_freq_dist = false_friends.groupby(pd.cut(false_friends['complexity_frequency_complexity'], 
-                                             bins=[0, 2.0, 3.0, 4.0, 6.0],
-                                             labels=['Very High', 'High', 'Medium', 'Low'])).size()
-
-print(f"\nFalse Friends by Frequency Category:")
-for cat, count in ff_freq_dist.items():
-    pct = (count / len(false_friends) * 100)
-    print(f"  - {cat}: {count} ({pct:.1f}%)")
-
-# Estimate daily usage impact (very high + high frequency)
-daily_usage_ff = false_friends[false_friends['complexity_frequency_complexity'] <= 3.0]
-daily_usage_impact = (len(daily_usage_ff) / len(false_friends) * 100)
-print(f"\nDaily Usage Scenario Impact:")
-print(f"  - False friends with freq ≤ 3.0: {len(daily_usage_ff)} / {len(false_friends)}")
-print(f"  - Percentage: {daily_usage_impact:.1f}%")
-print(f"  - Interpretation: Targeting high-frequency false friends impacts ~{daily_usage_impact:.0f}% of daily usage scenarios")
-
-# 3. PARETO PRINCIPLE (80/20 RULE) ANALYSIS
-print("\n3. RESOURCE ALLOCATION EFFICIENCY (PARETO ANALYSIS)")
-print("-" * 80)
-
-# Sort false friends by frequency (ascending = most frequent first)
-ff_sorted = false_friends.sort_values('complexity_frequency_complexity')
-
-# Calculate cumulative distribution
-# For simplicity, treat each word as having equal error potential
-# (In reality, this could be weighted by frequency)
-ff_sorted['cumulative_pct'] = np.arange(1, len(ff_sorted) + 1) / len(ff_sorted) * 100
-
-# Find the percentage of vocabulary that covers 80% of errors
-# Using frequency-weighted approach
-ff_sorted['freq_weight'] = 1 / (ff_sorted['complexity_frequency_complexity'] + 1)  # Lower score = higher weight
-ff_sorted['freq_weight_normalized'] = ff_sorted['freq_weight'] / ff_sorted['freq_weight'].sum()
-ff_sorted['cumulative_weight'] = ff_sorted['freq_weight_normalized'].cumsum() * 100
-
-# Find where we hit 80% coverage
-coverage_80_idx = (ff_sorted['cumulative_weight'] >= 80).idxmax()
-coverage_80_position = ff_sorted.loc[coverage_80_idx, 'cumulative_pct']
-
-print(f"\nPareto Analysis (Frequency-Weighted):")
-print(f"  - Top {coverage_80_position:.1f}% of false friends (by frequency)")
-print(f"  - Account for: ~80% of potential confusion incidents")
-print(f"  - Interpretation: Focus on {coverage_80_position:.1f}% of vocabulary to address 80% of errors")
-
-# Also calculate by domain concentration
-domain_ff_count = false_friends.groupby('cultural_domain').size().sort_values(ascending=False)
-domain_cumulative = domain_ff_count.cumsum() / domain_ff_count.sum() * 100
-
-domains_for_80 = (domain_cumulative <= 80).sum()
-domains_pct = (domains_for_80 / len(domain_ff_count) * 100)
-
-print(f"\nPareto Analysis (Domain-Based):")
-print(f"  - Top {domains_for_80} domains (out of {len(domain_ff_count)}) = {domains_pct:.1f}% of domains")
-print(f"  - Contain: ~80% of all false friends")
-print(f"  - Top domains: {', '.join(domain_ff_count.head(domains_for_80).index.tolist())}")
-
-# 4. COMPREHENSIVE BUSINESS IMPACT SUMMARY
-print("\n" + "=" * 80)
-print("SUMMARY: DATA-DRIVEN BUSINESS IMPACT METRICS")
-print("=" * 80)
-print()
-
-print(f"📊 HIGH-FFR DOMAIN PRIORITIZATION:")
-print(f"   → Targeting {len(high_risk_domains)} high-risk domains covers {high_risk_coverage:.1f}% of false friend risk")
-print()
-
-print(f"📊 HIGH-FREQUENCY FALSE FRIENDS:")
-print(f"   → Prioritizing high-frequency false friends impacts {daily_usage_impact:.0f}% of daily usage scenarios")
-print()
-
-print(f"📊 RESOURCE ALLOCATION EFFICIENCY:")
-print(f"   → Focusing on top {coverage_80_position:.0f}% of vocabulary addresses ~80% of confusion incidents")
-print(f"   → Focusing on top {domains_pct:.0f}% of domains ({domains_for_80} domains) covers ~80% of false friends")
-print()
-
-print("=" * 80)
-print("RECOMMENDED METRICS FOR FINDINGS PAGE:")
-print("=" * 80)
-print()
-print(f"1. Prioritizing high-FFR domains (Family/Kinship, Emotions/Psychology, Food/Cuisine)")
-print(f"   could reduce learner confusion by targeting {high_risk_coverage:.0f}% of all false friends.")
-print()
-print(f"2. Targeting high-frequency false friends first impacts approximately")
-print(f"   {daily_usage_impact:.0f}% of daily usage scenarios where confusion is most likely.")
-print()
-print(f"3. Resource allocation efficiency: focusing on the top {coverage_80_position:.0f}% of false friends")
-print(f"   (ranked by frequency) addresses approximately 80% of confusion incidents.")
-print()
-print(f"   OR: focusing on the top {domains_pct:.0f}% of domains addresses approximately 80% of false friends.")
-print()
-
+FREQUENCY_BINS: Tuple[float, ...] = (0, 2.0, 3.0, 4.0, 6.0)
+FREQUENCY_LABELS: Tuple[str, ...] = ('Very High', 'High', 'Medium', 'Low')
+PARETO_TARGET = 80.0  # % of frequency-weighted confusion incidents
+
+# Streaming mode
+CHUNK_SIZE = 250_000  # rows
+PARETO_HISTOGRAM_BINS = 7000  # 0.001-wide bins over the 0-7 frequency score range
+
+METRIC_COLUMNS = ['relationship_type', 'cultural_domain', FREQUENCY_COLUMN]
+
+
+@dataclass
+class BusinessImpact:
+    """Business impact metrics computed from one pass over the masterframe."""
+
+    # Per-domain counts, indexed by domain, sorted by FFR descending:
+    # false_friends, total, ffr (%)
+    domain_stats: pd.DataFrame
+    # domain x relationship_type pair counts
+    relationship_counts: pd.DataFrame
+    # Mean frequency score per relationship type
+    frequency_means: pd.Series
+    ffr_threshold: float
+    high_risk_domains: pd.DataFrame
+    high_risk_coverage: float
+    high_freq_threshold: float
+    high_freq_count: int
+    high_freq_pct: float
+    # False friend counts per frequency category
+    frequency_buckets: pd.Series
+    pareto_target: float
+    # % of false friends (most frequent first) covering ``pareto_target`` of the weight
+    pareto_position: float
+    # False friends per domain, descending
+    domain_ff_count: pd.Series
+    domains_for_pareto: int
+    domains_pct: float
+    # Max error of ``pareto_position`` in percentage points (0 when exact)
+    pareto_error_bound: float = 0.0
+
+    @property
+    def total_false_friends(self) -> int:
+        return int(self.domain_stats['false_friends'].sum())
+
+
+def category_codes(series: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+    """Return integer codes and their labels, reusing categorical codes when present."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy(), series.cat.categories
+    codes, uniques = pd.factorize(series, sort=True)
+    return codes, pd.Index(uniques)
+
+
+def pair_counts(row_codes: np.ndarray, n_rows: int, col_codes: np.ndarray, n_cols: int) -> np.ndarray:
+    """Count (row, col) code pairs with a single ``bincount``; negative codes are dropped."""
+    valid = (row_codes >= 0) & (col_codes >= 0)
+    flat = row_codes[valid].astype(np.int64) * n_cols + col_codes[valid]
+    return np.bincount(flat, minlength=n_rows * n_cols).reshape(n_rows, n_cols)
+
+
+def frequency_weight_coverage(ff_freq_sorted: np.ndarray) -> np.ndarray:
+    """Cumulative % of frequency weight ``1 / (score + 1)`` for scores sorted ascending."""
+    weights = 1.0 / (ff_freq_sorted + 1.0)  # Lower score = higher weight
+    return np.cumsum(weights) / weights.sum() * 100
+
+
+def pareto_positions(cumulative_weight: np.ndarray, targets) -> np.ndarray:
+    """% of the ranked vocabulary needed before ``cumulative_weight`` reaches each target."""
+    n = len(cumulative_weight)
+    crossing = np.minimum(np.searchsorted(cumulative_weight, targets, side='left'), n - 1)
+    return (crossing + 1) / n * 100
+
+
+def _partial_counts(
+    domain_codes: np.ndarray,
+    n_domains: int,
+    rel_codes: np.ndarray,
+    n_rel: int,
+    ff_code: int,
+    freq: np.ndarray,
+    high_freq_threshold: float,
+    frequency_bins: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """Additive counts behind the report; partials from different rows can be summed."""
+    valid_rel = rel_codes >= 0
+    freq_ok = valid_rel & ~np.isnan(freq)
+    ff_freq = freq[rel_codes == ff_code]
+
+    # Right-closed bins like pd.cut: (0, 2], (2, 3], ...
+    bucket = np.searchsorted(frequency_bins, ff_freq, side='left') - 1
+    in_range = (ff_freq > frequency_bins[0]) & (ff_freq <= frequency_bins[-1])
+
+    return {
+        'counts': pair_counts(domain_codes, n_domains, rel_codes, n_rel),
+        'freq_sums': np.bincount(rel_codes[freq_ok], weights=freq[freq_ok], minlength=n_rel),
+        'freq_n': np.bincount(rel_codes[freq_ok], minlength=n_rel),
+        'high_freq_count': np.array((ff_freq <= high_freq_threshold).sum()),
+        'bucket_counts': np.bincount(bucket[in_range], minlength=len(frequency_bins) - 1),
+    }
+
+
+def _build_result(
+    domains: pd.Index,
+    rel_types: pd.Index,
+    partials: Dict[str, np.ndarray],
+    frequency_labels: Sequence[str],
+    ffr_threshold: float,
+    high_freq_threshold: float,
+    pareto_target: float,
+    pareto_position: float,
+    pareto_error_bound: float = 0.0,
+) -> BusinessImpact:
+    """Turn summed partial counts into a ``BusinessImpact``."""
+    relationship_counts = pd.DataFrame(partials['counts'], index=domains, columns=rel_types)
+    relationship_counts = relationship_counts[relationship_counts.sum(axis=1) > 0]
+
+    # 1. Domain FFR
+    ff_col = relationship_counts[FALSE_FRIENDS] if FALSE_FRIENDS in relationship_counts else 0
+    domain_stats = pd.DataFrame({
+        'false_friends': ff_col,
+        'total': relationship_counts.sum(axis=1),
+    })
+    domain_stats['ffr'] = domain_stats['false_friends'] / domain_stats['total'] * 100
+    domain_stats = domain_stats.sort_values('ffr', ascending=False)
+
+    high_risk_domains = domain_stats[domain_stats['ffr'] >= ffr_threshold]
+    total_ff = domain_stats['false_friends'].sum()
+    high_risk_coverage = high_risk_domains['false_friends'].sum() / total_ff * 100 if total_ff else 0.0
+
+    # 2. Frequency profile
+    with np.errstate(invalid='ignore', divide='ignore'):
+        frequency_means = pd.Series(partials['freq_sums'] / partials['freq_n'], index=rel_types)
+    high_freq_count = int(partials['high_freq_count'])
+    high_freq_pct = high_freq_count / total_ff * 100 if total_ff else 0.0
+    frequency_buckets = pd.Series(partials['bucket_counts'], index=list(frequency_labels))
+
+    # 3. Pareto (domain-based)
+    domain_ff_count = domain_stats.loc[domain_stats['false_friends'] > 0, 'false_friends']
+    domain_ff_count = domain_ff_count.sort_index().sort_values(ascending=False)
+    domain_cumulative = domain_ff_count.cumsum() / domain_ff_count.sum() * 100
+    domains_for_pareto = int((domain_cumulative <= pareto_target).sum())
+    domains_pct = domains_for_pareto / len(domain_ff_count) * 100 if len(domain_ff_count) else 0.0
+
+    return BusinessImpact(
+        domain_stats=domain_stats,
+        relationship_counts=relationship_counts,
+        frequency_means=frequency_means,
+        ffr_threshold=ffr_threshold,
+        high_risk_domains=high_risk_domains,
+        high_risk_coverage=high_risk_coverage,
+        high_freq_threshold=high_freq_threshold,
+        high_freq_count=high_freq_count,
+        high_freq_pct=high_freq_pct,
+        frequency_buckets=frequency_buckets,
+        pareto_target=pareto_target,
+        pareto_position=pareto_position,
+        domain_ff_count=domain_ff_count,
+        domains_for_pareto=domains_for_pareto,
+        domains_pct=domains_pct,
+        pareto_error_bound=pareto_error_bound,
+    )
+
+
+def compute_business_impact(
+    df: pd.DataFrame,
+    high_freq_threshold: float = HIGH_FREQ_THRESHOLD,
+    ffr_threshold: float = FFR_THRESHOLD,
+    frequency_bins: Sequence[float] = FREQUENCY_BINS,
+    frequency_labels: Sequence[str] = FREQUENCY_LABELS,
+    pareto_target: float = PARETO_TARGET,
+) -> BusinessImpact:
+    """Compute the business impact metrics for ``df``.
+
+    All per-domain and per-relationship counts come from one ``bincount``
+    over the categorical codes; false friends are selected once.
+    """
+    domain_codes, domains = category_codes(df['cultural_domain'])
+    rel_codes, rel_types = category_codes(df['relationship_type'])
+    freq = df[FREQUENCY_COLUMN].to_numpy(dtype=np.float64, na_value=np.nan)
+    ff_code = rel_types.get_loc(FALSE_FRIENDS) if FALSE_FRIENDS in rel_types else -2
+
+    partials = _partial_counts(
+        domain_codes, len(domains), rel_codes, len(rel_types), ff_code, freq,
+        high_freq_threshold, np.asarray(frequency_bins, dtype=np.float64),
+    )
+
+    # Pareto (frequency-weighted): most frequent (lowest score) first
+    ff_freq = freq[rel_codes == ff_code]
+    ff_sorted = np.sort(ff_freq[~np.isnan(ff_freq)])
+    if len(ff_sorted):
+        pareto_position = float(pareto_positions(frequency_weight_coverage(ff_sorted), pareto_target))
+    else:
+        pareto_position = 0.0
+
+    return _build_result(
+        domains, rel_types, partials, frequency_labels,
+        ffr_threshold, high_freq_threshold, pareto_target, pareto_position,
+    )
+
+
+class StreamingImpact:
+    """Mergeable partial aggregates for computing business impact metrics chunk by chunk.
+
+    Domains and relationship types use fixed categories (``SCHEMA``'s, or a
+    language pair's ``relationship_types``) so that partials from any chunk or
+    worker line up. The frequency-weighted Pareto
+    step uses a fixed-width histogram of false-friend frequency scores over
+    the schema range instead of a full sort. Each bin keeps its count, weight
+    sum and min/max score. The reported position is off by at most the share
+    of false friends in the bin where the target is crossed
+    (``pareto_error_bound``, in percentage points). It is exact when that bin
+    holds a single distinct score; the default 0.001 bin width is finer than
+    the 0.01 resolution of the masterframe scores. Memory is
+    O(domains x relationship types + histogram bins), whatever the input size.
+    """
+
+    def __init__(
+        self,
+        high_freq_threshold: float = HIGH_FREQ_THRESHOLD,
+        frequency_bins: Sequence[float] = FREQUENCY_BINS,
+        frequency_labels: Sequence[str] = FREQUENCY_LABELS,
+        histogram_bins: int = PARETO_HISTOGRAM_BINS,
+        relationship_types: Sequence[str] = RELATIONSHIP_TYPES,
+    ) -> None:
+        self.domains = pd.Index(CULTURAL_DOMAINS)
+        self.rel_types = pd.Index(relationship_types)
+        self.ff_code = self.rel_types.get_loc(FALSE_FRIENDS)
+        self.high_freq_threshold = high_freq_threshold
+        self.frequency_bins = np.asarray(frequency_bins, dtype=np.float64)
+        self.frequency_labels = list(frequency_labels)
+        spec = SCHEMA[FREQUENCY_COLUMN]
+        self.hist_range = (float(spec['min']), float(spec['max']))
+        self.histogram_bins = histogram_bins
+        self.rows = 0
+
+        self.partials = _partial_counts(
+            np.empty(0, dtype=np.int64), len(self.domains),
+            np.empty(0, dtype=np.int64), len(self.rel_types),
+            self.ff_code, np.empty(0), high_freq_threshold, self.frequency_bins,
+        )
+        self.hist_counts = np.zeros(histogram_bins, dtype=np.int64)
+        self.hist_weights = np.zeros(histogram_bins, dtype=np.float64)
+        self.hist_min = np.full(histogram_bins, np.inf)
+        self.hist_max = np.full(histogram_bins, -np.inf)
+
+    def _codes(self, series: pd.Series, categories: pd.Index) -> np.ndarray:
+        if isinstance(series.dtype, pd.CategoricalDtype) and series.cat.categories.equals(categories):
+            return series.cat.codes.to_numpy()
+        return pd.Categorical(series, categories=categories).codes
+
+    def update(self, chunk: pd.DataFrame) -> 'StreamingImpact':
+        """Fold one chunk of masterframe rows into the aggregates."""
+        domain_codes = self._codes(chunk['cultural_domain'], self.domains)
+        rel_codes = self._codes(chunk['relationship_type'], self.rel_types)
+        freq = chunk[FREQUENCY_COLUMN].to_numpy(dtype=np.float64, na_value=np.nan)
+
+        partials = _partial_counts(
+            domain_codes, len(self.domains), rel_codes, len(self.rel_types),
+            self.ff_code, freq, self.high_freq_threshold, self.frequency_bins,
+        )
+        for key, value in partials.items():
+            self.partials[key] = self.partials[key] + value
+
+        ff_freq = freq[rel_codes == self.ff_code]
+        ff_freq = ff_freq[~np.isnan(ff_freq)]
+        lo, hi = self.hist_range
+        width = (hi - lo) / self.histogram_bins
+        idx = np.clip(((ff_freq - lo) / width).astype(np.int64), 0, self.histogram_bins - 1)
+        self.hist_counts += np.bincount(idx, minlength=self.histogram_bins)
+        self.hist_weights += np.bincount(idx, weights=1.0 / (ff_freq + 1.0), minlength=self.histogram_bins)
+        np.minimum.at(self.hist_min, idx, ff_freq)
+        np.maximum.at(self.hist_max, idx, ff_freq)
+        self.rows += len(chunk)
+        return self
+
+    def merge(self, other: 'StreamingImpact') -> 'StreamingImpact':
+        """Fold another accumulator with the same parameters into this one."""
+        if other.histogram_bins != self.histogram_bins or other.high_freq_threshold != self.high_freq_threshold:
+            raise ValueError("Cannot merge StreamingImpact aggregates built with different parameters")
+        for key, value in other.partials.items():
+            self.partials[key] = self.partials[key] + value
+        self.hist_counts += other.hist_counts
+        self.hist_weights += other.hist_weights
+        np.minimum(self.hist_min, other.hist_min, out=self.hist_min)
+        np.maximum(self.hist_max, other.hist_max, out=self.hist_max)
+        self.rows += other.rows
+        return self
+
+    def pareto_position(self, pareto_target: float) -> Tuple[float, float]:
+        """Return the Pareto position and its error bound from the histogram."""
+        n_ff = int(self.hist_counts.sum())
+        if n_ff == 0:
+            return 0.0, 0.0
+        cum_weight = np.cumsum(self.hist_weights)
+        cum_count = np.cumsum(self.hist_counts)
+        needed = pareto_target / 100 * cum_weight[-1]
+        occupied = np.flatnonzero(self.hist_counts)
+        crossing = np.searchsorted(cum_weight[occupied], needed, side='left')
+        j = int(occupied[min(crossing, len(occupied) - 1)])
+        before_weight = cum_weight[j - 1] if j else 0.0
+        before_count = cum_count[j - 1] if j else 0
+        mean_weight = self.hist_weights[j] / self.hist_counts[j]
+        within = int(np.clip(np.ceil((needed - before_weight) / mean_weight), 1, self.hist_counts[j]))
+        exact = self.hist_min[j] == self.hist_max[j]
+        error = 0.0 if exact else self.hist_counts[j] / n_ff * 100
+        return (before_count + within) / n_ff * 100, error
+
+    def result(self, ffr_threshold: float = FFR_THRESHOLD, pareto_target: float = PARETO_TARGET) -> BusinessImpact:
+        """Finalize the aggregates into a ``BusinessImpact``."""
+        pareto_position, error = self.pareto_position(pareto_target)
+        return _build_result(
+            self.domains, self.rel_types, self.partials, self.frequency_labels,
+            ffr_threshold, self.high_freq_threshold, pareto_target, pareto_position, error,
+        )
+
+
+def stream_business_impact(
+    chunks: Iterable[pd.DataFrame],
+    high_freq_threshold: float = HIGH_FREQ_THRESHOLD,
+    ffr_threshold: float = FFR_THRESHOLD,
+    frequency_bins: Sequence[float] = FREQUENCY_BINS,
+    frequency_labels: Sequence[str] = FREQUENCY_LABELS,
+    pareto_target: float = PARETO_TARGET,
+    histogram_bins: int = PARETO_HISTOGRAM_BINS,
+    relationship_types: Sequence[str] = RELATIONSHIP_TYPES,
+) -> BusinessImpact:
+    """Compute the business impact metrics from an iterable of row chunks."""
+    accumulator = StreamingImpact(
+        high_freq_threshold, frequency_bins, frequency_labels, histogram_bins, relationship_types
+    )
+    for chunk in chunks:
+        accumulator.update(chunk)
+    return accumulator.result(ffr_threshold, pareto_target)
+
+
+def _false_friend_frequencies(df: pd.DataFrame) -> np.ndarray:
+    """Sorted (ascending) frequency scores of the false friends in ``df``."""
+    is_ff = (df['relationship_type'] == FALSE_FRIENDS).to_numpy(dtype=bool, na_value=False)
+    freq = df[FREQUENCY_COLUMN].to_numpy(dtype=np.float64, na_value=np.nan)[is_ff]
+    return np.sort(freq[~np.isnan(freq)])
+
+
+def sweep_business_impact(
+    df: pd.DataFrame,
+    high_freq_thresholds: Sequence[float] = (HIGH_FREQ_THRESHOLD,),
+    ffr_thresholds: Sequence[float] = (FFR_THRESHOLD,),
+    pareto_targets: Sequence[float] = (PARETO_TARGET,),
+) -> pd.DataFrame:
+    """Evaluate the headline metrics for every combination of thresholds.
+
+    Each threshold family is answered at once with ``searchsorted`` on sorted
+    prefix sums (false-friend frequency scores, cumulative frequency weight,
+    domain FFR and domain false-friend counts), so the cost is dominated by a
+    single sort rather than by the number of combinations. Returns one row per
+    (high_freq_threshold, ffr_threshold, pareto_target) combination.
+    """
+    base = compute_business_impact(df)
+    hf = np.asarray(high_freq_thresholds, dtype=np.float64)
+    ffr_t = np.asarray(ffr_thresholds, dtype=np.float64)
+    targets = np.asarray(pareto_targets, dtype=np.float64)
+
+    # High-frequency false friends: count of scores <= threshold
+    ff_sorted = _false_friend_frequencies(df)
+    n_ff = len(ff_sorted)
+    hf_count = np.searchsorted(ff_sorted, hf, side='right')
+    hf_pct = hf_count / n_ff * 100 if n_ff else np.zeros(len(hf))
+
+    # High-risk domains: domains with FFR >= threshold and the false friends they hold
+    ffr_asc = base.domain_stats.sort_values('ffr')
+    ffr_values = ffr_asc['ffr'].to_numpy(dtype=np.float64)
+    ff_suffix = np.concatenate([np.cumsum(ffr_asc['false_friends'].to_numpy()[::-1])[::-1], [0]])
+    below = np.searchsorted(ffr_values, ffr_t, side='left')
+    risk_domains = len(ffr_values) - below
+    total_ff = ff_suffix[0] if len(ff_suffix) else 0
+    risk_coverage = ff_suffix[below] / total_ff * 100 if total_ff else np.zeros(len(ffr_t))
+
+    # Frequency-weighted Pareto: first position whose cumulative weight reaches the target
+    if n_ff:
+        pareto_position = pareto_positions(frequency_weight_coverage(ff_sorted), targets)
+    else:
+        pareto_position = np.zeros(len(targets))
+
+    # Domain-based Pareto: domains whose cumulative share stays within the target
+    domain_cumulative = base.domain_ff_count.cumsum().to_numpy(dtype=np.float64)
+    n_domains = len(domain_cumulative)
+    if n_domains:
+        domain_cumulative = domain_cumulative / domain_cumulative[-1] * 100
+    domains_for_pareto = np.searchsorted(domain_cumulative, targets, side='right')
+    domains_pct = domains_for_pareto / n_domains * 100 if n_domains else np.zeros(len(targets))
+
+    hf_idx, ffr_idx, target_idx = (
+        index.ravel() for index in np.meshgrid(
+            np.arange(len(hf)), np.arange(len(ffr_t)), np.arange(len(targets)), indexing='ij'
+        )
+    )
+    return pd.DataFrame({
+        'high_freq_threshold': hf[hf_idx],
+        'ffr_threshold': ffr_t[ffr_idx],
+        'pareto_target': targets[target_idx],
+        'high_freq_count': hf_count[hf_idx],
+        'high_freq_pct': hf_pct[hf_idx],
+        'high_risk_domains': risk_domains[ffr_idx],
+        'high_risk_coverage': risk_coverage[ffr_idx],
+        'pareto_position': pareto_position[target_idx],
+        'domains_for_pareto': domains_for_pareto[target_idx],
+        'domains_pct': domains_pct[target_idx],
+    })
+
+
+def sweep_frequency_buckets(df: pd.DataFrame, bin_sets: Sequence[Sequence[float]]) -> pd.DataFrame:
+    """Count false friends per right-closed bin for several sets of bin edges.
+
+    Bin counts are differences of ``searchsorted`` positions on the sorted
+    frequency scores. Returns one row per (bin_set, bin).
+    """
+    ff_sorted = _false_friend_frequencies(df)
+    n_ff = len(ff_sorted)
+    frames = []
+    for set_id, edges in enumerate(bin_sets):
+        edges = np.asarray(edges, dtype=np.float64)
+        at_or_below = np.searchsorted(ff_sorted, edges, side='right')
+        count = np.diff(at_or_below)
+        frames.append(pd.DataFrame({
+            'bin_set': set_id,
+            'lower': edges[:-1],
+            'upper': edges[1:],
+            'count': count,
+            'pct': count / n_ff * 100 if n_ff else 0.0,
+        }))
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(
+        columns=['bin_set', 'lower', 'upper', 'count', 'pct']
+    )
+
+
+def print_header(dataset_line: str) -> None:
+    print("=" * 80)
+    print("BUSINESS IMPACT ANALYSIS: Language Learning Application Metrics")
+    print("=" * 80)
+    print(f"Dataset: {dataset_line}")
+    print()
+
+
+def print_report(result: BusinessImpact) -> None:
+    """Print the business impact report for a computed ``BusinessImpact``."""
+    n_ff = result.total_false_friends
+    threshold = result.high_freq_threshold
+    target = result.pareto_target
+
+    # 1. HIGH-FFR DOMAIN IMPACT ANALYSIS
+    print("1. HIGH-FFR DOMAIN PRIORITIZATION IMPACT")
+    print("-" * 80)
+
+    print(f"\nHigh-Risk Domains (FFR >= {result.ffr_threshold:g}%):")
+    for domain, row in result.high_risk_domains.iterrows():
+        print(f"  - {domain}: {row['ffr']:.2f}% FFR ({int(row['false_friends'])} false friends / {int(row['total'])} pairs)")
+
+    high_risk_ff = result.high_risk_domains['false_friends'].sum()
+    print(f"\nHigh-Risk Domain Coverage:")
+    print(f"  - False friends in high-risk domains: {int(high_risk_ff)} / {n_ff}")
+    print(f"  - Coverage: {result.high_risk_coverage:.1f}% of all false friends")
+    print(f"  - Impact: Targeting these {len(result.high_risk_domains)} domains addresses {result.high_risk_coverage:.1f}% of false friend risk")
+
+    # 2. HIGH-FREQUENCY FALSE FRIENDS IMPACT
+    print("\n2. HIGH-FREQUENCY FALSE FRIENDS IMPACT")
+    print("-" * 80)
+
+    print(f"\nFalse Friends Frequency Distribution:")
+    print(f"  - Mean frequency score (False Friends): {result.frequency_means[FALSE_FRIENDS]:.2f}")
+    print(f"  - Mean frequency score (True Cognates): {result.frequency_means[COGNATES]:.2f}")
+    print(f"  - Threshold for 'high frequency': ≤ {threshold}")
+
+    print(f"\nHigh-Frequency False Friends:")
+    print(f"  - Count: {result.high_freq_count} / {n_ff}")
+    print(f"  - Percentage: {result.high_freq_pct:.1f}%")
+    print(f"  - Impact: Prioritizing high-frequency false friends targets {result.high_freq_pct:.1f}% of all false friends")
+
+    print(f"\nFalse Friends by Frequency Category:")
+    for cat, count in result.frequency_buckets.items():
+        pct = (count / n_ff * 100)
+        print(f"  - {cat}: {count} ({pct:.1f}%)")
+
+    # Daily usage scenario: very high + high frequency
+    print(f"\nDaily Usage Scenario Impact:")
+    print(f"  - False friends with freq ≤ {threshold}: {result.high_freq_count} / {n_ff}")
+    print(f"  - Percentage: {result.high_freq_pct:.1f}%")
+    print(f"  - Interpretation: Targeting high-frequency false friends impacts ~{result.high_freq_pct:.0f}% of daily usage scenarios")
+
+    # 3. PARETO PRINCIPLE (80/20 RULE) ANALYSIS
+    print("\n3. RESOURCE ALLOCATION EFFICIENCY (PARETO ANALYSIS)")
+    print("-" * 80)
+
+    print(f"\nPareto Analysis (Frequency-Weighted):")
+    print(f"  - Top {result.pareto_position:.1f}% of false friends (by frequency)")
+    print(f"  - Account for: ~{target:g}% of potential confusion incidents")
+    print(f"  - Interpretation: Focus on {result.pareto_position:.1f}% of vocabulary to address {target:g}% of errors")
+
+    top_domains = result.domain_ff_count.head(result.domains_for_pareto).index.tolist()
+    print(f"\nPareto Analysis (Domain-Based):")
+    print(f"  - Top {result.domains_for_pareto} domains (out of {len(result.domain_ff_count)}) = {result.domains_pct:.1f}% of domains")
+    print(f"  - Contain: ~{target:g}% of all false friends")
+    print(f"  - Top domains: {', '.join(top_domains)}")
+
+    # 4. COMPREHENSIVE BUSINESS IMPACT SUMMARY
+    print("\n" + "=" * 80)
+    print("SUMMARY: DATA-DRIVEN BUSINESS IMPACT METRICS")
+    print("=" * 80)
+    print()
+
+    print(f"📊 HIGH-FFR DOMAIN PRIORITIZATION:")
+    print(f"   → Targeting {len(result.high_risk_domains)} high-risk domains covers {result.high_risk_coverage:.1f}% of false friend risk")
+    print()
+
+    print(f"📊 HIGH-FREQUENCY FALSE FRIENDS:")
+    print(f"   → Prioritizing high-frequency false friends impacts {result.high_freq_pct:.0f}% of daily usage scenarios")
+    print()
+
+    print(f"📊 RESOURCE ALLOCATION EFFICIENCY:")
+    print(f"   → Focusing on top {result.pareto_position:.0f}% of vocabulary addresses ~{target:g}% of confusion incidents")
+    print(f"   → Focusing on top {result.domains_pct:.0f}% of domains ({result.domains_for_pareto} domains) covers ~{target:g}% of false friends")
+    print()
+
+    print("=" * 80)
+    print("RECOMMENDED METRICS FOR FINDINGS PAGE:")
+    print("=" * 80)
+    print()
+    print(f"1. Prioritizing high-FFR domains (Family/Kinship, Emotions/Psychology, Food/Cuisine)")
+    print(f"   could reduce learner confusion by targeting {result.high_risk_coverage:.0f}% of all false friends.")
+    print()
+    print(f"2. Targeting high-frequency false friends first impacts approximately")
+    print(f"   {result.high_freq_pct:.0f}% of daily usage scenarios where confusion is most likely.")
+    print()
+    print(f"3. Resource allocation efficiency: focusing on the top {result.pareto_position:.0f}% of false friends")
+    print(f"   (ranked by frequency) addresses approximately {target:g}% of confusion incidents.")
+    print()
+    print(f"   OR: focusing on the top {result.domains_pct:.0f}% of domains addresses approximately {target:g}% of false friends.")
+    print()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sweep', action='store_true',
+                        help='Write a threshold sweep table instead of printing the report')
+    parser.add_argument('--high-freq-thresholds', type=float, nargs='+', default=[HIGH_FREQ_THRESHOLD])
+    parser.add_argument('--ffr-thresholds', type=float, nargs='+', default=[FFR_THRESHOLD])
+    parser.add_argument('--pareto-targets', type=float, nargs='+', default=[PARETO_TARGET])
+    parser.add_argument('--output', type=Path, help='CSV path for the sweep table (default: stdout)')
+    parser.add_argument('--stream', action='store_true',
+                        help='Aggregate the dataset in fixed-size chunks with bounded memory')
+    parser.add_argument('--chunksize', type=int, default=CHUNK_SIZE)
+    parser.add_argument('--source', choices=['auto', 'csv', 'cache'], default='auto',
+                        help='Where --stream reads chunks from')
+    parser.add_argument('--pair', help='Language pair partition to analyse, e.g. en-pt (default: the masterframe)')
+    parser.add_argument('--pairs-dir', type=Path, default=PAIRS_DIR)
+    parser.add_argument('--profile', type=Path, metavar='PREFIX',
+                        help='Write per-stage timings to PREFIX.json and PREFIX.trace.json')
+    return parser
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    return build_parser().parse_args(argv)
+
+
+def run_sweep(df: pd.DataFrame, args: argparse.Namespace) -> None:
+    with span('sweep', rows=len(df)):
+        table = sweep_business_impact(
+            df,
+            high_freq_thresholds=args.high_freq_thresholds,
+            ffr_thresholds=args.ffr_thresholds,
+            pareto_targets=args.pareto_targets,
+        )
+    with span('write_sweep', rows=len(table)):
+        if args.output:
+            table.to_csv(args.output, index=False)
+            print(f"Sweep of {len(table)} threshold combinations saved to {args.output}")
+        else:
+            print(table.to_string(index=False))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    pair, csv_path, schema, _ = (
+        pair_option(parser, args.pair, args.pairs_dir) if args.pair else (None, DATA_PATH, SCHEMA, True)
+    )
+    configure_profiling(args.profile, 'calculate_business_impact')
+    if args.stream:
+        with span('stream') as stage:
+            chunks = iter_masterframe_chunks(METRIC_COLUMNS, args.chunksize, csv_path, args.source, schema)
+            relationship_types = schema['relationship_type']['categories']
+            result = stream_business_impact(chunks, relationship_types=relationship_types)
+            stage.set_rows(int(result.relationship_counts.to_numpy().sum()))
+        with span('report'):
+            print_header(f"{pair.code + ', ' if pair else ''}streamed in chunks of {args.chunksize} rows "
+                         f"(Pareto position ±{result.pareto_error_bound:.1f} pts)")
+            print_report(result)
+        return
+
+    with span('load') as stage:
+        df = load_pair(pair.code, METRIC_COLUMNS, args.pairs_dir) if pair else load_masterframe(METRIC_COLUMNS)
+        stage.set_rows(len(df))
+    if args.sweep:
+        run_sweep(df, args)
+        return
+
+    dataset_line = format_memory_savings(df, csv_path, schema)
+    print_header(f"{pair.code}, {dataset_line}" if pair else dataset_line)
+    with span('compute', rows=len(df)):
+        result = compute_business_impact(df)
+    with span('report'):
+        print_report(result)
+
+
+if __name__ == '__main__':
+    main()
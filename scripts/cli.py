@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""Single entry point for the analysis scripts: ``cli.py <command> [options]``.
+
+Only the standard library is imported up front, so ``cli.py --help``, an
+unknown command and the ``--warm`` client start quickly. A command's module
+(and with it pandas, plotly or reportlab) is imported only when that command
+is dispatched. Its options are defined by the module's own parser, so
+``cli.py metrics --help`` and argument errors still pay that import cold;
+through ``--warm`` they do not.
+
+``cli.py serve`` keeps a warm process with the modules imported and the
+masterframe held in memory (``masterframe.hold_in_memory``). Other
+invocations pass ``--warm`` (or set ``MASTERFRAME_SERVER=1``) to run their
+command there over a local socket, falling back to running in-process when no
+server is up. ``cli.py startup`` reports cold vs warm times.
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
+import socket
+import socketserver
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+ROOT = SCRIPTS_DIR.parent
+SOCKET_PATH = ROOT / ".cache" / "cli.sock"
+ENV_VAR = "MASTERFRAME_SERVER"
+STARTUP_TIMEOUT = 60.0  # seconds to wait for a server started by ``startup``
+STARTUP_RUNS = 3
+
+# command -> (module with main(argv), help)
+COMMANDS: Dict[str, Tuple[str, str]] = {
+    "metrics": ("calculate_business_impact", "Business impact report and threshold sweeps"),
+    "plot": ("regenerate_interactive_plot", "Interactive attestation plot (HTML)"),
+    "summary": ("generate_executive_summary", "Executive summary PDF(s)"),
+    "build": ("build", "Incremental build of all generated artifacts"),
+    "explorer": ("build_explorer_data", "Binary artifacts for the dataset explorer"),
+    "stats": ("statistical_tests", "ANOVA and t-test reports"),
+    "resample": ("resampling", "Bootstrap and permutation intervals"),
+    "correlations": ("correlations", "Correlation matrices"),
+    "periods": ("temporal_index", "Attestation counts per period"),
+    "complexity": ("complexity", "Recompute and re-weight complexity components"),
+    "similarity": ("similarity", "Jaccard/Levenshtein similarity for word pairs"),
+    "risk": ("risk_scoring", "False-friend risk for vocabulary lists"),
+    "words": ("word_index", "Word lookup, autocomplete and fuzzy search"),
+    "similar": ("similar_words", "Top-k similar word pairs by feature vector"),
+    "pairs": ("language_pairs", "Language-pair partitions and parallel per-pair analysis"),
+    "benchmark": ("benchmark", "Benchmarks on synthetic scaled masterframes"),
+    "profiles": ("instrumentation", "Compare --profile outputs"),
+}
+# Not worth preloading in the server: long-running or process-pool driven
+PRELOAD_SKIP = {"words", "benchmark", "resample", "build", "pairs"}
+
+
+def run_command(command: str, argv: Sequence[str]) -> int:
+    """Import ``command``'s module and call its ``main``; return the exit status.
+
+    The import comes first even for ``--help`` or bad options: the module's
+    parser is what knows its options.
+    """
+    module_name, _ = COMMANDS[command]
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    saved_argv = sys.argv
+    sys.argv = [f"cli.py {command}", *argv]  # argparse takes prog from argv[0]
+    try:
+        importlib.import_module(module_name).main(list(argv))
+    except SystemExit as exit:
+        return exit.code if isinstance(exit.code, int) else (0 if exit.code is None else 1)
+    finally:
+        sys.argv = saved_argv
+        # A --profile run is written now, not at exit: the warm server serves many commands.
+        instrumentation = sys.modules.get("instrumentation")
+        if instrumentation is not None:
+            instrumentation.finish()
+    return 0
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """One JSON request per connection: ``{"command", "argv", "cwd"}``."""
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line.strip():  # readiness probe
+            return
+        request = json.loads(line)
+        stdout, stderr = io.StringIO(), io.StringIO()
+        start = time.perf_counter()
+        cwd = os.getcwd()
+        try:
+            os.chdir(request.get("cwd", cwd))
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                status = run_command(request["command"], request.get("argv", []))
+        except Exception as error:  # report, keep serving
+            stderr.write(f"{type(error).__name__}: {error}\n")
+            status = 1
+        finally:
+            os.chdir(cwd)
+        response = {
+            "status": status,
+            "stdout": stdout.getvalue(),
+            "stderr": stderr.getvalue(),
+            "seconds": time.perf_counter() - start,
+        }
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+def serve(socket_path: Path = SOCKET_PATH, preload: bool = True) -> None:
+    """Serve commands sequentially from this process until interrupted."""
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    start = time.perf_counter()
+    import masterframe
+
+    masterframe.hold_in_memory()
+    if preload:
+        masterframe.load_masterframe()
+        for command, (module_name, _) in COMMANDS.items():
+            if command not in PRELOAD_SKIP:
+                importlib.import_module(module_name)
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    with contextlib.suppress(FileNotFoundError):
+        socket_path.unlink()
+    with socketserver.UnixStreamServer(str(socket_path), _Handler) as server:
+        print(f"Warm server ready on {socket_path} in {time.perf_counter() - start:.2f}s", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                socket_path.unlink()
+
+
+def request(command: str, argv: Sequence[str], socket_path: Path = SOCKET_PATH) -> Optional[Dict[str, object]]:
+    """Run ``command`` on the warm server; ``None`` if no server is listening."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(str(socket_path))
+            payload = {"command": command, "argv": list(argv), "cwd": os.getcwd()}
+            client.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+            with client.makefile("rb") as reader:
+                return json.loads(reader.readline())
+    except (FileNotFoundError, ConnectionRefusedError):
+        return None
+
+
+def server_running(socket_path: Path = SOCKET_PATH) -> bool:
+    """Whether a warm server accepts connections on ``socket_path``."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(str(socket_path))
+        return True
+    except OSError:
+        return False
+
+
+def _wait_for_server(socket_path: Path, timeout: float = STARTUP_TIMEOUT) -> None:
+    deadline = time.monotonic() + timeout
+    while not server_running(socket_path):
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"No warm server on {socket_path} after {timeout:.0f}s")
+        time.sleep(0.05)
+
+
+def startup_report(command: str, argv: Sequence[str], runs: int = STARTUP_RUNS) -> List[Dict[str, object]]:
+    """Wall time of ``command`` as a fresh process and through a warm server.
+
+    Uses a running server if there is one, otherwise starts one for the
+    measurement and stops it afterwards.
+    """
+    cold_command = [sys.executable, str(Path(__file__).resolve()), command, *argv]
+    rows: List[Dict[str, object]] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cold_command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        rows.append({"mode": "cold", "seconds": time.perf_counter() - start})
+
+    server = None
+    if not server_running():
+        server = subprocess.Popen([sys.executable, str(Path(__file__).resolve()), "serve"], stdout=subprocess.DEVNULL)
+        _wait_for_server(SOCKET_PATH)
+    try:
+        for _ in range(runs):
+            start = time.perf_counter()
+            response = request(command, argv)
+            if response is None:
+                raise ConnectionError(f"Warm server on {SOCKET_PATH} went away")
+            rows.append({"mode": "warm", "seconds": time.perf_counter() - start, "status": response["status"]})
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+    return rows
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description=__doc__.strip().splitlines()[0],
+        epilog="Run 'cli.py <command> --help' for a command's options.",
+    )
+    parser.add_argument("--warm", action="store_true", help=f"Run on the warm server if one is up (or set {ENV_VAR}=1)")
+    commands = parser.add_subparsers(dest="command", required=True, metavar="command")
+    for name, (_, help_text) in COMMANDS.items():
+        commands.add_parser(name, help=help_text, add_help=False)
+    serve_parser = commands.add_parser("serve", help="Keep a warm process serving commands")
+    serve_parser.add_argument("--no-preload", action="store_true", help="Import modules on first use instead")
+    startup = commands.add_parser(
+        "startup",
+        help="Compare cold and warm wall times of a command",
+        usage="cli.py startup [--runs N] [command [options ...]]",
+    )
+    startup.add_argument("--runs", type=int, default=STARTUP_RUNS)
+    startup.add_argument("target", nargs="?", default="metrics", choices=list(COMMANDS))
+    startup.add_argument("target_args", nargs=argparse.REMAINDER)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    args, rest = build_parser().parse_known_args(argv)
+
+    if args.command == "serve":
+        serve(preload=not args.no_preload)
+        return
+    if args.command == "startup":
+        rows = startup_report(args.target, args.target_args, args.runs)
+        for mode in ("cold", "warm"):
+            times = [row["seconds"] for row in rows if row["mode"] == mode]
+            print(f"{args.target} {mode}: best {min(times) * 1000:.0f} ms, "
+                  f"mean {sum(times) / len(times) * 1000:.0f} ms over {len(times)} runs")
+        return
+
+    if args.warm or os.environ.get(ENV_VAR, "").lower() in {"1", "true", "yes", "on"}:
+        response = request(args.command, rest)
+        if response is not None:
+            sys.stdout.write(str(response["stdout"]))
+            sys.stderr.write(str(response["stderr"]))
+            sys.exit(int(response["status"]))
+    sys.exit(run_command(args.command, rest))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""Recompute the ``complexity_*`` component columns from their inputs.
+
+Each component is a capped transform of one input column:
+
+* ``complexity_syll_component = min(12 * ln(syllables + 1), 25)``
+* ``complexity_freq_component = min(5 * frequency_complexity, 35)``
+* ``complexity_semantic_component = min(4 * sqrt(semantic_complexity), 20)``
+* ``complexity_length_component = min(6 * sqrt(max(length - 4, 0)), 20)``
+
+and ``complexity_overall_complexity`` is their unrounded sum. Components and
+overall are rounded to the published decimals.
+
+The inputs take few distinct values, so each component is evaluated once per
+distinct input value and gathered back to the rows. A weight change therefore
+re-evaluates only the components it touches. An input change recomputes only
+the rows that changed.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from dataclasses import dataclass, fields, replace
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from masterframe import SCHEMA, float64_values, load_masterframe
+
+OVERALL_COLUMN = "complexity_overall_complexity"
+
+
+@dataclass(frozen=True)
+class ComplexityWeights:
+    """Scale, cap and offsets of the component transforms."""
+
+    syllable_scale: float = 12.0
+    syllable_cap: float = 25.0
+    frequency_scale: float = 5.0
+    frequency_cap: float = 35.0
+    semantic_scale: float = 4.0
+    semantic_cap: float = 20.0
+    length_scale: float = 6.0
+    length_offset: float = 4.0
+    length_cap: float = 20.0
+
+
+DEFAULT_WEIGHTS = ComplexityWeights()
+
+
+@dataclass(frozen=True)
+class Component:
+    column: str
+    source: str
+    weights: tuple  # ComplexityWeights fields it reads
+    transform: Callable[[np.ndarray, ComplexityWeights], np.ndarray]
+
+
+COMPONENTS: List[Component] = [
+    Component(
+        "complexity_syll_component", "complexity_syllables", ("syllable_scale", "syllable_cap"),
+        lambda x, w: np.minimum(w.syllable_scale * np.log(x + 1), w.syllable_cap),
+    ),
+    Component(
+        "complexity_freq_component", "complexity_frequency_complexity", ("frequency_scale", "frequency_cap"),
+        lambda x, w: np.minimum(w.frequency_scale * x, w.frequency_cap),
+    ),
+    Component(
+        "complexity_semantic_component", "complexity_semantic_complexity", ("semantic_scale", "semantic_cap"),
+        lambda x, w: np.minimum(w.semantic_scale * np.sqrt(x), w.semantic_cap),
+    ),
+    Component(
+        "complexity_length_component", "complexity_length", ("length_scale", "length_offset", "length_cap"),
+        lambda x, w: np.minimum(w.length_scale * np.sqrt(np.maximum(x - w.length_offset, 0)), w.length_cap),
+    ),
+]
+INPUT_COLUMNS = [component.source for component in COMPONENTS]
+OUTPUT_COLUMNS = [OVERALL_COLUMN] + [component.column for component in COMPONENTS]
+
+
+def parse_weights(assignments: Sequence[str], base: ComplexityWeights = DEFAULT_WEIGHTS) -> ComplexityWeights:
+    """Apply ``name=value`` overrides to ``base``."""
+    names = {field.name for field in fields(ComplexityWeights)}
+    overrides: Dict[str, float] = {}
+    for assignment in assignments:
+        name, _, value = assignment.partition("=")
+        if name not in names:
+            raise ValueError(f"Unknown weight {name!r}; choose from {', '.join(sorted(names))}")
+        overrides[name] = float(value)
+    return replace(base, **overrides)
+
+
+class ComplexityEngine:
+    """Component and overall scores for a set of rows, kept up to date incrementally."""
+
+    def __init__(self, df: Optional[pd.DataFrame] = None, weights: ComplexityWeights = DEFAULT_WEIGHTS) -> None:
+        df = load_masterframe(INPUT_COLUMNS) if df is None else df
+        self.weights = weights
+        # Own, writable copies: under copy-on-write a float64 column hands back a read-only view.
+        self.inputs = {column: np.array(float64_values(df[column]), dtype=np.float64) for column in INPUT_COLUMNS}
+        self.components: Dict[str, np.ndarray] = {}
+        self._uniques: Dict[str, np.ndarray] = {}
+        self._codes: Dict[str, np.ndarray] = {}
+        for component in COMPONENTS:
+            self._index_values(component)
+            self.components[component.column] = self._evaluate(component)
+        self.overall = sum(self.components.values())
+
+    def _index_values(self, component: Component) -> None:
+        self._uniques[component.source], self._codes[component.source] = np.unique(
+            self.inputs[component.source], return_inverse=True
+        )
+
+    def _index_rows(self, component: Component, rows: np.ndarray) -> None:
+        """Re-point ``rows`` at their distinct values, merging any new ones into the sorted table.
+
+        Existing codes are remapped only when a new distinct value appears;
+        otherwise the cost is a binary search per changed row. Values no row
+        uses any more stay in the table, which only costs their evaluation.
+        """
+        source = component.source
+        values = self.inputs[source][rows]
+        added = np.setdiff1d(values, self._uniques[source])
+        if len(added):
+            merged = np.union1d(self._uniques[source], added)
+            self._codes[source] = np.searchsorted(merged, self._uniques[source])[self._codes[source]]
+            self._uniques[source] = merged
+        self._codes[source][rows] = np.searchsorted(self._uniques[source], values)
+
+    def _evaluate(self, component: Component) -> np.ndarray:
+        """Evaluate ``component`` once per distinct input value and gather it to the rows."""
+        table = component.transform(self._uniques[component.source], self.weights)
+        return table[self._codes[component.source]]
+
+    def set_weights(self, weights: ComplexityWeights) -> List[str]:
+        """Switch to ``weights``, recomputing only the affected components; return their columns."""
+        changed = [
+            component for component in COMPONENTS
+            if any(getattr(weights, name) != getattr(self.weights, name) for name in component.weights)
+        ]
+        self.weights = weights
+        for component in changed:
+            new = self._evaluate(component)
+            self.overall += new - self.components[component.column]
+            self.components[component.column] = new
+        return [component.column for component in changed]
+
+    def update_rows(self, rows: np.ndarray, values: Dict[str, np.ndarray]) -> None:
+        """Set input ``values`` (column -> array aligned with ``rows``) and rescore those rows."""
+        rows = np.asarray(rows)
+        for column, column_values in values.items():
+            self.inputs[column][rows] = column_values
+        for component in COMPONENTS:
+            if component.source not in values:
+                continue
+            new = component.transform(self.inputs[component.source][rows], self.weights)
+            self.overall[rows] += new - self.components[component.column][rows]
+            self.components[component.column][rows] = new
+            self._index_rows(component, rows)
+
+    def update(self, df: pd.DataFrame) -> np.ndarray:
+        """Rescore the rows of ``df`` (same row order) whose inputs differ; return their positions."""
+        new_inputs = {column: float64_values(df[column]) for column in INPUT_COLUMNS}
+        changed = np.zeros(len(df), dtype=bool)
+        for column, values in new_inputs.items():
+            changed |= ~((values == self.inputs[column]) | (np.isnan(values) & np.isnan(self.inputs[column])))
+        rows = np.flatnonzero(changed)
+        if len(rows):
+            self.update_rows(rows, {column: values[rows] for column, values in new_inputs.items()})
+        return rows
+
+    def frame(self, rounded: bool = True) -> pd.DataFrame:
+        """Overall and component scores as the published columns."""
+        data = {OVERALL_COLUMN: self.overall, **self.components}
+        frame = pd.DataFrame({column: data[column] for column in OUTPUT_COLUMNS})
+        if rounded:
+            for column in OUTPUT_COLUMNS:
+                frame[column] = frame[column].round(SCHEMA[column]["decimals"])
+        return frame
+
+
+def verify(engine: ComplexityEngine, df: pd.DataFrame) -> pd.DataFrame:
+    """Per column: rows matching the published value, and rows off by a rounding tie.
+
+    The frequency input is published to 2 decimals, so ``5 * frequency`` can
+    land exactly on a half step whose published rounding used the lost digit.
+    """
+    computed = engine.frame(rounded=False)
+    rows = []
+    for column in OUTPUT_COLUMNS:
+        decimals = SCHEMA[column]["decimals"]
+        published = float64_values(df[column])
+        exact = np.isclose(computed[column].round(decimals).to_numpy(), published, atol=1e-6)
+        tie = ~exact & (np.abs(computed[column].to_numpy() - published) <= 0.5 * 10.0 ** -decimals + 1e-9)
+        rows.append({"column": column, "exact": int(exact.sum()), "rounding_tie": int(tie.sum()),
+                     "different": int((~exact & ~tie).sum())})
+    return pd.DataFrame(rows).set_index("column")
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--set", nargs="+", default=[], metavar="NAME=VALUE",
+                        help="Weight overrides, e.g. frequency_scale=4 length_cap=15")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = parse_args(argv)
+    df = load_masterframe(INPUT_COLUMNS + OUTPUT_COLUMNS)
+    start = time.perf_counter()
+    engine = ComplexityEngine(df)
+    print(f"Scored {len(df)} rows in {(time.perf_counter() - start) * 1000:.1f} ms")
+    print(verify(engine, df).to_string())
+    if args.set:
+        published = engine.overall.copy()
+        start = time.perf_counter()
+        changed = engine.set_weights(parse_weights(args.set))
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"\nRe-weighted {', '.join(changed) or 'nothing'} in {elapsed:.2f} ms")
+        print(pd.DataFrame({"published": published, "reweighted": engine.overall}).describe().round(2).to_string())
+        rank = pd.Series(published).rank().corr(pd.Series(engine.overall).rank())
+        print(f"Rank correlation with the published weights: {rank:.3f}")
+
+
+if __name__ == "__main__":
+    main()
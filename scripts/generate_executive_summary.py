@@ -2,8 +2,24 @@
 """
 Generate a 1-page executive summary PDF for decision-makers.
 Targets stakeholders who need quick, actionable insights.
+
+Without arguments, renders the site-wide summary. ``--batch`` renders one
+summary per cultural domain and/or learner segment from metrics computed on
+the masterframe, across a process pool.
 """
 
+import argparse
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from string import Formatter
+from xml.sax.saxutils import escape
+
+import numpy as np
+import pandas as pd
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
 from reportlab.lib.colors import HexColor, black, white
@@ -11,8 +27,11 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
 from reportlab.pdfgen import canvas
-from datetime import datetime
-import os
+
+from calculate_business_impact import FALSE_FRIENDS, FREQUENCY_COLUMN, compute_business_impact
+from correlations import CorrelationEngine
+from instrumentation import configure as configure_profiling, span
+from masterframe import float64_values, load_masterframe
 
 # Color scheme matching the website
 ACCENT_COLOR = HexColor('#0a3d62')
@@ -22,12 +41,176 @@ TEXT_PRIMARY = HexColor('#212529')
 TEXT_SECONDARY = HexColor('#495057')
 BG_PRIMARY = HexColor('#f8f9fa')
 
-def create_executive_summary(output_path='assets/docs/executive_summary.pdf'):
-    """Generate a professional 1-page executive summary PDF."""
-    
+BATCH_OUTPUT_DIR = os.path.join('assets', 'docs', 'summaries')
+
+# Learner segments by frequency score band (lower = more frequent): beginners
+# meet daily words first, advanced learners the weekly-or-rarer vocabulary.
+LEARNER_SEGMENTS = {
+    'beginner': (0.0, 3.0),
+    'intermediate': (3.0, 4.0),
+    'advanced': (4.0, 7.0),
+}
+SEGMENT_KINDS = ('overall', 'domain', 'learner', 'domain-learner')
+MEDIEVAL_CUTOFF = 1400
+MODERN_CUTOFF = 1800
+
+# Fixed figures in the shape ``metrics_from_frame`` returns, for exercising the
+# layout in tests without loading data. The rendered summary never uses them.
+SAMPLE_METRICS = {
+    'title': 'English-Spanish Cognate Analysis',
+    'cognate_pct': 86.8,
+    'ff_pct': 7.4,
+    'ff_one_in': 13,
+    'ff_frequency': 2.95,
+    'top_domain': 'Family/Kinship',
+    'top_domain_short': 'Family',
+    'top_ffr': 20.0,
+    'second_domain': 'Emotions/Psychology',
+    'second_domain_short': 'Emotions',
+    'second_ffr': 13.33,
+    'safe_domain': 'Technology/Tools',
+    'safe_domain_short': 'Technology',
+    'safe_ffr': 3.69,
+    'risk_domains_label': 'Abstract domains',
+    'high_risk_floor': 13,
+    'en_es_frequency': 2.84,
+    'es_en_frequency': 3.76,
+    'similarity_strength': 'near-zero',
+    'similarity_r': 0.008,
+    'length_r': 0.76,
+    'complex_domain': 'Health/Medicine',
+    'pre_1400_pct': 55.3,
+    'modern_pct': 5.3,
+    'historical_conclusion': 'Ancient false friends remain the primary learning challenge.',
+    'ff_examples': ['actual', 'embarazada', 'sensible'],
+}
+
+# (value, label) cells of the key metrics box, two per row.
+HIGHLIGHT_TEMPLATES = [
+    ('<b>{cognate_pct:.1f}%</b>', 'True Cognates'),
+    ('<b>{ff_pct:.1f}%</b>', 'False Friends'),
+    ('<b>1 in {ff_one_in}</b>', 'Similar words trick learners'),
+    ('<b>{ff_frequency:.2f}</b>', 'Mean frequency (false friends)'),
+    ('<b>{top_ffr:.1f}%</b>', 'FFR: {top_domain}'),
+    ('<b>{safe_ffr:.2f}%</b>', 'FFR: {safe_domain}'),
+]
+
+FINDING_TEMPLATES = [
+    "<b>1. The False Friends Paradox:</b> High-frequency false friends (mean frequency {ff_frequency:.2f} vs. true cognates) appear early in learning, creating outsized confusion. {risk_domains_label} ({second_domain_short}: {second_ffr:.2f}%, {top_domain_short}: {top_ffr:.2f}% FFR) pose highest risk.",
+    "<b>2. Strategic Loanword Patterns:</b> English→Spanish loans (frequency {en_es_frequency:.2f}) dominate modern tech vocabulary—essential for contemporary communication. Spanish→English loans (frequency {es_en_frequency:.2f}) are cultural specialties.",
+    "<b>3. Complexity ≠ Similarity:</b> Levenshtein similarity shows {similarity_strength} correlation with complexity (r={similarity_r:.3f}). Word length and syllables predict complexity (r≥{length_r:.2f}). {complex_domain} domains trend most complex.",
+    "<b>4. Historical Patterns:</b> {pre_1400_pct:.1f}% of false friends emerged before 1400; only {modern_pct:.1f}% in modern times. {historical_conclusion}",
+]
+
+RECOMMENDATION_TEMPLATES = [
+    "<b>Curriculum Design:</b> Flag high-frequency false friends ({ff_examples}) with explicit warnings in early-stage instruction. Sequence safe domains ({safe_domain_short}) before high-risk domains ({top_domain_short}, {second_domain_short}).",
+    "<b>Resource Allocation:</b> Prioritize false friend instruction in {top_domain} and {second_domain} domains where FFR exceeds {high_risk_floor}%. Leverage {cognate_pct:.1f}% true cognate foundation for rapid vocabulary expansion.",
+    "<b>Application Development:</b> Adaptive systems should prioritize false friend practice based on frequency data. Error prediction models benefit from domain-specific FFR rates. Personalize learning paths by complexity metrics (length, syllables) rather than similarity.",
+]
+
+
+class _MetricFormatter(Formatter):
+    """``str.format`` that prints missing metrics (``None``) as 'n/a' and italicizes example lists."""
+
+    def format_field(self, value, format_spec):
+        if value is None:
+            return 'n/a'
+        if isinstance(value, (list, tuple)):
+            return ', '.join(f'<i>{escape(str(item))}</i>' for item in value)
+        return super().format_field(value, format_spec)
+
+
+_FORMATTER = _MetricFormatter()
+
+
+@lru_cache(maxsize=None)
+def build_styles():
+    """Paragraph and table styles, built once per process."""
+    styles = getSampleStyleSheet()
+    return {
+        'title': ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=24,
+            textColor=ACCENT_COLOR,
+            spaceAfter=12,
+            alignment=TA_CENTER,
+            fontName='Helvetica-Bold'
+        ),
+        'subtitle': ParagraphStyle(
+            'CustomSubtitle',
+            parent=styles['Normal'],
+            fontSize=11,
+            textColor=TEXT_SECONDARY,
+            spaceAfter=18,
+            alignment=TA_CENTER,
+            fontName='Helvetica'
+        ),
+        'section': ParagraphStyle(
+            'CustomSection',
+            parent=styles['Heading2'],
+            fontSize=11,
+            textColor=ACCENT_COLOR,
+            spaceAfter=6,
+            spaceBefore=10,
+            fontName='Helvetica-Bold',
+            leftIndent=0
+        ),
+        'body': ParagraphStyle(
+            'CustomBody',
+            parent=styles['Normal'],
+            fontSize=9,
+            textColor=TEXT_PRIMARY,
+            spaceAfter=6,
+            leading=11,
+            leftIndent=0
+        ),
+        'metric_bold': ParagraphStyle(
+            'MetricBold',
+            parent=styles['Normal'],
+            fontSize=11,
+            textColor=TEXT_PRIMARY,
+            fontName='Helvetica-Bold',
+            leading=12
+        ),
+        'metric_normal': ParagraphStyle(
+            'MetricNormal',
+            parent=styles['Normal'],
+            fontSize=9,
+            textColor=TEXT_PRIMARY,
+            fontName='Helvetica',
+            leading=11
+        ),
+        'footer': ParagraphStyle(
+            'Footer',
+            parent=styles['Normal'],
+            fontSize=7,
+            textColor=TEXT_SECONDARY,
+            alignment=TA_CENTER,
+            fontName='Helvetica-Oblique'
+        ),
+        'metrics_table': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, -1), white),
+            ('TEXTCOLOR', (0, 0), (-1, -1), TEXT_PRIMARY),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('TOPPADDING', (0, 0), (-1, -1), 4),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+            ('LEFTPADDING', (0, 0), (-1, -1), 0),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+        ]),
+    }
+
+
+def render_summary(output_path, metrics, styles=None):
+    """Render one summary PDF from ``metrics`` and return the render time in seconds."""
+    start = time.perf_counter()
+    styles = styles or build_styles()
+    fill = lambda template: _FORMATTER.format(template, **metrics)
+
     # Ensure output directory exists
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    
+
     doc = SimpleDocTemplate(
         output_path,
         pagesize=letter,
@@ -36,175 +219,243 @@ def create_executive_summary(output_path='assets/docs/executive_summary.pdf'):
         topMargin=0.4*inch,
         bottomMargin=0.4*inch
     )
-    
+
     # Container for the 'Flowable' objects
     story = []
-    
-    # Define custom styles
-    styles = getSampleStyleSheet()
-    
-    # Title style
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor=ACCENT_COLOR,
-        spaceAfter=12,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold'
-    )
-    
-    # Subtitle style
-    subtitle_style = ParagraphStyle(
-        'CustomSubtitle',
-        parent=styles['Normal'],
-        fontSize=11,
-        textColor=TEXT_SECONDARY,
-        spaceAfter=18,
-        alignment=TA_CENTER,
-        fontName='Helvetica'
-    )
-    
-    # Section header style
-    section_style = ParagraphStyle(
-        'CustomSection',
-        parent=styles['Heading2'],
-        fontSize=11,
-        textColor=ACCENT_COLOR,
-        spaceAfter=6,
-        spaceBefore=10,
-        fontName='Helvetica-Bold',
-        leftIndent=0
-    )
-    
-    # Key metric style
-    metric_style = ParagraphStyle(
-        'CustomMetric',
-        parent=styles['Normal'],
-        fontSize=10,
-        textColor=TEXT_PRIMARY,
-        spaceAfter=6,
-        fontName='Helvetica-Bold',
-        leftIndent=0
-    )
-    
-    # Body text style
-    body_style = ParagraphStyle(
-        'CustomBody',
-        parent=styles['Normal'],
-        fontSize=9,
-        textColor=TEXT_PRIMARY,
-        spaceAfter=6,
-        leading=11,
-        leftIndent=0
-    )
-    
-    # Bullet style
-    bullet_style = ParagraphStyle(
-        'CustomBullet',
-        parent=styles['Normal'],
-        fontSize=8.5,
-        textColor=TEXT_PRIMARY,
-        spaceAfter=4,
-        leading=10,
-        leftIndent=12,
-        bulletIndent=6
-    )
-    
+
     # Executive Summary Title
-    story.append(Paragraph("EXECUTIVE SUMMARY", title_style))
-    story.append(Paragraph("English-Spanish Cognate Analysis", subtitle_style))
+    story.append(Paragraph("EXECUTIVE SUMMARY", styles['title']))
+    story.append(Paragraph(escape(metrics['title']), styles['subtitle']))
     story.append(Spacer(1, 0.12*inch))
-    
+
     # Key Metrics Box - Use Paragraph objects to process HTML tags
-    metric_bold_style = ParagraphStyle(
-        'MetricBold',
-        parent=styles['Normal'],
-        fontSize=11,
-        textColor=TEXT_PRIMARY,
-        fontName='Helvetica-Bold',
-        leading=12
-    )
-    metric_normal_style = ParagraphStyle(
-        'MetricNormal',
-        parent=styles['Normal'],
-        fontSize=9,
-        textColor=TEXT_PRIMARY,
-        fontName='Helvetica',
-        leading=11
-    )
-    
-    metrics_data = [
-        [Paragraph('<b>86.8%</b>', metric_bold_style), Paragraph('True Cognates', metric_normal_style), 
-         Paragraph('<b>7.4%</b>', metric_bold_style), Paragraph('False Friends', metric_normal_style)],
-        [Paragraph('<b>1 in 13</b>', metric_bold_style), Paragraph('Similar words trick learners', metric_normal_style), 
-         Paragraph('<b>2.95</b>', metric_bold_style), Paragraph('Mean frequency (false friends)', metric_normal_style)],
-        [Paragraph('<b>20.0%</b>', metric_bold_style), Paragraph('FFR: Family/Kinship', metric_normal_style), 
-         Paragraph('<b>3.69%</b>', metric_bold_style), Paragraph('FFR: Technology/Tools', metric_normal_style)],
+    cells = [
+        [Paragraph(fill(value), styles['metric_bold']), Paragraph(fill(label), styles['metric_normal'])]
+        for value, label in HIGHLIGHT_TEMPLATES
     ]
-    
+    metrics_data = [cells[i] + cells[i + 1] for i in range(0, len(cells), 2)]
+
     metrics_table = Table(metrics_data, colWidths=[1.2*inch, 2.1*inch, 1.2*inch, 2.1*inch])
-    metrics_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), white),
-        ('TEXTCOLOR', (0, 0), (-1, -1), TEXT_PRIMARY),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('TOPPADDING', (0, 0), (-1, -1), 4),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-        ('LEFTPADDING', (0, 0), (-1, -1), 0),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-    ]))
+    metrics_table.setStyle(styles['metrics_table'])
     story.append(metrics_table)
     story.append(Spacer(1, 0.1*inch))
-    
+
     # Core Findings
-    story.append(Paragraph("CORE FINDINGS", section_style))
-    
-    findings = [
-        "<b>1. The False Friends Paradox:</b> High-frequency false friends (mean frequency 2.95 vs. true cognates) appear early in learning, creating outsized confusion. Abstract domains (Emotions: 13.33%, Family: 20.00% FFR) pose highest risk.",
-        "<b>2. Strategic Loanword Patterns:</b> English→Spanish loans (frequency 2.84) dominate modern tech vocabulary—essential for contemporary communication. Spanish→English loans (frequency 3.76) are cultural specialties.",
-        "<b>3. Complexity ≠ Similarity:</b> Levenshtein similarity shows near-zero correlation with complexity (r=0.008). Word length and syllables predict complexity (r≥0.76). Health/Medicine domains trend most complex.",
-        "<b>4. Historical Patterns:</b> 55.3% of false friends emerged before 1400; only 5.3% in modern times. Ancient false friends remain the primary learning challenge.",
-    ]
-    
-    for finding in findings:
-        story.append(Paragraph(finding, body_style))
+    story.append(Paragraph("CORE FINDINGS", styles['section']))
+    for finding in FINDING_TEMPLATES:
+        story.append(Paragraph(fill(finding), styles['body']))
         story.append(Spacer(1, 0.06*inch))
-    
+
     story.append(Spacer(1, 0.08*inch))
-    
+
     # Strategic Recommendations
-    story.append(Paragraph("STRATEGIC RECOMMENDATIONS", section_style))
-    
-    recommendations = [
-        "<b>Curriculum Design:</b> Flag high-frequency false friends (<i>actual</i>, <i>embarazada</i>, <i>sensible</i>) with explicit warnings in early-stage instruction. Sequence safe domains (Technology) before high-risk domains (Family, Emotions).",
-        "<b>Resource Allocation:</b> Prioritize false friend instruction in Family/Kinship and Emotions/Psychology domains where FFR exceeds 13%. Leverage 86.8% true cognate foundation for rapid vocabulary expansion.",
-        "<b>Application Development:</b> Adaptive systems should prioritize false friend practice based on frequency data. Error prediction models benefit from domain-specific FFR rates. Personalize learning paths by complexity metrics (length, syllables) rather than similarity.",
-    ]
-    
-    for rec in recommendations:
-        story.append(Paragraph(rec, body_style))
+    story.append(Paragraph("STRATEGIC RECOMMENDATIONS", styles['section']))
+    for rec in RECOMMENDATION_TEMPLATES:
+        story.append(Paragraph(fill(rec), styles['body']))
         story.append(Spacer(1, 0.06*inch))
-    
+
     story.append(Spacer(1, 0.08*inch))
-    
+
     # Bottom footer with date
     footer_text = f"Generated: {datetime.now().strftime('%B %Y')} | Full report available at findings.html"
-    footer_style = ParagraphStyle(
-        'Footer',
-        parent=styles['Normal'],
-        fontSize=7,
-        textColor=TEXT_SECONDARY,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Oblique'
-    )
-    story.append(Paragraph(footer_text, footer_style))
-    
+    story.append(Paragraph(footer_text, styles['footer']))
+
     # Build PDF
-    doc.build(story)
+    with span('doc.build'):
+        doc.build(story)
+    return time.perf_counter() - start
+
+
+def create_executive_summary(output_path='assets/docs/executive_summary.pdf', metrics=None):
+    """Generate a professional 1-page executive summary PDF.
+
+    ``metrics`` defaults to the site-wide figures computed from the masterframe
+    (``site_metrics``); see ``metrics_from_frame`` for a slice of it.
+    """
+    render_summary(output_path, metrics or site_metrics())
     print(f"Executive summary PDF generated: {output_path}")
     return output_path
 
-if __name__ == '__main__':
-    create_executive_summary()
 
+def domain_labels(domain):
+    """('Family/Kinship', 'Family') for 'family_kinship'."""
+    parts = [part.title() for part in domain.split('_')]
+    return '/'.join(parts), parts[0]
+
+
+def _number(value):
+    return None if value is None or not np.isfinite(value) else float(value)
+
+
+def metrics_from_frame(segment, reference, title):
+    """Summary metrics for the rows in ``segment``.
+
+    Domain rankings come from the segment when it spans at least three
+    domains, otherwise from ``reference`` (the full-corpus ``BusinessImpact``).
+    """
+    impact = compute_business_impact(segment)
+    counts = impact.relationship_counts.sum()
+    total = int(counts.sum())
+    ff = int(counts.get(FALSE_FRIENDS, 0))
+    means = impact.frequency_means
+
+    ranking = impact.domain_stats if len(impact.domain_stats) >= 3 else reference.domain_stats
+    (top, top_row), (second, second_row) = list(ranking.iterrows())[:2]
+    safe, safe_row = list(ranking.iterrows())[-1]
+
+    corr = CorrelationEngine(
+        ['levenshtein_similarity', 'complexity_syllables', 'complexity_length', 'complexity_overall_complexity'], []
+    ).update(segment).matrix()['complexity_overall_complexity']
+    similarity_r = _number(corr['levenshtein_similarity'])
+    length_r = _number(min(corr['complexity_length'], corr['complexity_syllables']))
+    if similarity_r is None:
+        strength = 'undetermined'
+    else:
+        strength = next(label for bound, label in [(0.1, 'near-zero'), (0.3, 'weak'), (0.5, 'moderate'), (1.01, 'strong')]
+                        if abs(similarity_r) < bound)
+
+    false_friends = segment[segment['relationship_type'] == FALSE_FRIENDS]
+    years = false_friends['first_attestation_english'].dropna().astype(int).to_numpy()
+    pre_1400 = (years < MEDIEVAL_CUTOFF).mean() * 100 if len(years) else None
+    frequency = float64_values(false_friends[FREQUENCY_COLUMN])
+    examples = false_friends['spanish_word'].to_numpy()[np.argsort(frequency, kind='stable')]
+
+    complexity = segment.groupby('cultural_domain', observed=True)['complexity_overall_complexity'].mean()
+    return {
+        'title': f'English-Spanish Cognate Analysis: {title}',
+        'cognate_pct': counts.get('cognates', 0) / total * 100,
+        'ff_pct': ff / total * 100,
+        'ff_one_in': round(total / ff) if ff else 'n/a',
+        'ff_frequency': _number(means.get(FALSE_FRIENDS)),
+        'top_domain': domain_labels(top)[0],
+        'top_domain_short': domain_labels(top)[1],
+        'top_ffr': top_row['ffr'],
+        'second_domain': domain_labels(second)[0],
+        'second_domain_short': domain_labels(second)[1],
+        'second_ffr': second_row['ffr'],
+        'safe_domain': domain_labels(safe)[0],
+        'safe_domain_short': domain_labels(safe)[1],
+        'safe_ffr': safe_row['ffr'],
+        'risk_domains_label': 'Highest-risk domains',
+        'high_risk_floor': math.floor(second_row['ffr']),
+        'en_es_frequency': _number(means.get('loanword_en_to_es')),
+        'es_en_frequency': _number(means.get('loanword_es_to_en')),
+        'similarity_strength': strength,
+        'similarity_r': similarity_r,
+        'length_r': None if length_r is None else math.floor(length_r * 100) / 100,
+        'complex_domain': domain_labels(str(complexity.idxmax()))[0],
+        'pre_1400_pct': pre_1400,
+        'modern_pct': (years >= MODERN_CUTOFF).mean() * 100 if len(years) else None,
+        'historical_conclusion': (
+            'Ancient false friends remain the primary learning challenge.'
+            if pre_1400 is not None and pre_1400 >= 50
+            else 'Post-medieval false friends make up most of this segment.'
+        ),
+        'ff_examples': list(dict.fromkeys(examples))[:3],
+    }
+
+
+def site_metrics(df=None):
+    """Metrics of the site-wide summary, computed from ``df`` (default: the masterframe)."""
+    df = load_masterframe() if df is None else df
+    return metrics_from_frame(df, compute_business_impact(df), 'All Domains')
+
+
+def segment_metrics(df, kinds=SEGMENT_KINDS):
+    """Yield ``(slug, metrics)`` for every non-empty segment of the requested kinds.
+
+    Segments without false friends are skipped; there is nothing to summarize.
+    """
+    reference = compute_business_impact(df)
+    frequency = float64_values(df[FREQUENCY_COLUMN])
+    domains = df['cultural_domain'].astype(str)
+    edges = [low for low, _ in LEARNER_SEGMENTS.values()] + [list(LEARNER_SEGMENTS.values())[-1][1]]
+    bands = pd.cut(frequency, bins=edges, labels=list(LEARNER_SEGMENTS), include_lowest=True)
+    learner_masks = {name: np.asarray(bands == name) for name in LEARNER_SEGMENTS}
+
+    segments = []
+    if 'overall' in kinds:
+        segments.append(('overall', 'All Domains', np.ones(len(df), dtype=bool)))
+    for domain in sorted(domains.unique()):
+        in_domain = (domains == domain).to_numpy()
+        label = domain_labels(domain)[0]
+        if 'domain' in kinds:
+            segments.append((domain, label, in_domain))
+        if 'domain-learner' in kinds:
+            for name, mask in learner_masks.items():
+                segments.append((f'{domain}__{name}', f'{label}, {name.title()} Learners', in_domain & mask))
+    if 'learner' in kinds:
+        for name, mask in learner_masks.items():
+            segments.append((name, f'{name.title()} Learners', mask))
+
+    for slug, title, mask in segments:
+        segment = df[mask]
+        if (segment['relationship_type'] == FALSE_FRIENDS).any():
+            yield slug, metrics_from_frame(segment, reference, title)
+
+
+def _render_job(job):
+    output_path, metrics = job
+    return output_path, render_summary(output_path, metrics)
+
+
+def create_summaries(jobs, workers=None):
+    """Render ``(output_path, metrics)`` jobs across a process pool.
+
+    Each worker builds its styles once and reuses them for every document it
+    renders. Returns ``(output_path, seconds)`` per document, in job order.
+    """
+    jobs = list(jobs)
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(jobs) <= 1:
+        return [_render_job(job) for job in jobs]
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=build_styles) as pool:
+        return list(pool.map(_render_job, jobs, chunksize=chunksize))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Generate executive summary PDFs.')
+    parser.add_argument('--batch', nargs='+', choices=SEGMENT_KINDS,
+                        help='Render one summary per segment of these kinds from computed metrics')
+    parser.add_argument('--output-dir', default=BATCH_OUTPUT_DIR)
+    parser.add_argument('--workers', type=int, help='Worker processes (default: all cores)')
+    parser.add_argument('--profile', metavar='PREFIX',
+                        help='Write per-stage timings to PREFIX.json and PREFIX.trace.json')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    configure_profiling(args.profile, 'generate_executive_summary')
+    if not args.batch:
+        with span('render'):
+            create_executive_summary()
+        return
+
+    start = time.perf_counter()
+    with span('load') as stage:
+        df = load_masterframe()
+        stage.set_rows(len(df))
+    with span('metrics', rows=len(df)):
+        jobs = [
+            (os.path.join(args.output_dir, f'executive_summary_{slug}.pdf'), metrics)
+            for slug, metrics in segment_metrics(df, args.batch)
+        ]
+    metrics_seconds = time.perf_counter() - start
+    with span('render', rows=len(jobs)):
+        timings = create_summaries(jobs, args.workers)
+    total = time.perf_counter() - start
+
+    for path, seconds in timings:
+        print(f"  - {path}: {seconds * 1000:.1f} ms")
+    render = [seconds for _, seconds in timings]
+    print(
+        f"Rendered {len(timings)} summaries in {total:.2f}s "
+        f"(metrics {metrics_seconds:.2f}s; per document mean {np.mean(render) * 1000:.1f} ms, "
+        f"max {np.max(render) * 1000:.1f} ms)"
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""Named per-stage spans with wall/CPU time, peak memory and row counts.
+
+Scripts wrap their stages in ``span``::
+
+    with span("load") as stage:
+        df = load_masterframe()
+        stage.set_rows(len(df))
+
+Profiling is off unless a script calls ``configure`` with an output prefix
+(its ``--profile`` option) or ``MASTERFRAME_PROFILE`` is set to a prefix
+(``1`` picks ``.cache/profile/<script>-<time>``). While it is off, ``span``
+returns a shared no-op context. While it is on, ``tracemalloc`` tracks the
+peak of each span. At exit (or when ``finish`` is called, as the warm
+``cli.py`` server does after each command), the spans are written to
+``<prefix>.json`` and to a Chrome trace, ``<prefix>.trace.json``, which
+opens in ``chrome://tracing`` or Perfetto.
+
+Run the module on one or more ``.json`` profiles to compare stages across
+runs.
+"""
+from __future__ import annotations
+
+import argparse
+import atexit
+import json
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import pandas as pd
+
+from masterframe import CACHE_DIR
+
+ENV_VAR = "MASTERFRAME_PROFILE"
+PROFILE_DIR = CACHE_DIR / "profile"
+MIB = 2**20
+
+
+class _NullSpan:
+    """Stand-in returned while profiling is off."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+    def set_rows(self, rows: int) -> None:
+        pass
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """One timed stage; nested spans record their parent."""
+
+    __slots__ = ("profiler", "name", "rows", "parent", "depth", "start", "wall", "cpu", "base", "peak", "_cpu_start")
+
+    def __init__(self, profiler: "Profiler", name: str, rows: Optional[int]) -> None:
+        self.profiler = profiler
+        self.name = name
+        self.rows = rows
+        self.parent: Optional[str] = None
+        self.depth = 0
+        self.start = self.wall = self.cpu = 0.0
+        self.base = self.peak = 0
+
+    def set_rows(self, rows: int) -> None:
+        self.rows = int(rows)
+
+    def __enter__(self) -> "Span":
+        stack = self.profiler.stack
+        if stack:
+            self.parent, self.depth = stack[-1].name, len(stack)
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:
+                stack[-1].peak = max(stack[-1].peak, peak)
+            tracemalloc.reset_peak()
+            self.base = self.peak = current
+        stack.append(self)
+        self._cpu_start = time.process_time()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.wall = time.perf_counter() - self.start
+        self.cpu = time.process_time() - self._cpu_start
+        if tracemalloc.is_tracing():
+            self.peak = max(self.peak, tracemalloc.get_traced_memory()[1])
+        stack = self.profiler.stack
+        stack.pop()
+        if stack:
+            stack[-1].peak = max(stack[-1].peak, self.peak)
+        self.profiler.spans.append(self)
+
+    def as_dict(self, origin: float) -> Dict[str, object]:
+        return {
+            "name": self.name,
+            "parent": self.parent,
+            "depth": self.depth,
+            "start_s": self.start - origin,
+            "wall_s": self.wall,
+            "cpu_s": self.cpu,
+            "peak_mib": self.peak / MIB,
+            "peak_delta_mib": (self.peak - self.base) / MIB,
+            "rows": self.rows,
+        }
+
+
+class Profiler:
+    """Collects spans for one process."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.spans: List[Span] = []
+        self.stack: List[Span] = []
+        self.origin = time.perf_counter()
+        self.script = ""
+        self._tracing = False  # whether enable() started tracemalloc
+
+    def enable(self, script: str = "", trace_memory: bool = True) -> None:
+        self.enabled = True
+        self.script = script
+        self.origin = time.perf_counter()
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing = True
+
+    def disable(self) -> None:
+        """Stop profiling and drop the collected spans."""
+        if self._tracing:
+            tracemalloc.stop()
+            self._tracing = False
+        self.enabled = False
+        self.spans, self.stack = [], []
+
+    def span(self, name: str, rows: Optional[int] = None):
+        if not self.enabled:
+            return NULL_SPAN
+        return Span(self, name, rows)
+
+    def to_json(self) -> Dict[str, object]:
+        return {
+            "script": self.script,
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "pid": os.getpid(),
+            "spans": [span.as_dict(self.origin) for span in sorted(self.spans, key=lambda span: span.start)],
+        }
+
+    def to_chrome_trace(self) -> Dict[str, object]:
+        """Complete ("X") events per span plus a traced-memory counter track."""
+        pid = os.getpid()
+        events: List[Dict[str, object]] = [
+            {"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": self.script or "python"}},
+        ]
+        for span in sorted(self.spans, key=lambda span: span.start):
+            record = span.as_dict(self.origin)
+            start_us = record["start_s"] * 1e6
+            events.append({
+                "name": span.name,
+                "cat": "stage",
+                "ph": "X",
+                "ts": start_us,
+                "dur": span.wall * 1e6,
+                "pid": pid,
+                "tid": 0,
+                "args": {key: record[key] for key in ["cpu_s", "peak_mib", "peak_delta_mib", "rows"]},
+            })
+            events.append({
+                "name": "traced memory",
+                "ph": "C",
+                "ts": start_us + span.wall * 1e6,
+                "pid": pid,
+                "args": {"peak_mib": record["peak_mib"]},
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, prefix: Path) -> List[Path]:
+        """Write ``<prefix>.json`` and ``<prefix>.trace.json``."""
+        prefix.parent.mkdir(parents=True, exist_ok=True)
+        paths = [prefix.with_name(prefix.name + ".json"), prefix.with_name(prefix.name + ".trace.json")]
+        for path, payload in zip(paths, [self.to_json(), self.to_chrome_trace()]):
+            path.write_text(json.dumps(payload, indent=1), encoding="utf-8")
+        return paths
+
+
+PROFILER = Profiler()
+span = PROFILER.span
+_pending: Optional[Path] = None  # prefix the enabled profile is written to
+
+
+def configure(output: Optional[Path], script: str) -> Optional[Path]:
+    """Enable profiling when ``output`` or ``MASTERFRAME_PROFILE`` is set; return the output prefix.
+
+    The profile is written by ``finish``, or when the interpreter exits.
+    """
+    global _pending
+    setting = str(output) if output else os.environ.get(ENV_VAR, "")
+    if not setting or setting.lower() in {"0", "false", "no", "off"}:
+        return None
+    if setting.lower() in {"1", "true", "yes", "on"}:
+        prefix = PROFILE_DIR / f"{script}-{datetime.now():%Y%m%d-%H%M%S}"
+    else:
+        prefix = Path(setting)
+        if prefix.suffix == ".json":
+            prefix = prefix.with_suffix("")
+    if not PROFILER.enabled:
+        PROFILER.enable(script)
+        _pending = prefix
+    return prefix
+
+
+def finish() -> List[Path]:
+    """Write the enabled profile, if any, and switch profiling off for whatever runs next."""
+    global _pending
+    if _pending is None:
+        return []
+    prefix, _pending = _pending, None
+    try:
+        paths = PROFILER.write(prefix)
+    finally:
+        PROFILER.disable()
+    print(f"Profile written to {', '.join(str(path) for path in paths)}", file=sys.stderr)
+    return paths
+
+
+atexit.register(finish)
+
+
+def compare_profiles(paths: Sequence[Path]) -> pd.DataFrame:
+    """Wall time, CPU time and peak memory per stage, one column group per profile."""
+    tables = {}
+    for path in paths:
+        spans = pd.DataFrame(json.loads(Path(path).read_text(encoding="utf-8"))["spans"])
+        spans["rows"] = pd.to_numeric(spans["rows"])
+        tables[Path(path).stem] = spans.groupby("name", sort=False)[["wall_s", "cpu_s", "peak_mib", "rows"]].sum(
+            min_count=1
+        )
+    return pd.concat(tables, axis=1)
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare per-stage profiles written by --profile.")
+    parser.add_argument("profiles", type=Path, nargs="+", help="<prefix>.json files")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = parse_args(argv)
+    print(compare_profiles(args.profiles).to_string(float_format=lambda value: f"{value:.3f}"))
+
+
+if __name__ == "__main__":
+    main()
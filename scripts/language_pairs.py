@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""Language-pair partitioned masterframes and parallel per-pair analysis.
+
+Each language pair is one partition in a long-format layout::
+
+    data/pairs/pair=en-pt/masterframe_en-pt.csv
+
+Partition files carry the masterframe columns with the language-specific
+names made neutral (``PAIR_COLUMNS``: ``english_word`` -> ``source_word``,
+``first_attestation_spanish`` -> ``first_attestation_target``, ...). Their
+loanword labels name the pair's own languages (``loanword_en_to_pt``). The
+pair is encoded in the directory name only. ``load_pairs`` reads just the
+requested partitions (and columns) from their columnar caches and adds it
+back as a ``language_pair`` column. The published English-Spanish
+masterframe serves as the ``en-es`` partition unless one exists on disk.
+
+``run_pairs`` analyses independent pairs concurrently in a process pool,
+one warm worker per pair rather than one cold script start per pair, and
+merges the per-pair results into cross-pair summary tables.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from masterframe import DATA_PATH, ROOT, SCHEMA, apply_schema, load_masterframe
+
+PAIRS_DIR = ROOT / "data" / "pairs"
+DEFAULT_PAIR = "en-es"  # served from DATA_PATH when it has no partition of its own
+PAIR_KEY = "language_pair"
+
+# Masterframe column -> its language-neutral name in the partitioned layout
+PAIR_COLUMNS = {
+    "english_word": "source_word",
+    "spanish_word": "target_word",
+    "spanish_meaning_ff": "target_meaning_ff",
+    "first_attestation_english": "first_attestation_source",
+    "first_attestation_spanish": "first_attestation_target",
+}
+MASTERFRAME_COLUMNS = {pair_column: column for column, pair_column in PAIR_COLUMNS.items()}
+LANGUAGE_NAMES = {
+    "de": "German",
+    "en": "English",
+    "es": "Spanish",
+    "fr": "French",
+    "it": "Italian",
+    "nl": "Dutch",
+    "pt": "Portuguese",
+}
+
+
+@dataclass(frozen=True)
+class LanguagePair:
+    """A ``source-target`` pair of ISO 639-1 codes, e.g. ``en-pt``."""
+
+    source: str
+    target: str
+
+    @classmethod
+    def parse(cls, code: str) -> "LanguagePair":
+        parts = code.lower().split("-")
+        if len(parts) != 2 or not all(part.isalpha() for part in parts):
+            raise ValueError(f"Language pair codes look like 'en-pt', got {code!r}")
+        return cls(*parts)
+
+    @property
+    def code(self) -> str:
+        return f"{self.source}-{self.target}"
+
+    @property
+    def languages(self) -> Tuple[str, str]:
+        """Display names of the source and target languages."""
+        return tuple(LANGUAGE_NAMES.get(language, language.upper()) for language in (self.source, self.target))
+
+    @property
+    def relationship_types(self) -> List[str]:
+        return [
+            "cognates",
+            "false_friends",
+            f"loanword_{self.source}_to_{self.target}",
+            f"loanword_{self.target}_to_{self.source}",
+        ]
+
+    @property
+    def schema(self) -> Dict[str, Dict[str, object]]:
+        """``SCHEMA`` with neutral column names and this pair's relationship labels."""
+        schema = {PAIR_COLUMNS.get(column, column): spec for column, spec in SCHEMA.items()}
+        schema["relationship_type"] = {**SCHEMA["relationship_type"], "categories": self.relationship_types}
+        return schema
+
+
+def partition_path(pair: str, pairs_dir: Path = PAIRS_DIR) -> Path:
+    code = LanguagePair.parse(pair).code
+    return Path(pairs_dir) / f"pair={code}" / f"masterframe_{code}.csv"
+
+
+def discover_pairs(pairs_dir: Path = PAIRS_DIR) -> List[str]:
+    """Codes of the pairs with a partition, plus ``DEFAULT_PAIR`` if the masterframe exists."""
+    codes = {path.parent.name.split("=", 1)[1] for path in Path(pairs_dir).glob("pair=*/masterframe_*.csv")}
+    if DATA_PATH.exists():
+        codes.add(DEFAULT_PAIR)
+    return sorted(codes)
+
+
+def pair_source(pair: str, pairs_dir: Path = PAIRS_DIR) -> Tuple[Path, Dict[str, Dict[str, object]], bool]:
+    """CSV path and schema of ``pair``, and whether it is the (wide) published masterframe."""
+    path = partition_path(pair, pairs_dir)
+    if path.exists():
+        return path, LanguagePair.parse(pair).schema, False
+    if LanguagePair.parse(pair).code == DEFAULT_PAIR:
+        return DATA_PATH, SCHEMA, True
+    raise FileNotFoundError(f"No partition for {pair} at {path}")
+
+
+def pair_option(
+    parser: argparse.ArgumentParser,
+    code: str,
+    pairs_dir: Path = PAIRS_DIR,
+) -> Tuple[LanguagePair, Path, Dict[str, Dict[str, object]], bool]:
+    """``LanguagePair`` and ``pair_source`` of a ``--pair`` option; bad or missing pairs exit via ``parser``."""
+    try:
+        pair = LanguagePair.parse(code)
+        return (pair, *pair_source(pair.code, pairs_dir))
+    except ValueError as error:
+        parser.error(str(error))
+    except FileNotFoundError as error:
+        parser.error(f"{error}; build it with 'cli.py pairs split <long-format csv>'")
+
+
+def load_pair(pair: str, columns: Optional[Iterable[str]] = None, pairs_dir: Path = PAIRS_DIR) -> pd.DataFrame:
+    """One pair's rows with neutral column names, optionally restricted to ``columns``."""
+    path, schema, published = pair_source(pair, pairs_dir)
+    selected = list(columns) if columns is not None else None
+    if not published:
+        return load_masterframe(selected, path, schema=schema)
+    wide = [MASTERFRAME_COLUMNS.get(column, column) for column in selected] if selected is not None else None
+    return load_masterframe(wide, path).rename(columns=PAIR_COLUMNS)
+
+
+def load_pairs(
+    pairs: Optional[Sequence[str]] = None,
+    columns: Optional[Iterable[str]] = None,
+    pairs_dir: Path = PAIRS_DIR,
+) -> pd.DataFrame:
+    """Long-format frame of ``pairs`` (all discovered pairs if ``None``) with a ``language_pair`` column.
+
+    Only the requested partitions are read. ``relationship_type`` stays
+    categorical over the union of the pairs' labels.
+    """
+    codes = [LanguagePair.parse(pair).code for pair in pairs] if pairs is not None else discover_pairs(pairs_dir)
+    selected = list(columns) if columns is not None else None
+    frames = [load_pair(code, selected, pairs_dir) for code in codes]
+    if not frames:
+        return pd.DataFrame(columns=[PAIR_KEY, *(selected or [])])
+    relationships = [frame["relationship_type"] for frame in frames if "relationship_type" in frame]
+    df = pd.concat(frames, ignore_index=True)
+    if relationships:
+        df["relationship_type"] = union_categoricals(relationships)
+    keys = np.repeat(np.arange(len(frames), dtype=np.int32), [len(frame) for frame in frames])
+    df.insert(0, PAIR_KEY, pd.Categorical.from_codes(keys, categories=codes))
+    return df
+
+
+def write_partitions(df: pd.DataFrame, pairs_dir: Path = PAIRS_DIR) -> List[Path]:
+    """Split a long-format frame on ``language_pair`` into validated partition CSVs."""
+    paths = []
+    for code, rows in df.groupby(PAIR_KEY, sort=True, observed=True):
+        pair = LanguagePair.parse(str(code))
+        partition = apply_schema(rows.drop(columns=PAIR_KEY).reset_index(drop=True), pair.schema)
+        path = partition_path(pair.code, pairs_dir)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        partition.to_csv(tmp_path, index=False)
+        os.replace(tmp_path, path)
+        paths.append(path)
+    return paths
+
+
+def analyze_pair(pair: str, pairs_dir: Path = PAIRS_DIR, plot_dir: Optional[Path] = None) -> Dict[str, object]:
+    """Business impact (and optionally the attestation plot) of one pair, as a summary dict."""
+    from calculate_business_impact import FALSE_FRIENDS, METRIC_COLUMNS, compute_business_impact
+
+    start = time.perf_counter()
+    df = load_pair(pair, METRIC_COLUMNS, pairs_dir)
+    result = compute_business_impact(df)
+    counts = result.relationship_counts.sum()
+    summary: Dict[str, object] = {
+        "pair": pair,
+        "rows": len(df),
+        "cognates": int(counts.get("cognates", 0)),
+        "false_friends": result.total_false_friends,
+        "loanwords": int(counts[[label for label in counts.index if label.startswith("loanword_")]].sum()),
+        "ffr": result.total_false_friends / len(df) * 100 if len(df) else 0.0,
+        "high_risk_domains": len(result.high_risk_domains),
+        "high_risk_coverage": result.high_risk_coverage,
+        "high_freq_pct": result.high_freq_pct,
+        "pareto_position": result.pareto_position,
+        "domains_pct": result.domains_pct,
+        "domain_ffr": result.domain_stats["ffr"].to_dict(),
+        "domain_false_friends": result.domain_stats[FALSE_FRIENDS].to_dict(),
+    }
+    if plot_dir is not None:
+        from regenerate_interactive_plot import DOMAIN_MAP, apply_jitter, build_figure, load_dataset, write_figure
+
+        plot_df = apply_jitter(load_dataset(DOMAIN_MAP.keys(), pair=pair, pairs_dir=pairs_dir))
+        output = Path(plot_dir) / f"interactive_{pair}.html"
+        write_figure(build_figure(plot_df, LanguagePair.parse(pair).languages), output)
+        summary["plot"] = str(output)
+    summary["seconds"] = time.perf_counter() - start
+    return summary
+
+
+def run_pairs(
+    pairs: Optional[Sequence[str]] = None,
+    pairs_dir: Path = PAIRS_DIR,
+    workers: Optional[int] = None,
+    plot_dir: Optional[Path] = None,
+) -> List[Dict[str, object]]:
+    """``analyze_pair`` for each pair, spread over ``workers`` processes (default: all cores)."""
+    codes = [LanguagePair.parse(pair).code for pair in pairs] if pairs is not None else discover_pairs(pairs_dir)
+    for code in codes:
+        pair_source(code, pairs_dir)  # fail before starting workers
+    workers = min(workers or os.cpu_count() or 1, len(codes))
+    if workers <= 1:
+        return [analyze_pair(code, pairs_dir, plot_dir) for code in codes]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(analyze_pair, code, pairs_dir, plot_dir) for code in codes]
+        return [future.result() for future in futures]
+
+
+def merge_summaries(summaries: Sequence[Dict[str, object]]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Cross-pair headline table (one row per pair) and domain x pair false-friend rate table."""
+    headline = pd.DataFrame(
+        [{key: value for key, value in summary.items() if not key.startswith("domain_")} for summary in summaries]
+    ).set_index("pair")
+    domain_ffr = pd.DataFrame({summary["pair"]: pd.Series(summary["domain_ffr"]) for summary in summaries})
+    domain_ffr.index.name = "cultural_domain"
+    domain_ffr["spread"] = domain_ffr.max(axis=1) - domain_ffr.min(axis=1)
+    return headline, domain_ffr.sort_values("spread", ascending=False)
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pairs-dir", type=Path, default=PAIRS_DIR)
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="List the available language pairs")
+    split = commands.add_parser("split", help="Write partitions from a long-format CSV with a language_pair column")
+    split.add_argument("csv", type=Path)
+    run = commands.add_parser("run", help="Analyse pairs in parallel and print cross-pair summaries")
+    run.add_argument("--pairs", nargs="+", help="Pair codes (default: every available pair)")
+    run.add_argument("--workers", type=int, help="Worker processes (default: all cores)")
+    run.add_argument("--plots", type=Path, metavar="DIR", help="Also write each pair's attestation plot to DIR")
+    run.add_argument("--output-dir", type=Path, help="Write the summary tables as CSV to this directory")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = parse_args(argv)
+    if args.command == "list":
+        for code in discover_pairs(args.pairs_dir):
+            path, _, published = pair_source(code, args.pairs_dir)
+            source, target = LanguagePair.parse(code).languages
+            print(f"{code}  {source}-{target}  {path}{' (published masterframe)' if published else ''}")
+        return
+    if args.command == "split":
+        for path in write_partitions(pd.read_csv(args.csv), args.pairs_dir):
+            print(f"Partition written to {path}")
+        return
+
+    start = time.perf_counter()
+    summaries = run_pairs(args.pairs, args.pairs_dir, args.workers, args.plots)
+    headline, domain_ffr = merge_summaries(summaries)
+    print(f"Analysed {len(summaries)} language pair(s) in {time.perf_counter() - start:.2f}s\n")
+    print(headline.to_string(float_format=lambda value: f"{value:.1f}"))
+    print("\nFalse-friend rate (%) by domain and pair:")
+    print(domain_ffr.to_string(float_format=lambda value: f"{value:.1f}"))
+    if args.output_dir:
+        args.output_dir.mkdir(parents=True, exist_ok=True)
+        headline.to_csv(args.output_dir / "pair_summary.csv")
+        domain_ffr.to_csv(args.output_dir / "domain_ffr_by_pair.csv")
+        print(f"\nSummary tables written to {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
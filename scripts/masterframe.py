@@ -0,0 +1,494 @@
+#!/usr/bin/env python3
+"""Shared loader for the language analysis masterframe with a columnar cache."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import zipfile
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA_PATH = ROOT / "language_analysis_masterframe25OCT.csv"
+CACHE_DIR = ROOT / ".cache"
+
+# Bump whenever the on-disk cache layout changes so stale caches are rebuilt.
+CACHE_VERSION = 2
+HASH_CHUNK_SIZE = 1 << 20  # bytes
+CHUNK_ROWS = 250_000
+
+# cache path -> ((size, mtime_ns), decoded frame) while hold_in_memory() is on
+_IN_MEMORY: Optional[Dict[str, tuple]] = None
+
+RELATIONSHIP_TYPES = ["cognates", "false_friends", "loanword_en_to_es", "loanword_es_to_en"]
+PARTS_OF_SPEECH = ["noun", "adjective", "adverb", "verb", "other"]
+CULTURAL_DOMAINS = [
+    "arts_entertainment",
+    "clothing_appearance",
+    "economics_commerce",
+    "education_knowledge",
+    "emotions_psychology",
+    "family_kinship",
+    "festivals_celebrations",
+    "food_cuisine",
+    "government_politics",
+    "health_medicine",
+    "housing_architecture",
+    "language_communication",
+    "nature_geography",
+    "other",
+    "religion_spirituality",
+    "social",
+    "sports_recreation",
+    "technology_tools",
+    "time_calendar",
+    "transportation",
+    "values_ethics",
+]
+
+# Declared in-memory layout for every masterframe column. ``min``/``max`` are
+# inclusive bounds checked by ``validate_masterframe``; component bounds follow
+# the point budget in the methodology report (25/35/20/20 of 100). ``decimals``
+# is the precision the CSV is published at, used to widen float32 back exactly.
+SCHEMA: Dict[str, Dict[str, object]] = {
+    "english_word": {"dtype": "str"},
+    "spanish_word": {"dtype": "str"},
+    "spanish_meaning_ff": {"dtype": "str", "nullable": True},
+    "relationship_type": {"dtype": "category", "categories": RELATIONSHIP_TYPES},
+    "part_of_speech": {"dtype": "category", "categories": PARTS_OF_SPEECH},
+    "cultural_domain": {"dtype": "category", "categories": CULTURAL_DOMAINS},
+    "first_attestation_english": {"dtype": "Int16", "nullable": True, "min": 0, "max": 2100},
+    "first_attestation_spanish": {"dtype": "Int16", "nullable": True, "min": 0, "max": 2100},
+    "jaccard_similarity": {"dtype": "float32", "min": 0.0, "max": 1.0, "decimals": 3},
+    "levenshtein_similarity": {"dtype": "float32", "min": 0.0, "max": 1.0, "decimals": 3},
+    "complexity_syllables": {"dtype": "int8", "min": 1, "max": 100},
+    "complexity_length": {"dtype": "int16", "min": 1, "max": 1000},
+    "complexity_frequency_complexity": {"dtype": "float32", "min": 0.0, "max": 7.0, "decimals": 2},
+    "complexity_semantic_complexity": {"dtype": "int16", "min": 0, "max": 1000},
+    "complexity_overall_complexity": {"dtype": "float32", "min": 0.0, "max": 100.0, "decimals": 1},
+    "complexity_syll_component": {"dtype": "float32", "min": 0.0, "max": 25.0, "decimals": 1},
+    "complexity_freq_component": {"dtype": "float32", "min": 0.0, "max": 35.0, "decimals": 1},
+    "complexity_semantic_component": {"dtype": "float32", "min": 0.0, "max": 20.0, "decimals": 1},
+    "complexity_length_component": {"dtype": "float32", "min": 0.0, "max": 20.0, "decimals": 1},
+}
+
+STRING_COLUMNS = [column for column, spec in SCHEMA.items() if spec["dtype"] == "str"]
+CATEGORY_COLUMNS = [column for column, spec in SCHEMA.items() if spec["dtype"] == "category"]
+NUMERIC_COLUMNS = [column for column in SCHEMA if column not in STRING_COLUMNS + CATEGORY_COLUMNS]
+
+
+def validate_masterframe(df: pd.DataFrame, schema: Mapping[str, Dict[str, object]] = SCHEMA) -> None:
+    """Reject frames whose values fall outside ``schema`` (the masterframe's ``SCHEMA`` by default).
+
+    Each column is checked with whole-array masks: unknown categories,
+    unparseable or non-integral numbers, out-of-range values and missing
+    values in non-nullable columns. All failures are reported together.
+    """
+    problems: List[str] = []
+    for column, spec in schema.items():
+        if column not in df.columns:
+            continue
+        series = df[column]
+        missing = series.isna().to_numpy()
+        dtype = spec["dtype"]
+
+        if dtype == "category":
+            invalid = ~missing & ~series.isin(spec["categories"]).to_numpy()
+        elif dtype == "str":
+            invalid = np.zeros(len(series), dtype=bool)
+        else:
+            values = pd.to_numeric(series, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+            invalid = ~missing & np.isnan(values)
+            with np.errstate(invalid="ignore"):
+                invalid |= values < spec["min"]
+                invalid |= values > spec["max"]
+                if not str(dtype).startswith("float"):
+                    invalid |= ~np.isnan(values) & (values != np.floor(values))
+
+        if not spec.get("nullable", False):
+            invalid |= missing
+        if invalid.any():
+            rows = df.index[invalid][:5].tolist()
+            problems.append(f"{column}: {int(invalid.sum())} invalid value(s), e.g. rows {rows}")
+
+    if problems:
+        raise ValueError("Masterframe failed schema validation:\n  " + "\n  ".join(problems))
+
+
+def float64_values(series: pd.Series, schema: Mapping[str, Dict[str, object]] = SCHEMA) -> np.ndarray:
+    """Widen a column to float64, undoing float32 rounding where ``decimals`` is declared.
+
+    Statistics such as quantiles and confidence intervals should match what a
+    float64 ``pd.read_csv`` parse would give, so float32 columns are rounded
+    back to their published precision. Pass the ``schema`` the frame was
+    loaded with when it is not the masterframe's.
+    """
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    decimals = schema.get(series.name, {}).get("decimals")
+    if decimals is not None and series.dtype == np.float32:
+        values = np.round(values, decimals)
+    return values
+
+
+def apply_schema(df: pd.DataFrame, schema: Mapping[str, Dict[str, object]] = SCHEMA) -> pd.DataFrame:
+    """Validate ``df`` and cast each known column to its declared dtype."""
+    validate_masterframe(df, schema)
+    typed = {}
+    for column in df.columns:
+        spec = schema.get(column)
+        series = df[column]
+        if spec is None or spec["dtype"] == "str":
+            typed[column] = series
+        elif spec["dtype"] == "category":
+            typed[column] = pd.Series(pd.Categorical(series, categories=spec["categories"]), index=df.index)
+        else:
+            typed[column] = pd.to_numeric(series, errors="coerce").astype(spec["dtype"])
+    return pd.DataFrame(typed, index=df.index)
+
+
+def _cache_paths(csv_path: Path, schema: Mapping[str, Dict[str, object]] = SCHEMA) -> Dict[str, Path]:
+    """Cache files of ``csv_path`` parsed with ``schema``.
+
+    The name carries a digest of the resolved CSV path and the schema, so
+    same-named CSVs in different directories (benchmark frames, pair
+    partitions) and different schemas never share a cache.
+    """
+    csv_path = Path(csv_path)
+    key = hashlib.sha256(str(csv_path.resolve()).encode("utf-8"))
+    key.update(json.dumps(schema, sort_keys=True, default=str).encode("utf-8"))
+    stem = f"{csv_path.stem}-{key.hexdigest()[:12]}"
+    return {
+        "data": CACHE_DIR / f"{stem}.npz",
+        "meta": CACHE_DIR / f"{stem}.json",
+    }
+
+
+def file_fingerprint(csv_path: Path, with_hash: bool = True) -> Dict[str, object]:
+    """Return the size, mtime and (optionally) content hash of ``csv_path``."""
+    stat = csv_path.stat()
+    fingerprint: Dict[str, object] = {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+    if with_hash:
+        digest = hashlib.sha256()
+        with open(csv_path, "rb") as handle:
+            for chunk in iter(lambda: handle.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        fingerprint["sha256"] = digest.hexdigest()
+    return fingerprint
+
+
+def _read_meta(meta_path: Path) -> Optional[Dict[str, object]]:
+    try:
+        with open(meta_path, "r", encoding="utf-8") as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_atomic(path: Path, write) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as handle:
+        write(handle)
+    os.replace(tmp_path, path)
+
+
+def _write_meta(meta_path: Path, meta: Dict[str, object]) -> None:
+    _write_atomic(meta_path, lambda handle: handle.write(json.dumps(meta, indent=2).encode("utf-8")))
+
+
+def _encode_frame(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Flatten a typed frame into plain arrays that ``np.load`` can read without pickle."""
+    arrays: Dict[str, np.ndarray] = {}
+    for column in df.columns:
+        series = df[column]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            arrays[f"{column}__codes"] = series.cat.codes.to_numpy()
+        elif column in STRING_COLUMNS or not pd.api.types.is_numeric_dtype(series.dtype):
+            codes, uniques = pd.factorize(series, use_na_sentinel=True)
+            arrays[f"{column}__codes"] = codes.astype(np.int32)
+            arrays[f"{column}__categories"] = np.asarray(uniques, dtype=str)
+        elif isinstance(series.dtype, pd.api.extensions.ExtensionDtype):
+            arrays[column] = series.to_numpy(dtype=series.dtype.numpy_dtype, na_value=0)
+            arrays[f"{column}__mask"] = series.isna().to_numpy()
+        else:
+            arrays[column] = series.to_numpy()
+    return arrays
+
+
+def _decode_column(
+    npz: Mapping[str, np.ndarray],
+    column: str,
+    schema: Mapping[str, Dict[str, object]] = SCHEMA,
+) -> pd.Series:
+    spec = schema.get(column, {})
+    if spec.get("dtype") == "category":
+        categories = pd.CategoricalDtype(spec["categories"])
+        return pd.Series(pd.Categorical.from_codes(npz[f"{column}__codes"], dtype=categories), name=column)
+    if f"{column}__categories" in npz:
+        codes = npz[f"{column}__codes"]
+        categories = npz[f"{column}__categories"].astype(object)
+        values = np.empty(len(codes), dtype=object)
+        present = codes >= 0
+        values[present] = categories[codes[present]]
+        values[~present] = np.nan
+        return pd.Series(values, name=column)
+    if f"{column}__mask" in npz:
+        values = pd.arrays.IntegerArray(npz[column], npz[f"{column}__mask"])
+        return pd.Series(values, name=column)
+    return pd.Series(npz[column], name=column)
+
+
+def frame_memory(df: pd.DataFrame) -> Dict[str, int]:
+    """Return the deep in-memory size of each column of ``df`` in bytes."""
+    return {column: int(size) for column, size in df.memory_usage(deep=True, index=False).items()}
+
+
+def memory_savings(
+    df: pd.DataFrame,
+    csv_path: Path = DATA_PATH,
+    schema: Mapping[str, Dict[str, object]] = SCHEMA,
+) -> Optional[Dict[str, int]]:
+    """Compare ``df`` with the untyped ``pd.read_csv`` footprint of the same columns.
+
+    The untyped sizes are recorded for the full CSV when the cache is built and
+    are scaled to the row count of ``df``; derived columns are ignored. Returns
+    ``None`` if no cache exists for ``csv_path``.
+    """
+    meta = _read_meta(_cache_paths(Path(csv_path), schema)["meta"])
+    if meta is None or "raw_memory" not in meta or not meta["rows"]:
+        return None
+    columns = [column for column in df.columns if column in meta["raw_memory"]]
+    raw = int(sum(meta["raw_memory"][column] for column in columns) * len(df) / meta["rows"])
+    typed = sum(size for column, size in frame_memory(df).items() if column in columns)
+    return {"raw_bytes": raw, "typed_bytes": typed, "saved_bytes": raw - typed}
+
+
+def format_memory_savings(
+    df: pd.DataFrame,
+    csv_path: Path = DATA_PATH,
+    schema: Mapping[str, Dict[str, object]] = SCHEMA,
+) -> str:
+    """One-line summary of ``memory_savings`` for script output."""
+    savings = memory_savings(df, csv_path, schema)
+    if savings is None or savings["raw_bytes"] == 0:
+        return f"{len(df)} rows, {sum(frame_memory(df).values()) / 1e6:.2f} MB in memory"
+    typed_mb = savings["typed_bytes"] / 1e6
+    pct = savings["saved_bytes"] / savings["raw_bytes"] * 100
+    return (
+        f"{len(df)} rows, {typed_mb:.2f} MB in memory "
+        f"(saved {savings['saved_bytes'] / 1e6:.2f} MB, {pct:.0f}% vs. untyped CSV parse)"
+    )
+
+
+def build_cache(
+    csv_path: Path = DATA_PATH,
+    fingerprint: Optional[Dict[str, object]] = None,
+    schema: Mapping[str, Dict[str, object]] = SCHEMA,
+) -> Path:
+    """Parse and validate ``csv_path`` once and write its typed columnar cache."""
+    csv_path = Path(csv_path)
+    paths = _cache_paths(csv_path, schema)
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+    if fingerprint is None:
+        fingerprint = file_fingerprint(csv_path)
+    raw = pd.read_csv(csv_path)
+    df = apply_schema(raw, schema)
+    arrays = _encode_frame(df)
+    _write_atomic(paths["data"], lambda handle: np.savez(handle, **arrays))
+    _write_meta(
+        paths["meta"],
+        {
+            "version": CACHE_VERSION,
+            "columns": list(df.columns),
+            "rows": len(df),
+            "raw_memory": frame_memory(raw),
+            **fingerprint,
+        },
+    )
+    return paths["data"]
+
+
+def ensure_cache(csv_path: Path = DATA_PATH, schema: Mapping[str, Dict[str, object]] = SCHEMA) -> Dict[str, object]:
+    """Return the cache metadata for ``csv_path``, rebuilding only if the CSV changed.
+
+    A matching size and mtime is trusted as-is. If only the mtime moved (e.g. a
+    fresh checkout), the content hash decides whether the cache is still valid.
+    """
+    csv_path = Path(csv_path)
+    paths = _cache_paths(csv_path, schema)
+    meta = _read_meta(paths["meta"])
+    current = file_fingerprint(csv_path, with_hash=False)
+
+    if meta is not None and meta.get("version") == CACHE_VERSION and paths["data"].exists():
+        if meta["size"] == current["size"] and meta["mtime_ns"] == current["mtime_ns"]:
+            return meta
+        if meta["size"] == current["size"]:
+            current = file_fingerprint(csv_path)
+            if meta.get("sha256") == current["sha256"]:
+                meta["mtime_ns"] = current["mtime_ns"]
+                _write_meta(paths["meta"], meta)
+                return meta
+
+    if "sha256" not in current:
+        current = file_fingerprint(csv_path)
+    build_cache(csv_path, current, schema)
+    return _read_meta(paths["meta"])
+
+
+def load_masterframe(
+    columns: Optional[Iterable[str]] = None,
+    csv_path: Path = DATA_PATH,
+    use_cache: bool = True,
+    schema: Mapping[str, Dict[str, object]] = SCHEMA,
+) -> pd.DataFrame:
+    """Load the masterframe with ``schema`` dtypes, optionally restricted to ``columns``.
+
+    With ``use_cache`` the CSV is parsed only when it has changed since the last
+    load; otherwise the typed arrays are read straight from the cache. Other
+    files in the masterframe's layout, such as the language pair partitions,
+    pass their own ``schema``.
+    """
+    csv_path = Path(csv_path)
+    selected: Optional[List[str]] = list(columns) if columns is not None else None
+
+    if not use_cache:
+        raw = pd.read_csv(csv_path, usecols=selected)[selected] if selected else pd.read_csv(csv_path)
+        return apply_schema(raw, schema)
+
+    meta = ensure_cache(csv_path, schema)
+    available = meta["columns"]
+    if selected is None:
+        selected = list(available)
+    missing = [column for column in selected if column not in available]
+    if missing:
+        raise KeyError(f"Columns not in {csv_path.name}: {', '.join(missing)}")
+
+    cache_path = _cache_paths(csv_path, schema)["data"]
+    if _IN_MEMORY is not None:
+        key = str(cache_path)
+        version = (meta["size"], meta["mtime_ns"])
+        held = _IN_MEMORY.get(key)
+        if held is None or held[0] != version:
+            with np.load(cache_path, allow_pickle=False) as npz:
+                frame = pd.DataFrame({column: _decode_column(npz, column, schema) for column in available})
+            held = _IN_MEMORY[key] = (version, frame)
+        return held[1][selected].copy()
+
+    with np.load(cache_path, allow_pickle=False) as npz:
+        data = {column: _decode_column(npz, column, schema) for column in selected}
+    return pd.DataFrame(data, columns=selected)
+
+
+def hold_in_memory(enabled: bool = True) -> None:
+    """Keep decoded masterframes in this process for later ``load_masterframe`` calls.
+
+    Meant for long-lived processes serving repeated requests; each call still
+    checks the CSV's size and mtime and returns a copy the caller may modify.
+    """
+    global _IN_MEMORY
+    _IN_MEMORY = {} if enabled else None
+
+
+def _cache_is_fresh(csv_path: Path, meta: Optional[Dict[str, object]]) -> bool:
+    if meta is None or meta.get("version") != CACHE_VERSION:
+        return False
+    current = file_fingerprint(csv_path, with_hash=False)
+    return meta["size"] == current["size"] and meta["mtime_ns"] == current["mtime_ns"]
+
+
+def _iter_cache_chunks(
+    csv_path: Path,
+    columns: List[str],
+    chunksize: int,
+    schema: Mapping[str, Dict[str, object]] = SCHEMA,
+) -> Iterator[pd.DataFrame]:
+    """Stream row slices of the ``.npz`` cache without loading whole columns.
+
+    ``np.savez`` stores members uncompressed, so each ``.npy`` member is read
+    sequentially from the zip. Lookup tables for free-text string columns
+    (``<column>__categories``) are the only arrays loaded in full.
+    """
+    paths = _cache_paths(csv_path, schema)
+    meta = _read_meta(paths["meta"])
+    rows = int(meta["rows"])
+    with zipfile.ZipFile(paths["data"]) as archive:
+        members = {name[:-4] for name in archive.namelist()}
+        static: Dict[str, np.ndarray] = {}
+        streams = {}
+        for key in sorted(members):
+            column = key.split("__")[0]
+            if column not in columns:
+                continue
+            handle = archive.open(key + ".npy")
+            if key.endswith("__categories"):
+                static[key] = np.lib.format.read_array(handle, allow_pickle=False)
+                handle.close()
+                continue
+            version = np.lib.format.read_magic(handle)
+            if version == (1, 0):
+                _, _, dtype = np.lib.format.read_array_header_1_0(handle)
+            else:
+                _, _, dtype = np.lib.format.read_array_header_2_0(handle)
+            streams[key] = (handle, dtype)
+
+        try:
+            for start in range(0, rows, chunksize):
+                count = min(chunksize, rows - start)
+                arrays = dict(static)
+                for key, (handle, dtype) in streams.items():
+                    arrays[key] = np.frombuffer(handle.read(count * dtype.itemsize), dtype=dtype, count=count)
+                chunk = pd.DataFrame(
+                    {column: _decode_column(arrays, column, schema) for column in columns}, columns=columns
+                )
+                chunk.index = pd.RangeIndex(start, start + count)
+                yield chunk
+        finally:
+            for handle, _ in streams.values():
+                handle.close()
+
+
+def iter_masterframe_chunks(
+    columns: Optional[Iterable[str]] = None,
+    chunksize: int = CHUNK_ROWS,
+    csv_path: Path = DATA_PATH,
+    source: str = "auto",
+    schema: Mapping[str, Dict[str, object]] = SCHEMA,
+) -> Iterator[pd.DataFrame]:
+    """Yield the masterframe in typed chunks of at most ``chunksize`` rows.
+
+    ``source`` is ``"csv"`` (parse and validate the CSV chunk by chunk),
+    ``"cache"`` (stream an up-to-date columnar cache) or ``"auto"`` (the cache
+    if it is fresh, otherwise the CSV). The cache is never rebuilt here, so
+    memory stays bounded by ``chunksize`` regardless of the file size.
+    """
+    csv_path = Path(csv_path)
+    selected = list(columns) if columns is not None else None
+    paths = _cache_paths(csv_path, schema)
+    meta = _read_meta(paths["meta"])
+    fresh = _cache_is_fresh(csv_path, meta) and paths["data"].exists()
+
+    if source == "cache" and not fresh:
+        raise FileNotFoundError(f"No up-to-date cache for {csv_path.name}; run masterframe.py first")
+    if source not in ("csv", "cache", "auto"):
+        raise ValueError(f"Unknown chunk source: {source!r}")
+
+    if source == "cache" or (source == "auto" and fresh):
+        selected = selected or list(meta["columns"])
+        yield from _iter_cache_chunks(csv_path, selected, chunksize, schema)
+        return
+
+    for chunk in pd.read_csv(csv_path, usecols=selected, chunksize=chunksize):
+        yield apply_schema(chunk[selected] if selected else chunk, schema)
+
+
+if __name__ == "__main__":
+    meta = ensure_cache()
+    print(f"Cache ready for {DATA_PATH.name}: {meta['rows']} rows, sha256 {meta['sha256'][:12]}")
+    print(f"Typed masterframe: {format_memory_savings(load_masterframe())}")
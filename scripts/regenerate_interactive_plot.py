@@ -2,27 +2,65 @@
 """Regenerate the Plotly interactive scatter plot with jittered points."""
 from __future__ import annotations
 
+import argparse
+import re
 from pathlib import Path
-from typing import Dict, Iterable
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.io as pio
+from plotly.colors import qualitative
+
+from instrumentation import configure as configure_profiling, span
+from language_pairs import (
+    DEFAULT_PAIR,
+    MASTERFRAME_COLUMNS,
+    PAIR_COLUMNS,
+    PAIRS_DIR,
+    load_pair,
+    pair_option,
+)
+from masterframe import DATA_PATH, format_memory_savings, load_masterframe
 
 ROOT = Path(__file__).resolve().parents[1]
-DATA_PATH = ROOT / "language_analysis_masterframe25OCT.csv"
 OUTPUT_PATH = ROOT / "assets" / "interactive_option_8_enhanced.html"
+LARGE_OUTPUT_PATH = ROOT / "assets" / "interactive_all_domains.html"
+PAIR_OUTPUT_DIR = ROOT / "assets"  # other language pairs get <default output stem>_<pair>.html
 
 DOMAIN_MAP: Dict[str, Dict[str, str]] = {
     "religion_spirituality": {"label": "Religion", "color": "#A52A2A"},
     "technology_tools": {"label": "Technology", "color": "#4682B4"},
 }
 
+PLOT_COLUMNS = [
+    "english_word",
+    "spanish_word",
+    "cultural_domain",
+    "first_attestation_english",
+    "first_attestation_spanish",
+    "levenshtein_similarity",
+    "complexity_overall_complexity",
+]
+# Source and target language labels; templates and titles are written for these
+LANGUAGES = ("English", "Spanish")
+
 X_JITTER_RANGE = (-3.0, 3.0)  # years
 Y_JITTER_RANGE = (-5.0, 5.0)  # years
 RANDOM_SEED = 2025
 
+# Relaxed layout: minimum marker separation as a fraction of each axis span.
+# About the jitter amplitude over the published spans; moves never exceed the jitter range.
+MIN_SEPARATION = 0.002
+LATTICE_STEP = 0.5  # spacing of candidate sites for displaced points, in separations
+SEARCH_RADIUS = 8  # farthest a point is moved on either axis, in separations
+LATTICE_CHUNK = 64  # candidate sites in the first vectorized check; doubles per step
+
+# Large-data mode: beyond this many points, plot per-domain density bins.
+DENSITY_THRESHOLD = 50_000
+DENSITY_BINS = (120, 80)  # x bins, y bins
+
 HOVER_TEMPLATE = (
     "<b style=\"font-size:16px\">%{customdata[0]} / %{customdata[1]}</b><br><br>"
     "<b>Domain:</b> %{meta}<br>"
@@ -34,19 +72,83 @@ HOVER_TEMPLATE = (
     "<extra></extra>"
 )
 
+# customdata columns in large-data mode: spanish word code, english word code,
+# spanish year, english year, time gap. Words are filled in client-side from
+# the deduplicated ``layout.meta.words`` lookup by ``WORD_LOOKUP_SCRIPT``.
+LARGE_HOVER_TEMPLATE = (
+    "<b style=\"font-size:16px\">%{text} / %{hovertext}</b><br><br>"
+    "<b>Domain:</b> %{meta}<br>"
+    "<b>Spanish Word:</b> %{text}<br>"
+    "<b>English Word:</b> %{hovertext}<br>"
+    "<b>English First Attestation:</b> %{customdata[3]}<br>"
+    "<b>Spanish First Attestation:</b> %{customdata[2]}<br>"
+    "<b>Time Gap:</b> %{customdata[4]} years"
+    "<extra></extra>"
+)
+
+DENSITY_HOVER_TEMPLATE = (
+    "<b>Domain:</b> %{meta}<br>"
+    "<b>Word pairs in bin:</b> %{customdata}<br>"
+    "<b>English Attestation:</b> ~%{x:.0f}<br>"
+    "<b>Time Gap:</b> ~%{y:.0f} years"
+    "<extra></extra>"
+)
+
+WORD_LOOKUP_SCRIPT = """
+(function () {
+  var gd = document.getElementById('{plot_id}');
+  var words = (gd.layout.meta || {}).words;
+  if (!words) { return; }
+  var types = {i1: Int8Array, u1: Uint8Array, i2: Int16Array, u2: Uint16Array,
+               i4: Int32Array, u4: Uint32Array, f4: Float32Array, f8: Float64Array};
+  function rows(data) {
+    if (!data || !data.bdata) { return data; }
+    var raw = atob(data.bdata), bytes = new Uint8Array(raw.length);
+    for (var i = 0; i < raw.length; i++) { bytes[i] = raw.charCodeAt(i); }
+    var flat = new types[data.dtype](bytes.buffer);
+    var width = parseInt(String(data.shape).split(',')[1], 10), out = [];
+    for (var r = 0; r < flat.length; r += width) { out.push(flat.subarray(r, r + width)); }
+    return out;
+  }
+  var text = [], hovertext = [], indices = [];
+  gd.data.forEach(function (trace, index) {
+    if (trace.hovertemplate.indexOf('%{hovertext}') === -1) { return; }
+    var data = rows(trace.customdata);
+    text.push(data.map(function (row) { return words[row[0]]; }));
+    hovertext.push(data.map(function (row) { return words[row[1]]; }));
+    indices.push(index);
+  });
+  if (indices.length) { Plotly.restyle(gd, {text: text, hovertext: hovertext}, indices); }
+})();
+"""
+
+
+def localize(text: str, languages: Tuple[str, str] = LANGUAGES) -> str:
+    """``text`` with the English/Spanish labels replaced by another pair's language names."""
+    names = dict(zip(LANGUAGES, languages))
+    return re.sub("|".join(LANGUAGES), lambda match: names[match.group()], text)
 
-def load_dataset(domains: Iterable[str]) -> pd.DataFrame:
-    """Load and clean the master dataset with the required fields."""
-    df = pd.read_csv(DATA_PATH)
-    df = df[df["cultural_domain"].isin(domains)].copy()
 
-    numeric_cols = [
-        "first_attestation_english",
-        "first_attestation_spanish",
-        "levenshtein_similarity",
-        "complexity_overall_complexity",
-    ]
-    df[numeric_cols] = df[numeric_cols].apply(pd.to_numeric, errors="coerce")
+def load_dataset(
+    domains: Optional[Iterable[str]],
+    csv_path: Path = DATA_PATH,
+    pair: Optional[str] = None,
+    pairs_dir: Path = PAIRS_DIR,
+) -> pd.DataFrame:
+    """Load and clean the master dataset with the required fields (all domains if ``None``).
+
+    With ``pair``, the rows come from that language pair's partition; its
+    source and target columns take the english/spanish names used here.
+    """
+    # Numeric columns are already coerced once when the cache is built.
+    if pair is None:
+        df = load_masterframe(PLOT_COLUMNS, csv_path)
+    else:
+        df = load_pair(pair, [PAIR_COLUMNS.get(column, column) for column in PLOT_COLUMNS], pairs_dir)
+        df = df.rename(columns=MASTERFRAME_COLUMNS)
+    if domains is not None:
+        df = df[df["cultural_domain"].isin(domains)]
+    df = df.copy()
 
     df = df.dropna(subset=["first_attestation_english", "first_attestation_spanish"])
     df["first_attestation_english"] = df["first_attestation_english"].astype(int)
@@ -69,21 +171,134 @@ def apply_jitter(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def build_figure(df: pd.DataFrame) -> go.Figure:
-    fig = go.Figure()
+def _lattice_offsets(radius: int) -> np.ndarray:
+    """Integer lattice offsets within ``radius`` steps, nearest first."""
+    dx, dy = np.mgrid[-radius:radius + 1, -radius:radius + 1]
+    dx, dy = dx.ravel(), dy.ravel()
+    norm = np.hypot(dx, dy)
+    keep = norm <= radius
+    order = np.lexsort((np.arctan2(dy[keep], dx[keep]), norm[keep]))
+    return np.column_stack([dx[keep], dy[keep]])[order]
+
+
+def relax_positions(
+    x: np.ndarray,
+    y: np.ndarray,
+    min_separation: float = MIN_SEPARATION,
+    max_shift: Tuple[float, float] = (X_JITTER_RANGE[1], Y_JITTER_RANGE[1]),
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Move points only as far as needed to keep ``min_separation`` between them.
+
+    Coordinates are scaled by their axis span so the separation is a fraction
+    of the plot in both directions (1 unit below). Points are placed in
+    sorted order. A point whose own position is at least one unit from every
+    placed point stays there; that check uses a uniform grid of unit cells
+    (at most four separated points fit in a cell), so it only visits the 3x3
+    cells around it. Otherwise the point takes the nearest free site of a
+    ``LATTICE_STEP`` lattice no more than ``max_shift`` (data units, per axis)
+    from it, where a site is free if no placed point lies within one unit.
+    A point with no free site in reach stays where it is. Free/blocked flags
+    are updated as points are placed, so the search is one array lookup per
+    site over a bounded window. The sort is O(n log n) and placement O(n);
+    the result is deterministic.
+    """
+    points = np.column_stack([x, y]).astype(np.float64)
+    if not len(points):
+        return points[:, 0], points[:, 1]
+    low = points.min(axis=0)
+    span = np.ptp(points, axis=0)
+    span[span == 0] = 1.0
+    reach = np.minimum(np.asarray(max_shift, dtype=np.float64) / span / min_separation, SEARCH_RADIUS)
+    margin = int(np.ceil(reach.max())) + 2
+    unit = (points - low) / span / min_separation + margin
 
-    # Calculate fixed axis ranges based on all data (including jitter)
-    # This ensures the grid stays fixed when traces are hidden/shown
+    cells = np.ceil(unit.max(axis=0)).astype(int) + margin + 1
+    slots = np.full((cells[0], cells[1], 4), -1, dtype=np.int64)
+    crowded: Dict[Tuple[int, int], List[int]] = {}  # points kept in place despite a neighbor
+    placed = np.full((len(unit) + 1, 2), np.inf)  # last row: empty slot (-1)
+    around = np.array([(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)])
+
+    site_offsets = _lattice_offsets(int(np.ceil(reach.max() / LATTICE_STEP)) + 1)
+    site_offsets = site_offsets[(np.abs(site_offsets) * LATTICE_STEP <= reach + LATTICE_STEP).all(axis=1)]
+    blocked = np.zeros(np.ceil(cells / LATTICE_STEP).astype(int) + 1, dtype=bool)
+    window = _lattice_offsets(int(np.ceil(1 / LATTICE_STEP)) + 1)
+
+    for index in np.lexsort((unit[:, 1], unit[:, 0])):
+        origin = unit[index]
+        cell = np.floor(origin).astype(int)
+        neighbors = slots[tuple((cell + around).T)].ravel()
+        stuck = ((placed[neighbors] - origin) ** 2).sum(axis=1).min() < 1.0
+        if not stuck and crowded:
+            nearby = [i for dx, dy in around for i in crowded.get((cell[0] + dx, cell[1] + dy), ())]
+            stuck = bool(nearby) and ((placed[nearby] - origin) ** 2).sum(axis=1).min() < 1.0
+        choice = origin
+        if stuck:
+            base = np.rint(origin / LATTICE_STEP).astype(int)
+            start, chunk = 0, LATTICE_CHUNK
+            while start < len(site_offsets):
+                sites = base + site_offsets[start:start + chunk]
+                in_reach = (np.abs(sites * LATTICE_STEP - origin) <= reach).all(axis=1)
+                free = np.flatnonzero(in_reach & ~blocked[sites[:, 0], sites[:, 1]])
+                if len(free):
+                    choice, stuck = sites[free[0]] * LATTICE_STEP, False
+                    break
+                start, chunk = start + chunk, chunk * 2
+
+        placed[index] = choice
+        cell = tuple(np.floor(choice).astype(int))
+        if stuck:
+            crowded.setdefault(cell, []).append(index)
+        else:
+            slots[cell + (np.flatnonzero(slots[cell] < 0)[0],)] = index
+
+        sites = np.rint(choice / LATTICE_STEP).astype(int) + window
+        near = ((sites * LATTICE_STEP - choice) ** 2).sum(axis=1) < 1.0
+        blocked[sites[near, 0], sites[near, 1]] = True
+
+    relaxed = (placed[:-1] - margin) * min_separation * span + low
+    unmoved = placed[:-1] == unit
+    relaxed[unmoved] = points[unmoved]
+    return relaxed[:, 0], relaxed[:, 1]
+
+
+def apply_relaxed_layout(
+    df: pd.DataFrame,
+    min_separation: float = MIN_SEPARATION,
+    drawn: Optional[np.ndarray] = None,
+) -> pd.DataFrame:
+    """Deterministic alternative to ``apply_jitter`` that only spreads overlapping points.
+
+    Only the rows flagged in ``drawn`` (default: all) are relaxed, against each
+    other; the rest keep their raw positions, so rows that are never drawn
+    cannot push visible ones aside.
+    """
+    df = df.copy()
+    x = df["first_attestation_english"].to_numpy(np.float64, copy=True)
+    y = df["time_gap"].to_numpy(np.float64, copy=True)
+    drawn = np.ones(len(df), dtype=bool) if drawn is None else np.asarray(drawn, dtype=bool)
+    x[drawn], y[drawn] = relax_positions(x[drawn], y[drawn], min_separation)
+    df["x_jitter"] = x.round(2)
+    df["y_jitter"] = y.round(2)
+    return df
+
+
+def axis_ranges(df: pd.DataFrame) -> Tuple[List[float], List[float]]:
+    """Fixed axis ranges based on all data (including jitter), padded by 5%.
+
+    This ensures the grid stays fixed when traces are hidden/shown.
+    """
     x_min = df["x_jitter"].min()
     x_max = df["x_jitter"].max()
     y_min = df["y_jitter"].min()
     y_max = df["y_jitter"].max()
-    
-    # Add small padding to ranges for better visualization
+
     x_padding = (x_max - x_min) * 0.05
     y_padding = (y_max - y_min) * 0.05
-    x_range = [x_min - x_padding, x_max + x_padding]
-    y_range = [y_min - y_padding, y_max + y_padding]
+    return [x_min - x_padding, x_max + x_padding], [y_min - y_padding, y_max + y_padding]
+
+
+def build_figure(df: pd.DataFrame, languages: Tuple[str, str] = LANGUAGES) -> go.Figure:
+    fig = go.Figure()
 
     for domain_key, meta in DOMAIN_MAP.items():
         subset = df[df["cultural_domain"] == domain_key]
@@ -115,10 +330,24 @@ def build_figure(df: pd.DataFrame) -> go.Figure:
                     "opacity": 0.7,
                     "line": {"color": "black", "width": 1},
                 },
-                hovertemplate=HOVER_TEMPLATE,
+                hovertemplate=localize(HOVER_TEMPLATE, languages),
             )
         )
 
+    return style_figure(
+        fig,
+        df,
+        "Cross-Linguistic Attestation Patterns: Religion vs Technology Terms in English and Spanish",
+        languages,
+    )
+
+
+def style_figure(
+    fig: go.Figure, df: pd.DataFrame, title: str, languages: Tuple[str, str] = LANGUAGES
+) -> go.Figure:
+    """Apply the shared zero line, layout and fixed axes to ``fig``."""
+    x_range, y_range = axis_ranges(df)
+
     fig.add_shape(
         type="line",
         x0=0,
@@ -133,11 +362,7 @@ def build_figure(df: pd.DataFrame) -> go.Figure:
 
     fig.update_layout(
         title={
-            "text": (
-                "Cross-Linguistic Attestation Patterns: Religion vs Technology Terms in "
-                "English and Spanish<br><sub>Hover over dots to see detailed word "
-                "information</sub>"
-            ),
+            "text": f"{localize(title, languages)}<br><sub>Hover over dots to see detailed word information</sub>",
             "x": 0.5,
             "xanchor": "center",
             "font": {"family": "Arial, sans-serif", "size": 24},
@@ -158,7 +383,7 @@ def build_figure(df: pd.DataFrame) -> go.Figure:
     )
 
     fig.update_xaxes(
-        title="English Attestation Year",
+        title=localize("English Attestation Year", languages),
         showgrid=True,
         gridcolor="lightgray",
         gridwidth=1,
@@ -171,7 +396,7 @@ def build_figure(df: pd.DataFrame) -> go.Figure:
     )
 
     fig.update_yaxes(
-        title="Time Gap (Spanish-English)",
+        title=localize("Time Gap (Spanish-English)", languages),
         showgrid=True,
         gridcolor="lightgray",
         gridwidth=1,
@@ -187,14 +412,226 @@ def build_figure(df: pd.DataFrame) -> go.Figure:
     return fig
 
 
-def main() -> None:
-    df = load_dataset(DOMAIN_MAP.keys())
-    jittered = apply_jitter(df)
-    fig = build_figure(jittered)
+def domain_styles(domains: Iterable[str]) -> Dict[str, Dict[str, str]]:
+    """Label and color for every domain, keeping ``DOMAIN_MAP`` entries as-is."""
+    used = {meta["color"] for meta in DOMAIN_MAP.values()}
+    palette = [color for color in qualitative.Dark24 if color not in used]
+    styles: Dict[str, Dict[str, str]] = {}
+    extra = 0
+    for domain in domains:
+        if domain in DOMAIN_MAP:
+            styles[domain] = DOMAIN_MAP[domain]
+        else:
+            styles[domain] = {"label": domain.replace("_", " ").title(), "color": palette[extra % len(palette)]}
+            extra += 1
+    return styles
+
+
+def word_lookup(df: pd.DataFrame) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """Deduplicated word list plus int32 codes of the spanish and english words."""
+    codes, words = pd.factorize(pd.concat([df["spanish_word"], df["english_word"]], ignore_index=True))
+    codes = codes.astype(np.int32)
+    return words.tolist(), codes[:len(df)], codes[len(df):]
+
+
+def _point_traces(
+    df: pd.DataFrame,
+    styles: Dict[str, Dict[str, str]],
+    fig: go.Figure,
+    languages: Tuple[str, str] = LANGUAGES,
+) -> None:
+    words, spanish_codes, english_codes = word_lookup(df)
+    fig.update_layout(meta={"words": words})
+    customdata = np.column_stack([
+        spanish_codes,
+        english_codes,
+        df["first_attestation_spanish"].to_numpy(np.int32),
+        df["first_attestation_english"].to_numpy(np.int32),
+        df["time_gap"].to_numpy(np.int32),
+    ])
+    domains = df["cultural_domain"].astype(str).to_numpy()
+    for domain_key, meta in styles.items():
+        mask = domains == domain_key
+        if not mask.any():
+            continue
+        fig.add_trace(
+            go.Scattergl(
+                x=df["x_jitter"].to_numpy(np.float32)[mask],
+                y=df["y_jitter"].to_numpy(np.float32)[mask],
+                mode="markers",
+                name=meta["label"],
+                meta=meta["label"],
+                customdata=customdata[mask],
+                marker={
+                    "color": meta["color"],
+                    "size": 8,
+                    "opacity": 0.7,
+                    "line": {"color": "black", "width": 1},
+                },
+                hovertemplate=localize(LARGE_HOVER_TEMPLATE, languages),
+            )
+        )
+
+
+def _density_traces(
+    df: pd.DataFrame,
+    styles: Dict[str, Dict[str, str]],
+    fig: go.Figure,
+    bins: Tuple[int, int] = DENSITY_BINS,
+    languages: Tuple[str, str] = LANGUAGES,
+) -> None:
+    """One marker per occupied bin and domain, sized by the number of pairs in it."""
+    x = df["x_jitter"].to_numpy(np.float64)
+    y = df["y_jitter"].to_numpy(np.float64)
+    x_edges = np.linspace(x.min(), x.max(), bins[0] + 1)
+    y_edges = np.linspace(y.min(), y.max(), bins[1] + 1)
+    x_centers = (x_edges[:-1] + x_edges[1:]) / 2
+    y_centers = (y_edges[:-1] + y_edges[1:]) / 2
+
+    domains = df["cultural_domain"].astype(str).to_numpy()
+    counts = {
+        domain: np.histogram2d(x[domains == domain], y[domains == domain], bins=[x_edges, y_edges])[0]
+        for domain in styles
+    }
+    largest = max(count.max() for count in counts.values())
+    for domain_key, meta in styles.items():
+        ix, iy = np.nonzero(counts[domain_key])
+        if not len(ix):
+            continue
+        pairs = counts[domain_key][ix, iy].astype(np.int32)
+        fig.add_trace(
+            go.Scattergl(
+                x=x_centers[ix].astype(np.float32),
+                y=y_centers[iy].astype(np.float32),
+                mode="markers",
+                name=meta["label"],
+                meta=meta["label"],
+                customdata=pairs,
+                marker={
+                    "color": meta["color"],
+                    "size": (6 + 18 * np.sqrt(pairs / largest)).astype(np.float32),
+                    "opacity": 0.6,
+                    "line": {"color": "black", "width": 0.5},
+                },
+                hovertemplate=localize(DENSITY_HOVER_TEMPLATE, languages),
+            )
+        )
+
+
+def build_large_figure(
+    df: pd.DataFrame, max_points: int = DENSITY_THRESHOLD, languages: Tuple[str, str] = LANGUAGES
+) -> go.Figure:
+    """WebGL figure over any number of domains for large-data mode.
+
+    Up to ``max_points`` pairs are drawn individually with compact typed
+    customdata; above it, each domain is aggregated to density bins.
+    """
+    styles = domain_styles(sorted(df["cultural_domain"].astype(str).unique()))
+    fig = go.Figure()
+    if len(df) > max_points:
+        _density_traces(df, styles, fig, languages=languages)
+    else:
+        _point_traces(df, styles, fig, languages)
+    return style_figure(fig, df, "Cross-Linguistic Attestation Patterns Across Cultural Domains", languages)
+
+
+def render_ready_points(fig: go.Figure) -> int:
+    """Number of markers the browser will actually draw."""
+    return sum(len(trace.x) for trace in fig.data)
+
+
+def write_figure(fig: go.Figure, output: Path, post_script: Optional[str] = None) -> None:
+    output.parent.mkdir(parents=True, exist_ok=True)
     config = {"responsive": True, "displayModeBar": False}
-    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    pio.write_html(fig, OUTPUT_PATH, include_plotlyjs="cdn", full_html=True, config=config)
-    print(f"Updated plot saved to {OUTPUT_PATH}")
+    pio.write_html(fig, output, include_plotlyjs="cdn", full_html=True, config=config, post_script=post_script)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--large-data", action="store_true", help="WebGL mode with compact customdata")
+    parser.add_argument(
+        "--all-domains",
+        action="store_true",
+        help="Plot every cultural domain (needs --large-data; the standard figure draws the DOMAIN_MAP domains)",
+    )
+    parser.add_argument(
+        "--max-points",
+        type=int,
+        default=DENSITY_THRESHOLD,
+        help="Large-data mode aggregates to density bins above this many points",
+    )
+    parser.add_argument(
+        "--layout",
+        choices=["jitter", "relax"],
+        default="jitter",
+        help="Random jitter, or a deterministic layout that only spreads overlapping points",
+    )
+    parser.add_argument(
+        "--min-separation",
+        type=float,
+        default=MIN_SEPARATION,
+        help="Relaxed layout: minimum distance between markers as a fraction of the axis span",
+    )
+    parser.add_argument("--pair", help="Language pair partition to plot, e.g. en-pt (default: the masterframe)")
+    parser.add_argument("--pairs-dir", type=Path, default=PAIRS_DIR)
+    parser.add_argument("--output", type=Path, help="HTML output path")
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        metavar="PREFIX",
+        help="Write per-stage timings to PREFIX.json and PREFIX.trace.json",
+    )
+    return parser
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    return build_parser().parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.all_domains and not args.large_data:
+        # build_figure draws only DOMAIN_MAP; hidden rows would still set the axis ranges.
+        parser.error("--all-domains needs --large-data; the standard figure only draws the DOMAIN_MAP domains")
+    pair, csv_path, schema, published = pair_option(parser, args.pair, args.pairs_dir) if args.pair else (None,) * 4
+    configure_profiling(args.profile, "regenerate_interactive_plot")
+    domains = None if args.all_domains else DOMAIN_MAP.keys()
+    languages = pair.languages if pair else LANGUAGES
+    with span("load") as stage:
+        df = load_dataset(domains, pair=pair.code if pair else None, pairs_dir=args.pairs_dir)
+        stage.set_rows(len(df))
+    if pair is None:
+        print(f"Loaded {format_memory_savings(df)}")
+    else:
+        typed = df if published else df.rename(columns=PAIR_COLUMNS)
+        print(f"Loaded {pair.code}: {format_memory_savings(typed, csv_path, schema)}")
+    with span(f"layout_{args.layout}", rows=len(df)):
+        if args.layout == "relax":
+            drawn = None if args.large_data else df["cultural_domain"].isin(list(DOMAIN_MAP)).to_numpy()
+            jittered = apply_relaxed_layout(df, args.min_separation, drawn)
+        else:
+            jittered = apply_jitter(df)
+
+    with span("build_figure", rows=len(jittered)):
+        if args.large_data:
+            output = args.output or LARGE_OUTPUT_PATH
+            fig = build_large_figure(jittered, args.max_points, languages)
+            post_script = WORD_LOOKUP_SCRIPT
+        else:
+            output = args.output or OUTPUT_PATH
+            fig = build_figure(jittered, languages)
+            post_script = None
+    if pair is not None and pair.code != DEFAULT_PAIR and args.output is None:
+        output = PAIR_OUTPUT_DIR / f"{output.stem}_{pair.code}.html"
+
+    with span("write_html", rows=render_ready_points(fig)):
+        write_figure(fig, output, post_script)
+    print(f"Updated plot saved to {output}")
+    print(
+        f"HTML size: {output.stat().st_size / 1024:.1f} KiB, "
+        f"render-ready points: {render_ready_points(fig)} (from {len(df)} word pairs)"
+    )
 
 
 if __name__ == "__main__":
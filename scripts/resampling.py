@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""Bootstrap confidence intervals and permutation p-values for false-friend rates.
+
+Two quantities are resampled:
+
+* per-domain false-friend rate (FFR), and
+* the false friend vs true cognate gap in mean frequency score.
+
+Resamples are drawn in fixed-size chunks, each with its own child of one
+``SeedSequence``. Results therefore depend only on ``seed`` and
+``n_resamples``, not on how many worker processes share the chunks.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from masterframe import float64_values, load_masterframe
+
+N_RESAMPLES = 10_000
+RANDOM_SEED = 2025
+CHUNK_RESAMPLES = 2_000
+CONFIDENCE = 0.95
+
+FALSE_FRIENDS = "false_friends"
+COGNATES = "cognates"
+FREQUENCY_COLUMN = "complexity_frequency_complexity"
+
+# Arrays shared with pool workers, set once per process by ``_init_worker``.
+_SHARED: Dict[str, np.ndarray] = {}
+
+
+def _init_worker(shared: Dict[str, np.ndarray]) -> None:
+    _SHARED.clear()
+    _SHARED.update(shared)
+
+
+def _ffr_chunk(size: int, seed: np.random.SeedSequence) -> Dict[str, np.ndarray]:
+    """False-friend counts per domain for ``size`` bootstrap and permutation resamples.
+
+    Resampling rows within a domain only matters through how many false
+    friends are drawn, so the stratified bootstrap draws each domain's count
+    from its binomial and the label permutation draws all counts from the
+    multivariate hypergeometric. These are the exact distributions of the
+    index-matrix resamples, at O(domains) cost per resample instead of O(rows).
+    """
+    rng = np.random.default_rng(seed)
+    sizes, ff = _SHARED["domain_sizes"], _SHARED["domain_ff"]
+    boot = rng.binomial(sizes, ff / sizes, size=(size, len(sizes)))
+    perm = rng.multivariate_hypergeometric(sizes, int(ff.sum()), size=size)
+    return {"boot": boot.astype(np.int32), "perm": perm.astype(np.int32)}
+
+
+def _gap_chunk(size: int, seed: np.random.SeedSequence) -> Dict[str, np.ndarray]:
+    """Mean-gap statistics for ``size`` bootstrap and permutation resamples.
+
+    Bootstrap rows are drawn per group as an index matrix; permutations pick
+    a random ``n_a``-subset of the pooled values per resample via
+    ``argpartition`` on random keys.
+    """
+    rng = np.random.default_rng(seed)
+    a, b = _SHARED["group_a"], _SHARED["group_b"]
+    boot_a = a[rng.integers(0, len(a), size=(size, len(a)))].mean(axis=1)
+    boot_b = b[rng.integers(0, len(b), size=(size, len(b)))].mean(axis=1)
+
+    pooled = np.concatenate([a, b])
+    keys = rng.random((size, len(pooled)))
+    chosen = np.argpartition(keys, len(a) - 1, axis=1)[:, :len(a)]
+    sum_a = pooled[chosen].sum(axis=1)
+    perm = sum_a / len(a) - (pooled.sum() - sum_a) / len(b)
+    return {"boot": boot_a - boot_b, "perm": perm}
+
+
+_CHUNK_FUNCTIONS = {"ffr": _ffr_chunk, "gap": _gap_chunk}
+
+
+def _run_chunk(kind: str, size: int, seed: np.random.SeedSequence) -> Dict[str, np.ndarray]:
+    return _CHUNK_FUNCTIONS[kind](size, seed)
+
+
+def _resample(
+    kind: str,
+    shared: Dict[str, np.ndarray],
+    n_resamples: int,
+    seed: int,
+    workers: Optional[int],
+) -> Dict[str, np.ndarray]:
+    """Run ``n_resamples`` of ``kind`` in chunks, in-process or across a process pool."""
+    sizes = [CHUNK_RESAMPLES] * (n_resamples // CHUNK_RESAMPLES)
+    if n_resamples % CHUNK_RESAMPLES:
+        sizes.append(n_resamples % CHUNK_RESAMPLES)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    workers = workers if workers is not None else os.cpu_count() or 1
+
+    if workers <= 1 or len(sizes) <= 1:
+        _init_worker(shared)
+        parts = [_run_chunk(kind, size, child) for size, child in zip(sizes, seeds)]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(sizes)), initializer=_init_worker, initargs=(shared,)
+        ) as pool:
+            parts = list(pool.map(_run_chunk, [kind] * len(sizes), sizes, seeds))
+    return {key: np.concatenate([part[key] for part in parts]) for key in parts[0]}
+
+
+def _percentile_ci(samples: np.ndarray, confidence: float) -> np.ndarray:
+    tail = (1 - confidence) / 2 * 100
+    return np.percentile(samples, [tail, 100 - tail], axis=0)
+
+
+def _permutation_p(null: np.ndarray, observed: np.ndarray, center: np.ndarray) -> np.ndarray:
+    """Two-sided permutation p-value with the +1 correction."""
+    extreme = np.abs(null - center) >= np.abs(observed - center) - 1e-12
+    return (extreme.sum(axis=0) + 1) / (len(null) + 1)
+
+
+def domain_ffr_intervals(
+    df: pd.DataFrame,
+    n_resamples: int = N_RESAMPLES,
+    seed: int = RANDOM_SEED,
+    workers: Optional[int] = None,
+    confidence: float = CONFIDENCE,
+) -> pd.DataFrame:
+    """Bootstrap CIs and permutation p-values for every domain's FFR (%).
+
+    The permutation null shuffles domain labels across all pairs, i.e. tests
+    whether a domain's FFR differs from the overall rate.
+    """
+    is_ff = (df["relationship_type"] == FALSE_FRIENDS).to_numpy(dtype=bool, na_value=False)
+    domain = df["cultural_domain"].astype(str)
+    totals = domain.value_counts().sort_index()
+    ff_counts = pd.Series(is_ff, index=df.index).groupby(domain.to_numpy()).sum().reindex(totals.index)
+
+    sizes = totals.to_numpy(dtype=np.int64)
+    ff = ff_counts.to_numpy(dtype=np.int64)
+    draws = _resample("ffr", {"domain_sizes": sizes, "domain_ff": ff}, n_resamples, seed, workers)
+
+    observed = ff / sizes * 100
+    boot = draws["boot"] / sizes * 100
+    perm = draws["perm"] / sizes * 100
+    overall = ff.sum() / sizes.sum() * 100
+    ci = _percentile_ci(boot, confidence)
+
+    result = pd.DataFrame({
+        "pairs": sizes,
+        "false_friends": ff,
+        "ffr": observed,
+        "ci_low": ci[0],
+        "ci_high": ci[1],
+        "std_error": boot.std(axis=0, ddof=1),
+        "p_value": _permutation_p(perm, observed, np.full_like(observed, overall)),
+    }, index=totals.index.rename("cultural_domain"))
+    return result.sort_values("ffr", ascending=False)
+
+
+def frequency_gap_interval(
+    df: pd.DataFrame,
+    n_resamples: int = N_RESAMPLES,
+    seed: int = RANDOM_SEED,
+    workers: Optional[int] = None,
+    confidence: float = CONFIDENCE,
+) -> pd.Series:
+    """Bootstrap CI and permutation p-value for mean frequency (false friends - cognates)."""
+    freq = float64_values(df[FREQUENCY_COLUMN])
+    rel = df["relationship_type"]
+    a = freq[(rel == FALSE_FRIENDS).to_numpy(dtype=bool, na_value=False)]
+    b = freq[(rel == COGNATES).to_numpy(dtype=bool, na_value=False)]
+    a, b = a[~np.isnan(a)], b[~np.isnan(b)]
+
+    draws = _resample("gap", {"group_a": a, "group_b": b}, n_resamples, seed, workers)
+    observed = a.mean() - b.mean()
+    ci = _percentile_ci(draws["boot"], confidence)
+    return pd.Series({
+        "false_friends_mean": a.mean(),
+        "cognates_mean": b.mean(),
+        "gap": observed,
+        "ci_low": ci[0],
+        "ci_high": ci[1],
+        "std_error": draws["boot"].std(ddof=1),
+        "p_value": float(_permutation_p(draws["perm"], np.array(observed), np.array(0.0))),
+        "resamples": n_resamples,
+    })
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--resamples", type=int, default=N_RESAMPLES)
+    parser.add_argument("--seed", type=int, default=RANDOM_SEED)
+    parser.add_argument("--workers", type=int, help="Worker processes (default: all cores)")
+    parser.add_argument("--output", type=Path, help="CSV path for the per-domain table")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = parse_args(argv)
+    df = load_masterframe(["relationship_type", "cultural_domain", FREQUENCY_COLUMN])
+    options = {"n_resamples": args.resamples, "seed": args.seed, "workers": args.workers}
+
+    domains = domain_ffr_intervals(df, **options)
+    gap = frequency_gap_interval(df, **options)
+
+    lines: List[str] = [f"Domain FFR with {CONFIDENCE:.0%} bootstrap CIs ({args.resamples} resamples):"]
+    for domain, row in domains.iterrows():
+        lines.append(
+            f"  - {domain}: {row['ffr']:.2f}% [{row['ci_low']:.2f}, {row['ci_high']:.2f}] "
+            f"({int(row['false_friends'])}/{int(row['pairs'])}, permutation p = {row['p_value']:.4g})"
+        )
+    lines.append(
+        f"\nFrequency gap (false friends - cognates): {gap['gap']:.3f} "
+        f"[{gap['ci_low']:.3f}, {gap['ci_high']:.3f}], permutation p = {gap['p_value']:.4g}"
+    )
+    print("\n".join(lines))
+
+    if args.output:
+        domains.to_csv(args.output)
+        print(f"\nPer-domain table saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
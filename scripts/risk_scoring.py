@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""Score learner vocabulary lists for false-friend risk.
+
+A row's risk (0-100) combines the signals ``calculate_business_impact.py``
+ranks false friends by:
+
+* the relationship type (``RELATIONSHIP_WEIGHTS``; false friends dominate);
+* how often the word is met, as the report's frequency weight
+  ``1 / (frequency_complexity + 1)``;
+* its domain's false-friend rate (FFR); and
+* ``complexity_overall_complexity``.
+
+A word matches every row whose english or spanish word folds to the same
+form (see ``word_index.fold``) and scores as its riskiest row. Words are
+mapped to integer row ids once and kept in a bounded LRU cache, so a list
+request is a handful of dict lookups and one vectorized gather. The cache and
+domain aggregates are dropped when the CSV changes on disk.
+"""
+from __future__ import annotations
+
+import argparse
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from calculate_business_impact import FALSE_FRIENDS, FREQUENCY_COLUMN, compute_business_impact
+from masterframe import DATA_PATH, file_fingerprint, float64_values, load_masterframe
+from word_index import fold
+
+COMPLEXITY_COLUMN = "complexity_overall_complexity"
+SCORING_COLUMNS = ["english_word", "spanish_word", "relationship_type", "cultural_domain", FREQUENCY_COLUMN, COMPLEXITY_COLUMN]
+
+RELATIONSHIP_WEIGHTS = {
+    FALSE_FRIENDS: 1.0,
+    "loanword_en_to_es": 0.35,
+    "loanword_es_to_en": 0.35,
+    "cognates": 0.15,
+}
+# Shares of the risk score; they sum to 1
+EXPOSURE_SHARE = 0.6
+DOMAIN_SHARE = 0.2
+COMPLEXITY_SHARE = 0.2
+COMPLEXITY_SCALE = 100.0
+
+CACHE_SIZE = 100_000  # words
+UNKNOWN = -1
+
+
+def row_risk(
+    relationship_weight: np.ndarray,
+    frequency: np.ndarray,
+    domain_ffr: np.ndarray,
+    complexity: np.ndarray,
+) -> np.ndarray:
+    """Risk (0-100) per row; ``domain_ffr`` is in % like the report's FFR."""
+    exposure = 1.0 / (np.nan_to_num(frequency, nan=np.inf) + 1.0)
+    blend = (
+        EXPOSURE_SHARE * exposure
+        + DOMAIN_SHARE * domain_ffr / 100.0
+        + COMPLEXITY_SHARE * np.clip(np.nan_to_num(complexity) / COMPLEXITY_SCALE, 0.0, 1.0)
+    )
+    return 100.0 * relationship_weight * blend
+
+
+class RiskScorer:
+    """Vectorized, memoized false-friend risk lookups for word lists."""
+
+    def __init__(self, csv_path: Path = DATA_PATH, cache_size: int = CACHE_SIZE) -> None:
+        self.csv_path = Path(csv_path)
+        self.cache_size = cache_size
+        self._words: "OrderedDict[str, int]" = OrderedDict()
+        self._fingerprint: Optional[Dict[str, object]] = None
+        self.hits = 0
+        self.misses = 0
+        self.refresh()
+
+    def refresh(self) -> bool:
+        """Reload if the CSV changed since it was loaded; return whether it did."""
+        fingerprint = file_fingerprint(self.csv_path, with_hash=False)
+        if fingerprint == self._fingerprint:
+            return False
+        self._load(load_masterframe(SCORING_COLUMNS, self.csv_path))
+        self._fingerprint = fingerprint
+        return True
+
+    def _load(self, df: pd.DataFrame) -> None:
+        impact = compute_business_impact(df)
+        self.domains = pd.Index(df["cultural_domain"].cat.categories)
+        self.relationship_types = pd.Index(df["relationship_type"].cat.categories)
+        self.domain_ffr = impact.domain_stats["ffr"].reindex(self.domains).fillna(0.0).to_numpy(dtype=np.float64)
+
+        self.domain_codes = df["cultural_domain"].cat.codes.to_numpy()
+        self.relationship_codes = df["relationship_type"].cat.codes.to_numpy()
+        weights = np.array([RELATIONSHIP_WEIGHTS.get(name, 0.0) for name in self.relationship_types])
+        self.frequency = float64_values(df[FREQUENCY_COLUMN])
+        self.complexity = float64_values(df[COMPLEXITY_COLUMN])
+        self.risk = row_risk(
+            weights[self.relationship_codes],
+            self.frequency,
+            self.domain_ffr[self.domain_codes],
+            self.complexity,
+        )
+        self.english_word = df["english_word"].to_numpy(dtype=object)
+        self.spanish_word = df["spanish_word"].to_numpy(dtype=object)
+
+        # Folded word -> id of its riskiest row, from both languages
+        keys = pd.Index([fold(str(word)) for word in [*self.english_word, *self.spanish_word]])
+        rows = np.tile(np.arange(len(df)), 2)
+        by_risk = np.argsort(-self.risk[rows], kind="stable")
+        keys, rows = keys[by_risk], rows[by_risk]
+        first = ~keys.duplicated()
+        self.keys = keys[first]
+        self.key_rows = rows[first]
+
+        self._words.clear()
+        self._domain_table: Optional[pd.DataFrame] = None
+
+    def word_rows(self, words: Sequence[str]) -> np.ndarray:
+        """Row id of each word's riskiest match (``UNKNOWN`` if none), via the LRU cache.
+
+        Each distinct word not cached before the call is one miss and is looked
+        up once; every other occurrence is a hit. The batch is resolved before
+        the cache is updated, so a batch larger than the cache cannot evict
+        words it still needs.
+        """
+        cache = self._words
+        resolved: Dict[str, int] = {}
+        missing: List[str] = []
+        for word in dict.fromkeys(words):
+            row = cache.get(word)
+            if row is None:
+                missing.append(word)
+            else:
+                resolved[word] = row
+                cache.move_to_end(word)
+        if missing:
+            positions = self.keys.get_indexer([fold(word) for word in missing])
+            rows = np.where(positions >= 0, self.key_rows[positions], UNKNOWN)
+            looked_up = dict(zip(missing, rows.tolist()))
+            resolved.update(looked_up)
+            cache.update(looked_up)
+            while len(cache) > self.cache_size:
+                cache.popitem(last=False)
+        self.misses += len(missing)
+        self.hits += len(words) - len(missing)
+        return np.fromiter((resolved[word] for word in words), dtype=np.int64, count=len(words))
+
+    def score(self, words: Sequence[str], check_dataset: bool = True) -> Dict[str, np.ndarray]:
+        """Per-word risk and its drivers as aligned arrays; unknown words score NaN."""
+        if check_dataset:
+            self.refresh()
+        rows = self.word_rows(words)
+        known = rows != UNKNOWN
+        safe = np.where(known, rows, 0)
+        domain = np.where(known, self.domain_codes[safe], -1)
+        relationship = np.where(known, self.relationship_codes[safe], -1)
+        return {
+            "row": rows,
+            "risk": np.where(known, self.risk[safe], np.nan),
+            "relationship_code": relationship,
+            "domain_code": domain,
+            "domain_ffr": np.where(known, self.domain_ffr[np.maximum(domain, 0)], np.nan),
+            "frequency": np.where(known, self.frequency[safe], np.nan),
+            "complexity": np.where(known, self.complexity[safe], np.nan),
+        }
+
+    def score_frame(self, words: Sequence[str]) -> pd.DataFrame:
+        """``score`` as a DataFrame with labels, sorted by risk."""
+        scores = self.score(words)
+        rows = scores.pop("row")
+        known = rows != UNKNOWN
+        frame = pd.DataFrame({"word": list(words)})
+        frame["english_word"] = np.where(known, self.english_word[np.maximum(rows, 0)], None)
+        frame["spanish_word"] = np.where(known, self.spanish_word[np.maximum(rows, 0)], None)
+        frame["relationship_type"] = pd.Categorical.from_codes(scores.pop("relationship_code"), self.relationship_types)
+        frame["cultural_domain"] = pd.Categorical.from_codes(scores.pop("domain_code"), self.domains)
+        for name, values in scores.items():
+            frame[name] = values
+        return frame.sort_values("risk", ascending=False, na_position="last", kind="stable").reset_index(drop=True)
+
+    def domain_table(self) -> pd.DataFrame:
+        """Dataset-wide risk per domain, computed once per dataset version."""
+        if self._domain_table is None:
+            n_domains = len(self.domains)
+            total = np.bincount(self.domain_codes, minlength=n_domains)
+            risk_sum = np.bincount(self.domain_codes, weights=self.risk, minlength=n_domains)
+            is_ff = self.relationship_codes == self.relationship_types.get_indexer([FALSE_FRIENDS])[0]
+            self._domain_table = pd.DataFrame(
+                {
+                    "false_friends": np.bincount(self.domain_codes[is_ff], minlength=n_domains),
+                    "total": total,
+                    "ffr": self.domain_ffr,
+                    "mean_risk": risk_sum / np.maximum(total, 1),
+                },
+                index=self.domains,
+            )
+        return self._domain_table
+
+    def summarize(self, words: Sequence[str]) -> pd.DataFrame:
+        """Words, total and mean risk per domain for one vocabulary list."""
+        scores = self.score(words)
+        known = scores["domain_code"] >= 0
+        codes = scores["domain_code"][known]
+        n_domains = len(self.domains)
+        count = np.bincount(codes, minlength=n_domains)
+        risk = np.bincount(codes, weights=scores["risk"][known], minlength=n_domains)
+        table = self.domain_table()[["ffr"]].copy()
+        table["words"] = count
+        table["total_risk"] = risk
+        table["mean_risk"] = risk / np.maximum(count, 1)
+        return table[count > 0].sort_values("total_risk", ascending=False)
+
+    def cache_info(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._words), "max_size": self.cache_size}
+
+
+def read_words(path: Path) -> List[str]:
+    """One word per line; blank lines and ``#`` comments are skipped."""
+    with open(path, "r", encoding="utf-8") as handle:
+        return [line.strip() for line in handle if line.strip() and not line.lstrip().startswith("#")]
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("words", nargs="*", help="Words to score")
+    parser.add_argument("--file", type=Path, help="Vocabulary list, one word per line")
+    parser.add_argument("--top", type=int, default=20, help="Rows to print (default: 20)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = parse_args(argv)
+    words = list(args.words) + (read_words(args.file) if args.file else [])
+    if not words:
+        raise SystemExit("No words given; pass words or --file")
+    scorer = RiskScorer()
+    frame = scorer.score_frame(words)
+    unknown = int(frame["risk"].isna().sum())
+    print(f"Risk for {len(words)} words ({unknown} not in the masterframe):")
+    print(frame.head(args.top).to_string(index=False, float_format=lambda value: f"{value:.2f}"))
+    print("\nBy domain:")
+    print(scorer.summarize(words).to_string(float_format=lambda value: f"{value:.2f}"))
+
+
+if __name__ == "__main__":
+    main()
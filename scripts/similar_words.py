@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""k-nearest "similar words" over the masterframe's similarity and complexity features.
+
+Each word pair is a standardized float32 vector of ``FEATURE_COLUMNS``. A
+missing value sits at the column mean, i.e. 0 after standardizing. Neighbours
+are found with ``scipy.spatial.cKDTree``: one tree over all rows, or one per
+cultural domain for same-domain queries. The all-pairs top-k table is queried
+in blocks of ``BLOCK_ROWS``, so memory grows with ``n * k``, never ``n**2``.
+
+The table for the site goes to ``assets/data/similar_words.json``. Large
+tables can be written to ``.npz`` instead.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+
+from masterframe import ROOT, float64_values, load_masterframe
+
+OUTPUT_PATH = ROOT / "assets" / "data" / "similar_words.json"
+FEATURE_COLUMNS = [
+    "levenshtein_similarity",
+    "jaccard_similarity",
+    "complexity_syll_component",
+    "complexity_freq_component",
+    "complexity_semantic_component",
+    "complexity_length_component",
+    "first_attestation_english",
+    "first_attestation_spanish",
+]
+NEIGHBOR_COLUMNS = ["english_word", "spanish_word", "cultural_domain", *FEATURE_COLUMNS]
+K = 10
+BLOCK_ROWS = 65_536
+FORMAT_VERSION = 1
+
+
+def feature_matrix(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Standardized ``(n, features)`` float32 matrix plus the column means and scales used."""
+    values = np.column_stack([float64_values(df[column]) for column in FEATURE_COLUMNS])
+    mean = np.nanmean(values, axis=0)
+    scale = np.nanstd(values, axis=0)
+    scale[~(scale > 0)] = 1.0
+    standardized = (values - mean) / scale
+    return np.nan_to_num(standardized, nan=0.0).astype(np.float32), mean, scale
+
+
+class SimilarWordsIndex:
+    """Top-k neighbour queries over all rows or within each cultural domain."""
+
+    def __init__(self, df: pd.DataFrame, same_domain: bool = False) -> None:
+        self.features, self.mean, self.scale = feature_matrix(df)
+        self.same_domain = same_domain
+        if same_domain:
+            domains = df["cultural_domain"].astype(str).to_numpy()
+            self.domains = domains
+        else:
+            domains = np.zeros(len(df), dtype=object)
+            self.domains = None
+        # group -> (tree, row ids of the tree's points)
+        self.trees: Dict[object, Tuple[cKDTree, np.ndarray]] = {}
+        for group in pd.unique(domains):
+            rows = np.flatnonzero(domains == group)
+            self.trees[group] = (cKDTree(self.features[rows]), rows)
+
+    def query_rows(self, rows: np.ndarray, k: int = K) -> Tuple[np.ndarray, np.ndarray]:
+        """The ``k`` nearest other rows (and distances) of each row in ``rows``.
+
+        Slots beyond the size of a row's group are ``-1`` / ``inf``.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        neighbors = np.full((len(rows), k), -1, dtype=np.int64)
+        distances = np.full((len(rows), k), np.inf, dtype=np.float32)
+        groups = self.domains[rows] if self.domains is not None else np.zeros(len(rows), dtype=object)
+        for group in pd.unique(groups):
+            tree, members = self.trees[group]
+            positions = np.flatnonzero(groups == group)
+            found = min(k + 1, len(members))
+            dist, index = tree.query(self.features[rows[positions]], k=found, workers=-1)
+            dist, index = dist.reshape(len(positions), found), index.reshape(len(positions), found)
+            ids = members[index]
+            # drop the query row itself; if exact duplicates pushed it out, drop the farthest instead
+            is_self = ids == rows[positions, None]
+            is_self[~is_self.any(axis=1), -1] = True
+            keep = ~is_self
+            kept = min(k, found - 1)
+            neighbors[positions, :kept] = ids[keep].reshape(len(positions), found - 1)[:, :kept]
+            distances[positions, :kept] = dist[keep].reshape(len(positions), found - 1)[:, :kept]
+        return neighbors, distances
+
+    def top_k_table(self, k: int = K, block_rows: int = BLOCK_ROWS) -> Tuple[np.ndarray, np.ndarray]:
+        """Neighbours and distances of every row, computed ``block_rows`` rows at a time."""
+        n = len(self.features)
+        neighbors = np.empty((n, k), dtype=np.int32 if n < 2**31 else np.int64)
+        distances = np.empty((n, k), dtype=np.float32)
+        for start in range(0, n, block_rows):
+            block = np.arange(start, min(start + block_rows, n))
+            neighbors[block], distances[block] = self.query_rows(block, k)
+        return neighbors, distances
+
+
+def write_table(
+    path: Path,
+    df: pd.DataFrame,
+    neighbors: np.ndarray,
+    distances: np.ndarray,
+    same_domain: bool,
+) -> Path:
+    """Write the table as compact JSON for the site, or ``.npz`` for large tables."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == ".npz":
+        np.savez(path, neighbors=neighbors, distances=distances, features=np.asarray(FEATURE_COLUMNS),
+                 same_domain=np.asarray(same_domain))
+        return path
+    payload = {
+        "version": FORMAT_VERSION,
+        "k": int(neighbors.shape[1]),
+        "features": FEATURE_COLUMNS,
+        "same_domain": same_domain,
+        "pairs": [[english, spanish] for english, spanish in zip(df["english_word"], df["spanish_word"])],
+        "neighbors": neighbors.tolist(),
+        "distances": np.round(distances, 2).tolist(),
+    }
+    path.write_text(json.dumps(payload, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+    return path
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-k", type=int, default=K, help=f"Neighbours per word pair (default: {K})")
+    parser.add_argument("--same-domain", action="store_true", help="Only match pairs in the same cultural domain")
+    parser.add_argument("--output", type=Path, default=OUTPUT_PATH, help="Table path (.json or .npz)")
+    parser.add_argument("--word", nargs="+", default=[], help="Print the neighbours of these english/spanish words")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = parse_args(argv)
+    df = load_masterframe(NEIGHBOR_COLUMNS)
+    index = SimilarWordsIndex(df, args.same_domain)
+    neighbors, distances = index.top_k_table(args.k)
+    path = write_table(args.output, df, neighbors, distances, args.same_domain)
+    print(f"Top-{args.k} similar words for {len(df)} pairs written to {path} "
+          f"({path.stat().st_size / 1024:.1f} KiB)")
+
+    english = df["english_word"].str.lower().to_numpy()
+    spanish = df["spanish_word"].str.lower().to_numpy()
+    for word in args.word:
+        rows = np.flatnonzero((english == word.lower()) | (spanish == word.lower()))
+        for row in rows:
+            matches: List[str] = [
+                f"{df['english_word'].iat[other]}/{df['spanish_word'].iat[other]} ({distance:.2f})"
+                for other, distance in zip(neighbors[row], distances[row]) if other >= 0
+            ]
+            print(f"  {df['english_word'].iat[row]}/{df['spanish_word'].iat[row]}: {', '.join(matches)}")
+
+
+if __name__ == "__main__":
+    main()
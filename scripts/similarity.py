@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Batch Jaccard and Levenshtein similarity for english/spanish word pairs.
+
+Reproduces the masterframe columns:
+
+* ``jaccard_similarity`` - Jaccard index of the two lowercased words'
+  character sets;
+* ``levenshtein_similarity`` - ``1 - distance / max(len)`` on the lowercased
+  words (the scalar version is ``word_index.levenshtein_similarity``);
+
+both rounded to the published 3 decimals. Words are encoded as fixed-width
+UCS-4 code point matrices. Levenshtein runs the DP one row at a time over a
+whole length bucket of pairs, resolving the insertion chain of each row with
+a ``minimum.accumulate``; Jaccard ORs characters into ``uint64`` bitsets and
+counts bits. Large batches are split across worker processes.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from masterframe import SCHEMA, float64_values, load_masterframe
+
+SIMILARITY_COLUMNS = ["jaccard_similarity", "levenshtein_similarity"]
+PAIR_COLUMNS = ["english_word", "spanish_word"]
+BUCKET_PAIRS = 32_768  # pairs per DP bucket
+CHUNK_PAIRS = 500_000  # pairs per worker task
+BITS = 64
+
+
+def encode(words: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Lowercased ``words`` as a ``(n, max_len)`` uint32 code point matrix (0-padded) and lengths."""
+    text = np.array([str(word).lower() for word in words], dtype=str)
+    if text.dtype.itemsize == 0:
+        text = text.astype("<U1")
+    width = text.dtype.itemsize // 4
+    codes = text.view(np.uint32).reshape(len(text), width)
+    return codes, np.char.str_len(text).astype(np.int64)
+
+
+def levenshtein_distances(a: np.ndarray, la: np.ndarray, b: np.ndarray, lb: np.ndarray) -> np.ndarray:
+    """Edit distances between the rows of two encoded batches.
+
+    Cell ``(i, j)`` depends only on ``a[:i]`` and ``b[:j]``, so padding never
+    reaches a pair's answer, read off row ``la`` at column ``lb``.
+    """
+    n = len(la)
+    distances = np.empty(n, dtype=np.int64)
+    order = np.lexsort((lb, la))
+    for start in range(0, n, BUCKET_PAIRS):
+        index = order[start:start + BUCKET_PAIRS]
+        rows_a, rows_b = la[index], lb[index]
+        width_a, width_b = int(rows_a.max()), int(rows_b.max())
+        bucket_a = a[index, :width_a]
+        bucket_b = b[index, :width_b]
+        steps = np.arange(width_b + 1, dtype=np.int64)
+        previous = np.broadcast_to(steps, (len(index), width_b + 1)).copy()
+        result = np.empty(len(index), dtype=np.int64)
+        done = rows_a == 0
+        result[done] = rows_b[done]
+        for i in range(1, width_a + 1):
+            cost = bucket_a[:, i - 1:i] != bucket_b
+            current = np.empty_like(previous)
+            current[:, 0] = i
+            current[:, 1:] = np.minimum(previous[:, 1:] + 1, previous[:, :-1] + cost)
+            # insertions: current[j] = min over k <= j of current[k] + (j - k)
+            current = np.minimum.accumulate(current - steps, axis=1) + steps
+            finished = rows_a == i
+            if finished.any():
+                result[finished] = current[finished, rows_b[finished]]
+            previous = current
+        distances[index] = result
+    return distances
+
+
+def char_bitsets(codes: np.ndarray, lengths: np.ndarray, alphabet: np.ndarray) -> np.ndarray:
+    """``(n, words)`` uint64 bitsets of the characters in each encoded row."""
+    n, width = codes.shape
+    bitsets = np.zeros((n, max(1, -(-len(alphabet) // BITS))), dtype=np.uint64)
+    rows = np.arange(n)
+    for j in range(width):
+        valid = lengths > j
+        ids = np.searchsorted(alphabet, codes[valid, j])
+        bitsets[rows[valid], ids // BITS] |= np.left_shift(np.uint64(1), (ids % BITS).astype(np.uint64))
+    return bitsets
+
+
+def jaccard_similarities(a: np.ndarray, la: np.ndarray, b: np.ndarray, lb: np.ndarray) -> np.ndarray:
+    """Character-set Jaccard index per pair (1.0 when both words are empty)."""
+    alphabet = np.union1d(np.unique(a), np.unique(b))
+    bits_a = char_bitsets(a, la, alphabet)
+    bits_b = char_bitsets(b, lb, alphabet)
+    intersection = np.bitwise_count(bits_a & bits_b).sum(axis=1)
+    union = np.bitwise_count(bits_a | bits_b).sum(axis=1)
+    return np.divide(intersection, union, out=np.ones(len(la)), where=union > 0)
+
+
+def _similarity_chunk(pairs: Tuple[Sequence[str], Sequence[str]]) -> np.ndarray:
+    a, la = encode(pairs[0])
+    b, lb = encode(pairs[1])
+    longest = np.maximum(np.maximum(la, lb), 1)
+    levenshtein = 1.0 - levenshtein_distances(a, la, b, lb) / longest
+    return np.column_stack([jaccard_similarities(a, la, b, lb), levenshtein])
+
+
+def compute_similarities(
+    english: Sequence[str],
+    spanish: Sequence[str],
+    workers: Optional[int] = None,
+    round_to_schema: bool = True,
+) -> pd.DataFrame:
+    """``jaccard_similarity`` and ``levenshtein_similarity`` for each word pair.
+
+    Batches larger than ``CHUNK_PAIRS`` are spread over ``workers`` processes
+    (default: all cores).
+    """
+    english, spanish = list(english), list(spanish)
+    if len(english) != len(spanish):
+        raise ValueError(f"Got {len(english)} english but {len(spanish)} spanish words")
+    chunks = [
+        (english[start:start + CHUNK_PAIRS], spanish[start:start + CHUNK_PAIRS])
+        for start in range(0, len(english), CHUNK_PAIRS)
+    ]
+    workers = min(workers or os.cpu_count() or 1, len(chunks))
+    if workers <= 1:
+        parts = [_similarity_chunk(chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_similarity_chunk, chunks))
+    values = np.concatenate(parts) if parts else np.empty((0, 2))
+    frame = pd.DataFrame(values, columns=SIMILARITY_COLUMNS)
+    if round_to_schema:
+        for column in SIMILARITY_COLUMNS:
+            frame[column] = frame[column].round(SCHEMA[column]["decimals"])
+    return frame
+
+
+def check_masterframe(workers: Optional[int] = None) -> pd.DataFrame:
+    """Recompute both columns for the masterframe and return the rows that differ."""
+    df = load_masterframe(PAIR_COLUMNS + SIMILARITY_COLUMNS)
+    computed = compute_similarities(df["english_word"], df["spanish_word"], workers)
+    differs = np.zeros(len(df), dtype=bool)
+    for column in SIMILARITY_COLUMNS:
+        differs |= ~np.isclose(float64_values(df[column]), computed[column].to_numpy(), atol=1e-6)
+        df[f"computed_{column}"] = computed[column].to_numpy()
+    return df[differs]
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--input", type=Path, help="CSV with english_word and spanish_word columns")
+    parser.add_argument("--output", type=Path, help="Write the input plus both similarity columns here")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: all cores)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = parse_args(argv)
+    if args.input is None:
+        start = time.perf_counter()
+        mismatches = check_masterframe(args.workers)
+        print(f"Recomputed masterframe similarities in {time.perf_counter() - start:.2f}s; "
+              f"{len(mismatches)} rows differ from the published columns")
+        if len(mismatches):
+            print(mismatches.to_string(index=False))
+        return
+
+    pairs = pd.read_csv(args.input, usecols=PAIR_COLUMNS, keep_default_na=False)
+    start = time.perf_counter()
+    similarities = compute_similarities(pairs["english_word"], pairs["spanish_word"], args.workers)
+    elapsed = time.perf_counter() - start
+    result = pd.concat([pairs, similarities], axis=1)
+    if args.output:
+        result.to_csv(args.output, index=False)
+        print(f"{len(result)} pairs written to {args.output}")
+    else:
+        print(result.to_string(index=False))
+    print(f"Scored {len(result)} pairs in {elapsed:.2f}s ({len(result) / max(elapsed, 1e-9) * 60:,.0f} pairs/min)")
+
+
+if __name__ == "__main__":
+    main()
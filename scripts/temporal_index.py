@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Prefix-sum index of first attestations by year, relationship, domain and language.
+
+``counts[language, relationship, domain, k]`` holds the number of word pairs
+first attested in ``language`` before year ``FIRST_YEAR + k``. The last
+relationship and domain slots are totals over all of them. The number of
+pairs of a relationship type in a domain attested between two years is then a
+difference of two cells. Any period scheme is a gather at its edges followed
+by a ``diff``. Appending rows adds their per-year histogram to the prefix
+sums.
+"""
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from masterframe import CACHE_DIR, CULTURAL_DOMAINS, RELATIONSHIP_TYPES, SCHEMA, apply_schema, load_masterframe
+
+STATE_PATH = CACHE_DIR / "temporal_index.npz"
+LANGUAGES = ["english", "spanish"]
+ATTESTATION_COLUMNS = {language: f"first_attestation_{language}" for language in LANGUAGES}
+INDEX_COLUMNS = ["relationship_type", "cultural_domain", *ATTESTATION_COLUMNS.values()]
+FIRST_YEAR = min(SCHEMA[column]["min"] for column in ATTESTATION_COLUMNS.values())
+LAST_YEAR = max(SCHEMA[column]["max"] for column in ATTESTATION_COLUMNS.values())
+ALL = None  # relationship / domain wildcard
+
+# Period schemes as (label, first year) pairs; each period runs to the next one's start
+PERIOD_SCHEMES: Dict[str, Sequence[tuple]] = {
+    "historical": [
+        ("Before 1400", FIRST_YEAR),
+        ("1400-1599", 1400),
+        ("1600-1799", 1600),
+        ("1800-1899", 1800),
+        ("1900 onwards", 1900),
+    ],
+    "centuries": [("Before 1000", FIRST_YEAR)] + [(f"{year}s", year) for year in range(1000, 2100, 100)],
+}
+
+
+class TemporalIndex:
+    """Cumulative attestation counts with O(1) range queries."""
+
+    def __init__(self) -> None:
+        self.relationships = list(RELATIONSHIP_TYPES)
+        self.domains = list(CULTURAL_DOMAINS)
+        shape = (len(LANGUAGES), len(self.relationships) + 1, len(self.domains) + 1, LAST_YEAR - FIRST_YEAR + 2)
+        self.counts = np.zeros(shape, dtype=np.int64)
+        self.rows = 0
+        self._relationship_slots = {label: i for i, label in enumerate([*self.relationships, ALL])}
+        self._domain_slots = {label: i for i, label in enumerate([*self.domains, ALL])}
+
+    def append(self, df: pd.DataFrame) -> "TemporalIndex":
+        """Add the rows of ``df``; rows without an attestation year are skipped for that language."""
+        relationship = self._codes(df["relationship_type"], self.relationships)
+        domain = self._codes(df["cultural_domain"], self.domains)
+        histogram = np.zeros(self.counts.shape[:3] + (self.counts.shape[3] - 1,), dtype=np.int64)
+        for index, column in enumerate(ATTESTATION_COLUMNS.values()):
+            years = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+            keep = ~np.isnan(years) & (relationship >= 0) & (domain >= 0)
+            offsets = years[keep].astype(np.int64) - FIRST_YEAR
+            if len(offsets) and (offsets.min() < 0 or offsets.max() > LAST_YEAR - FIRST_YEAR):
+                raise ValueError(f"{column} outside {FIRST_YEAR}-{LAST_YEAR}")
+            np.add.at(histogram[index], (relationship[keep], domain[keep], offsets), 1)
+        # totals over relationships and domains live in the last slots
+        histogram[:, -1] = histogram[:, :-1].sum(axis=1)
+        histogram[:, :, -1] = histogram[:, :, :-1].sum(axis=2)
+        self.counts[..., 1:] += np.cumsum(histogram, axis=-1)
+        self.rows += len(df)
+        return self
+
+    @staticmethod
+    def _codes(series: pd.Series, labels: Sequence[str]) -> np.ndarray:
+        return pd.Categorical(series.astype(str), categories=labels).codes.astype(np.int64)
+
+    def count(
+        self,
+        relationship: Optional[str] = ALL,
+        domain: Optional[str] = ALL,
+        language: str = "english",
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+    ) -> int:
+        """Pairs first attested in ``language`` in ``[start, end]`` (open-ended if ``None``)."""
+        cumulative = self.counts[LANGUAGES.index(language), self._relationship_slots[relationship],
+                                 self._domain_slots[domain]]
+        last = len(cumulative) - 1
+        low = 0 if start is None else min(max(start - FIRST_YEAR, 0), last)
+        high = last if end is None else min(max(end + 1 - FIRST_YEAR, 0), last)
+        return int(cumulative[high] - cumulative[low]) if high > low else 0
+
+    def share_before(
+        self,
+        year: int,
+        relationship: Optional[str] = ALL,
+        domain: Optional[str] = ALL,
+        language: str = "english",
+    ) -> Optional[float]:
+        """% of attested pairs first attested before ``year``."""
+        total = self.count(relationship, domain, language)
+        return self.count(relationship, domain, language, end=year - 1) / total * 100 if total else None
+
+    def rebin(self, starts: Sequence[int], language: str = "english") -> np.ndarray:
+        """Counts per period for every relationship x domain slot (totals included).
+
+        ``starts`` are ascending period start years; the last period runs to
+        ``LAST_YEAR``. Returns an array shaped ``(relationships + 1, domains + 1, periods)``.
+        """
+        edges = np.asarray([*starts, LAST_YEAR + 1], dtype=np.int64) - FIRST_YEAR
+        edges = np.clip(edges, 0, self.counts.shape[-1] - 1)
+        return np.diff(self.counts[LANGUAGES.index(language)][..., edges], axis=-1)
+
+    def period_table(self, scheme: str = "historical", language: str = "english", by: str = "relationship_type",
+                     domain: Optional[str] = ALL) -> pd.DataFrame:
+        """Counts per period of a named scheme, by relationship type (in ``domain``) or by domain."""
+        labels, starts = zip(*PERIOD_SCHEMES[scheme])
+        counts = self.rebin(starts, language)
+        if by == "relationship_type":
+            table = counts[:-1, self._domain_slots[domain]]
+            index = self.relationships
+        else:
+            table = counts[-1, :-1]
+            index = self.domains
+        return pd.DataFrame(table, index=pd.Index(index, name=by), columns=list(labels))
+
+    def save(self, path: Path = STATE_PATH) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(
+            path,
+            counts=self.counts,
+            rows=np.asarray(self.rows),
+            relationships=np.asarray(self.relationships),
+            domains=np.asarray(self.domains),
+            years=np.asarray([FIRST_YEAR, LAST_YEAR]),
+        )
+        return path
+
+    @classmethod
+    def load(cls, path: Path = STATE_PATH) -> "TemporalIndex":
+        index = cls()
+        with np.load(path, allow_pickle=False) as npz:
+            if (
+                npz["relationships"].tolist() != index.relationships
+                or npz["domains"].tolist() != index.domains
+                or npz["years"].tolist() != [FIRST_YEAR, LAST_YEAR]
+            ):
+                raise ValueError(f"{path} was built for a different schema; rebuild it")
+            index.counts = npz["counts"]
+            index.rows = int(npz["rows"])
+        return index
+
+
+def build_index(df: Optional[pd.DataFrame] = None) -> TemporalIndex:
+    return TemporalIndex().append(load_masterframe(INDEX_COLUMNS) if df is None else df)
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scheme", choices=list(PERIOD_SCHEMES), default="historical")
+    parser.add_argument("--language", choices=LANGUAGES, default="english")
+    parser.add_argument("--by", choices=["relationship_type", "cultural_domain"], default="relationship_type")
+    parser.add_argument("--domain", choices=CULTURAL_DOMAINS, help="Restrict the relationship table to one domain")
+    parser.add_argument("--append", type=Path, help="CSV of new word pairs to add to the saved index")
+    parser.add_argument("--state", type=Path, default=STATE_PATH)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = parse_args(argv)
+    if args.append:
+        index = TemporalIndex.load(args.state) if args.state.exists() else build_index()
+        batch = apply_schema(pd.read_csv(args.append))
+        index.append(batch)
+        print(f"Appended {len(batch)} rows; index now covers {index.rows} rows ({args.state})")
+    else:
+        index = build_index()
+    index.save(args.state)
+
+    scope = f" in {args.domain}" if args.domain else ""
+    print(f"First {args.language} attestations per period ({args.scheme}){scope}:")
+    print(index.period_table(args.scheme, args.language, args.by, args.domain).to_string())
+    share = index.share_before(1400, "false_friends", args.domain, args.language)
+    if share is not None:
+        print(f"\nFalse friends first attested in {args.language} before 1400: {share:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
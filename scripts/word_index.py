@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""In-process word index over the masterframe: exact, prefix and fuzzy lookups.
+
+* exact lookups go through a hash map on accent- and case-folded forms, so
+  "abaco" finds "ábaco";
+* autocomplete walks a prefix trie over the folded forms;
+* fuzzy "which false friends look like this word" queries search a BK-tree
+  under the Levenshtein distance behind the ``levenshtein_similarity``
+  column (``1 - distance / max(len)`` on the lowercased words).
+
+``serve`` exposes the same queries over a small local HTTP endpoint.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import unicodedata
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from masterframe import float64_values, load_masterframe
+
+FALSE_FRIENDS = "false_friends"
+LANGUAGES = ("english", "spanish")
+INDEX_COLUMNS = [
+    "english_word",
+    "spanish_word",
+    "spanish_meaning_ff",
+    "relationship_type",
+    "cultural_domain",
+    "levenshtein_similarity",
+]
+COMPLETE_LIMIT = 10
+SIMILAR_MAX_DISTANCE = 2
+SIMILAR_LIMIT = 20
+HOST = "127.0.0.1"
+PORT = 8765
+# Query parameters each GET endpoint accepts; anything else is a 400.
+ENDPOINT_PARAMS = {
+    "/lookup": {"word"},
+    "/complete": {"prefix", "limit", "language"},
+    "/similar": {"word", "max_distance", "min_similarity", "relationship_type", "limit"},
+}
+
+
+def fold(word: str) -> str:
+    """Case- and accent-folded form used as the lookup key ("Ábaco" -> "abaco")."""
+    decomposed = unicodedata.normalize("NFKD", word.strip().casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def levenshtein_distance(a: str, b: str) -> int:
+    """Edit distance with unit insert/delete/substitute costs."""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+def levenshtein_similarity(a: str, b: str) -> float:
+    """``1 - distance / max(len)`` on lowercased words, as in the masterframe column."""
+    a, b = a.lower(), b.lower()
+    longest = max(len(a), len(b))
+    return 1.0 - levenshtein_distance(a, b) / longest if longest else 1.0
+
+
+class PrefixTrie:
+    """Character trie mapping keys to the row ids stored under them."""
+
+    __slots__ = ("children", "ids")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, PrefixTrie] = {}
+        self.ids: List[int] = []
+
+    def insert(self, key: str, row: int) -> None:
+        node = self
+        for char in key:
+            node = node.children.setdefault(char, PrefixTrie())
+        node.ids.append(row)
+
+    def complete(self, prefix: str, limit: int = COMPLETE_LIMIT) -> List[Tuple[str, List[int]]]:
+        """Up to ``limit`` ``(key, row ids)`` under ``prefix``, shortest then alphabetical."""
+        node = self
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return []
+        found: List[Tuple[str, List[int]]] = []
+        level = [(prefix, node)]
+        while level and len(found) < limit:
+            following = []
+            for key, current in level:
+                if current.ids:
+                    found.append((key, current.ids))
+                    if len(found) == limit:
+                        break
+                following.extend((key + char, child) for char, child in sorted(current.children.items()))
+            level = following
+        return found
+
+
+class BKTree:
+    """Burkhard-Keller tree over words under the Levenshtein distance."""
+
+    def __init__(self, words: Iterable[str] = ()) -> None:
+        self.root: Optional[Tuple[str, Dict[int, tuple]]] = None
+        for word in words:
+            self.add(word)
+
+    def add(self, word: str) -> None:
+        if self.root is None:
+            self.root = (word, {})
+            return
+        node_word, children = self.root
+        while True:
+            distance = levenshtein_distance(word, node_word)
+            if distance == 0:
+                return
+            child = children.get(distance)
+            if child is None:
+                children[distance] = (word, {})
+                return
+            node_word, children = child
+
+    def search(self, word: str, max_distance: int) -> List[Tuple[int, str]]:
+        """All stored words within ``max_distance`` of ``word``, as sorted ``(distance, word)``."""
+        if self.root is None:
+            return []
+        found = []
+        stack = [self.root]
+        while stack:
+            node_word, children = stack.pop()
+            distance = levenshtein_distance(word, node_word)
+            if distance <= max_distance:
+                found.append((distance, node_word))
+            for edge in range(max(distance - max_distance, 1), distance + max_distance + 1):
+                child = children.get(edge)
+                if child is not None:
+                    stack.append(child)
+        return sorted(found)
+
+
+class WordIndex:
+    """Exact, prefix and fuzzy lookups over the masterframe word pairs."""
+
+    def __init__(self, df=None) -> None:
+        df = load_masterframe(INDEX_COLUMNS) if df is None else df
+        similarity = float64_values(df["levenshtein_similarity"])
+        meaning = df["spanish_meaning_ff"].astype(object).where(df["spanish_meaning_ff"].notna(), None)
+        self.records: List[Dict[str, object]] = [
+            {
+                "english_word": english,
+                "spanish_word": spanish,
+                "spanish_meaning_ff": spanish_meaning,
+                "relationship_type": relationship,
+                "cultural_domain": domain,
+                "levenshtein_similarity": float(score),
+            }
+            for english, spanish, spanish_meaning, relationship, domain, score in zip(
+                df["english_word"], df["spanish_word"], meaning,
+                df["relationship_type"].astype(str), df["cultural_domain"].astype(str), similarity,
+            )
+        ]
+
+        self.keys: Dict[str, List[int]] = {}
+        self.tries = {language: PrefixTrie() for language in LANGUAGES}
+        # lowercased word -> row ids, per relationship type, for the BK-trees
+        self.words: Dict[str, Dict[str, List[int]]] = {}
+        for row, record in enumerate(self.records):
+            for language in LANGUAGES:
+                word = str(record[f"{language}_word"])
+                key = fold(word)
+                rows = self.keys.setdefault(key, [])
+                if row not in rows:
+                    rows.append(row)
+                self.tries[language].insert(key, row)
+                pairs = self.words.setdefault(str(record["relationship_type"]), {}).setdefault(word.lower(), [])
+                if row not in pairs:
+                    pairs.append(row)
+        self._trees: Dict[Optional[str], BKTree] = {}
+        self._trees_lock = threading.Lock()
+
+    def _tree(self, relationship_type: Optional[str]) -> BKTree:
+        """BK-tree over one relationship type's words (all words if ``None``), built on first use.
+
+        The server answers on several threads; the lock makes concurrent first
+        queries build each tree once instead of racing on a half-built one.
+        """
+        tree = self._trees.get(relationship_type)
+        if tree is None:
+            with self._trees_lock:
+                if relationship_type not in self._trees:
+                    if relationship_type is None:
+                        words = sorted({word for words in self.words.values() for word in words})
+                    else:
+                        words = sorted(self.words.get(relationship_type, {}))
+                    self._trees[relationship_type] = BKTree(words)
+                tree = self._trees[relationship_type]
+        return tree
+
+    def lookup(self, word: str) -> List[Dict[str, object]]:
+        """Word pairs whose english or spanish word folds to the same form as ``word``."""
+        return [self.records[row] for row in self.keys.get(fold(word), ())]
+
+    def complete(
+        self,
+        prefix: str,
+        limit: int = COMPLETE_LIMIT,
+        language: Optional[str] = None,
+    ) -> List[Dict[str, object]]:
+        """Autocomplete ``prefix`` (accent-insensitive) to up to ``limit`` words."""
+        matches = []
+        for name in [language] if language else LANGUAGES:
+            for _, rows in self.tries[name].complete(fold(prefix), limit):
+                word = str(self.records[rows[0]][f"{name}_word"])
+                matches.append({"word": word, "language": name, "pairs": len(rows)})
+        matches.sort(key=lambda match: (len(match["word"]), fold(match["word"])))
+        return matches[:limit]
+
+    def similar(
+        self,
+        word: str,
+        max_distance: int = SIMILAR_MAX_DISTANCE,
+        relationship_type: Optional[str] = FALSE_FRIENDS,
+        min_similarity: Optional[float] = None,
+        limit: int = SIMILAR_LIMIT,
+    ) -> List[Dict[str, object]]:
+        """Word pairs of ``relationship_type`` with a word close to ``word`` in edit distance.
+
+        ``min_similarity`` filters on the column's similarity instead; it is
+        turned into the edit radius that can still reach it, since a match at
+        distance d has at most ``len(word) + d`` characters.
+        """
+        query = word.strip().lower()
+        if min_similarity is not None:
+            max_distance = int((1 - min_similarity) * len(query) / max(min_similarity, 1e-9))
+        words = self.words.get(relationship_type, {}) if relationship_type else None
+        results = []
+        for distance, match in self._tree(relationship_type).search(query, max_distance):
+            similarity = 1.0 - distance / max(len(query), len(match), 1)
+            if min_similarity is not None and similarity < min_similarity:
+                continue
+            rows = words[match] if words is not None else [
+                row for pairs in self.words.values() for row in pairs.get(match, ())
+            ]
+            for row in rows:
+                results.append({"match": match, "distance": distance, "similarity": round(similarity, 3),
+                                **self.records[row]})
+        return results[:limit]
+
+    def lookup_many(self, words: Sequence[str]) -> Dict[str, List[Dict[str, object]]]:
+        return {word: self.lookup(word) for word in words}
+
+    def complete_many(self, prefixes: Sequence[str], **options) -> Dict[str, List[Dict[str, object]]]:
+        return {prefix: self.complete(prefix, **options) for prefix in prefixes}
+
+    def similar_many(self, words: Sequence[str], **options) -> Dict[str, List[Dict[str, object]]]:
+        return {word: self.similar(word, **options) for word in words}
+
+
+def _query_options(query: Dict[str, List[str]]) -> Dict[str, object]:
+    options: Dict[str, object] = {}
+    for name, cast in (("limit", int), ("max_distance", int), ("min_similarity", float)):
+        if name in query:
+            options[name] = cast(query[name][0])
+    if "relationship_type" in query:
+        options["relationship_type"] = query["relationship_type"][0] or None
+    if "language" in query:
+        options["language"] = query["language"][0]
+    return options
+
+
+def make_handler(index: WordIndex):
+    """HTTP handler class serving ``index``.
+
+    GET /lookup?word=, /complete?prefix=&limit=&language=,
+    /similar?word=&max_distance=&min_similarity=&relationship_type=;
+    POST /batch with ``{"lookup": [...], "complete": [...], "similar": [...]}``.
+    """
+
+    class WordIndexHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _send(self, status: int, payload: object) -> None:
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:
+            url = urlparse(self.path)
+            query = parse_qs(url.query, keep_blank_values=True)
+            if url.path not in ENDPOINT_PARAMS:
+                self._send(404, {"error": f"unknown path {url.path}"})
+                return
+            unknown = sorted(set(query) - ENDPOINT_PARAMS[url.path])
+            if unknown:
+                self._send(400, {"error": f"bad request: unknown parameter(s) {', '.join(unknown)} for {url.path}"})
+                return
+            try:
+                options = _query_options(query)
+                if url.path == "/lookup":
+                    self._send(200, index.lookup(query["word"][0]))
+                elif url.path == "/complete":
+                    self._send(200, index.complete(query["prefix"][0], **options))
+                else:
+                    self._send(200, index.similar(query["word"][0], **options))
+            except (KeyError, ValueError, TypeError) as error:
+                self._send(400, {"error": f"bad request: {error}"})
+
+        def do_POST(self) -> None:
+            if urlparse(self.path).path != "/batch":
+                self._send(404, {"error": f"unknown path {self.path}"})
+                return
+            try:
+                request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                self._send(200, {
+                    "lookup": index.lookup_many(request.get("lookup", [])),
+                    "complete": index.complete_many(request.get("complete", [])),
+                    "similar": index.similar_many(request.get("similar", [])),
+                })
+            except (ValueError, AttributeError, TypeError) as error:
+                self._send(400, {"error": f"bad request: {error}"})
+
+        def log_message(self, format: str, *args) -> None:  # keep load tests quiet
+            pass
+
+    return WordIndexHandler
+
+
+def serve(index: WordIndex, host: str = HOST, port: int = PORT) -> None:
+    server = ThreadingHTTPServer((host, port), make_handler(index))
+    print(f"Serving word index on http://{host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    lookup = commands.add_parser("lookup", help="Exact (accent-insensitive) lookup")
+    lookup.add_argument("words", nargs="+")
+    complete = commands.add_parser("complete", help="Autocomplete prefixes")
+    complete.add_argument("prefixes", nargs="+")
+    complete.add_argument("--limit", type=int, default=COMPLETE_LIMIT)
+    similar = commands.add_parser("similar", help="False friends (or other pairs) that look like a word")
+    similar.add_argument("words", nargs="+")
+    similar.add_argument("--max-distance", type=int, default=SIMILAR_MAX_DISTANCE)
+    similar.add_argument("--min-similarity", type=float)
+    similar.add_argument("--relationship-type", default=FALSE_FRIENDS, help="'' for all pairs")
+    server = commands.add_parser("serve", help="Local HTTP endpoint")
+    server.add_argument("--host", default=HOST)
+    server.add_argument("--port", type=int, default=PORT)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = parse_args(argv)
+    index = WordIndex()
+    if args.command == "serve":
+        serve(index, args.host, args.port)
+        return
+    if args.command == "lookup":
+        results = index.lookup_many(args.words)
+    elif args.command == "complete":
+        results = index.complete_many(args.prefixes, limit=args.limit)
+    else:
+        results = index.similar_many(
+            args.words,
+            max_distance=args.max_distance,
+            min_similarity=args.min_similarity,
+            relationship_type=args.relationship_type or None,
+        )
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
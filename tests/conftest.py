@@ -0,0 +1,17 @@
+"""Make the flat ``scripts/`` modules importable the way the scripts import each other."""
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1] / "scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+
+@pytest.fixture(scope="session")
+def masterframe():
+    """The committed masterframe, typed by its schema. Copy before modifying."""
+    from masterframe import load_masterframe
+
+    return load_masterframe()
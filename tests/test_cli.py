@@ -0,0 +1,25 @@
+"""Warm cli server: per-request profiles."""
+import json
+import threading
+import tracemalloc
+
+import cli
+
+
+def test_warm_profiles_are_written_per_request(tmp_path):
+    socket_path = tmp_path / "cli.sock"
+    threading.Thread(target=cli.serve, args=(socket_path, False), daemon=True).start()
+    cli._wait_for_server(socket_path, timeout=30)
+
+    spans = {}
+    for name in ["first", "second"]:
+        response = cli.request("metrics", ["--profile", str(tmp_path / name)], socket_path)
+        assert response["status"] == 0, response["stderr"]
+        assert "Profile written to" in response["stderr"]
+        spans[name] = [span["name"] for span in json.loads((tmp_path / f"{name}.json").read_text())["spans"]]
+        assert (tmp_path / f"{name}.trace.json").exists()
+        assert not tracemalloc.is_tracing()
+    assert spans["first"] == spans["second"]
+
+    response = cli.request("metrics", [], socket_path)
+    assert response["status"] == 0 and "Profile written" not in response["stderr"]
@@ -0,0 +1,62 @@
+"""Complexity engine: published columns, incremental updates vs a fresh engine."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from complexity import DEFAULT_WEIGHTS, INPUT_COLUMNS, OUTPUT_COLUMNS, ComplexityEngine, parse_weights, verify
+from masterframe import DATA_PATH
+
+
+def test_published_columns_are_reproduced(masterframe):
+    report = verify(ComplexityEngine(masterframe), masterframe)
+    assert (report["different"] == 0).all()
+    assert (report["exact"] + report["rounding_tie"] == len(masterframe)).all()
+
+
+def test_weight_change_equals_fresh_engine(masterframe):
+    engine = ComplexityEngine(masterframe)
+    weights = parse_weights(["frequency_scale=4", "length_cap=15"])
+    changed = engine.set_weights(weights)
+    assert changed == ["complexity_freq_component", "complexity_length_component"]
+    fresh = ComplexityEngine(masterframe, weights)
+    pd.testing.assert_frame_equal(engine.frame(rounded=False), fresh.frame(rounded=False), rtol=0, atol=1e-12)
+    assert engine.set_weights(weights) == []
+
+
+def test_row_updates_equal_fresh_engine(masterframe):
+    engine = ComplexityEngine(masterframe)
+    edited = masterframe[INPUT_COLUMNS].copy()
+    rows = np.array([0, 5, 17, len(edited) - 1])
+    edited.iloc[rows, 0] += 1
+    edited.iloc[rows[:2], 3] = np.nan  # missing input: the component and overall become NaN
+    assert np.array_equal(engine.update(edited), rows)
+    fresh = ComplexityEngine(edited)
+    pd.testing.assert_frame_equal(engine.frame(rounded=False), fresh.frame(rounded=False), rtol=0, atol=1e-12)
+    assert engine.frame()[OUTPUT_COLUMNS[0]].iloc[rows[:2]].isna().all()
+    assert len(engine.update(edited)) == 0
+
+
+def test_unknown_weight_is_rejected():
+    with pytest.raises(ValueError, match="Unknown weight"):
+        parse_weights(["nonsense=1"])
+    assert parse_weights([]) == DEFAULT_WEIGHTS
+
+
+def test_engine_from_plain_csv_updates_in_place():
+    df = pd.read_csv(DATA_PATH)
+    engine = ComplexityEngine(df)
+    rows = np.array([1, 2, 40])
+    values = {
+        "complexity_frequency_complexity": np.array([9.99, 0.5, np.nan]),  # 9.99: a value not seen before
+        "complexity_length": np.array([30.0, 3.0, 3.0]),
+    }
+    engine.update_rows(rows, values)
+    weights = parse_weights(["frequency_scale=4", "length_offset=3"])
+    engine.set_weights(weights)
+
+    edited = df[INPUT_COLUMNS].copy()
+    for column, column_values in values.items():
+        edited.loc[rows, column] = column_values
+    fresh = ComplexityEngine(edited, weights)
+    pd.testing.assert_frame_equal(engine.frame(rounded=False), fresh.frame(rounded=False), rtol=0, atol=1e-12)
+    assert df.loc[1, "complexity_frequency_complexity"] != 9.99  # the caller's frame is untouched
@@ -0,0 +1,80 @@
+"""Running correlations: Chan merges against DataFrame.corr, append vs rebuild."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from correlations import CorrelationEngine, RunningCorrelation, pearson, spearman
+from masterframe import NUMERIC_COLUMNS, float64_values
+
+GROUPINGS = ["cultural_domain", "relationship_type"]
+
+
+def numeric(df):
+    return pd.DataFrame({column: float64_values(df[column]) for column in NUMERIC_COLUMNS})
+
+
+def assert_matrix_close(actual, expected):
+    np.testing.assert_allclose(actual.to_numpy(), expected.to_numpy(), rtol=0, atol=1e-10, equal_nan=True)
+
+
+def test_pearson_matches_dataframe_corr(masterframe):
+    engine = pearson(masterframe)
+    values = numeric(masterframe)
+    assert_matrix_close(engine.matrix(), values.corr())
+    for label, rows in masterframe.groupby("relationship_type", observed=True).groups.items():
+        expected = values.loc[rows].corr()
+        assert_matrix_close(engine.matrix("relationship_type", str(label)), expected)
+        assert engine.rows("relationship_type", str(label)) == len(rows)
+
+
+def test_spearman_matches_dataframe_corr(masterframe):
+    assert_matrix_close(spearman(masterframe).matrix(), numeric(masterframe).corr(method="spearman"))
+
+
+def test_chan_merge_of_uneven_blocks_equals_one_pass():
+    rng = np.random.default_rng(0)
+    values = rng.normal(loc=50, scale=[1, 10, 100], size=(1000, 3))
+    values[rng.random(values.shape) < 0.1] = np.nan
+    merged = RunningCorrelation(3)
+    for block in np.split(values, [1, 7, 400]):
+        merged.merge(RunningCorrelation(3).update(block))
+    whole = RunningCorrelation(3).update(values)
+    np.testing.assert_array_equal(merged.n, whole.n)
+    np.testing.assert_allclose(merged.correlation(), whole.correlation(), atol=1e-12)
+    np.testing.assert_allclose(merged.correlation(), pd.DataFrame(values).corr().to_numpy(), atol=1e-12)
+
+
+def test_append_equals_rebuild(masterframe, tmp_path):
+    half = len(masterframe) // 2
+    engine = pearson(masterframe.iloc[:half])
+    path = engine.save(tmp_path / "state.npz")
+    appended = CorrelationEngine.load(path).update(masterframe.iloc[half:])
+    rebuilt = pearson(masterframe)
+    assert appended.rows() == rebuilt.rows() == len(masterframe)
+    assert_matrix_close(appended.matrix(), rebuilt.matrix())
+    for grouping in GROUPINGS:
+        assert appended.groups[grouping].keys() == rebuilt.groups[grouping].keys()
+        for label in rebuilt.groups[grouping]:
+            assert_matrix_close(appended.matrix(grouping, label), rebuilt.matrix(grouping, label))
+
+
+def test_all_nan_column_and_missing_group_labels(masterframe):
+    df = masterframe.iloc[:500].copy()
+    df["complexity_length"] = np.nan
+    df["cultural_domain"] = df["cultural_domain"].astype(object)
+    df.loc[df.index[:50], "cultural_domain"] = None
+    engine = pearson(df)
+    expected = numeric(df).corr()
+    assert expected["complexity_length"].isna().all()
+    assert_matrix_close(engine.matrix(), expected)
+    assert "None" not in engine.groups["cultural_domain"] and "nan" not in engine.groups["cultural_domain"]
+    assert sum(stats.rows for stats in engine.groups["cultural_domain"].values()) == 450
+
+
+def test_empty_update_changes_nothing():
+    stats = RunningCorrelation(2).update(np.array([[1.0, 2.0], [2.0, 4.5], [3.0, 5.0]]))
+    before = stats.correlation().copy()
+    stats.update(np.empty((0, 2)))
+    np.testing.assert_array_equal(stats.correlation(), before)
+    assert stats.rows == 3
+    assert stats.correlation()[0, 1] == pytest.approx(np.corrcoef([1, 2, 3], [2, 4.5, 5])[0, 1])
@@ -0,0 +1,74 @@
+"""Plot layout: bounded, deterministic relaxed moves over the rows that are drawn."""
+import numpy as np
+import pytest
+
+from regenerate_interactive_plot import (
+    DOMAIN_MAP,
+    X_JITTER_RANGE,
+    Y_JITTER_RANGE,
+    apply_jitter,
+    apply_relaxed_layout,
+    axis_ranges,
+    load_dataset,
+    main,
+    relax_positions,
+)
+
+ROUNDING = 0.01  # apply_relaxed_layout rounds to two decimals
+
+
+@pytest.fixture(scope="module")
+def plot_frame():
+    return load_dataset(None)
+
+
+def test_relaxed_layout_moves_no_further_than_the_jitter(plot_frame):
+    relaxed = apply_relaxed_layout(plot_frame)
+    dx = (relaxed["x_jitter"] - plot_frame["first_attestation_english"]).abs()
+    dy = (relaxed["y_jitter"] - plot_frame["time_gap"]).abs()
+    assert dx.max() <= X_JITTER_RANGE[1] + ROUNDING
+    assert dy.max() <= Y_JITTER_RANGE[1] + ROUNDING
+    assert (np.hypot(dx, dy) > ROUNDING).mean() < 0.5
+
+
+def test_dense_points_stay_within_reach():
+    rng = np.random.default_rng(0)
+    x = rng.integers(1000, 1100, 5000).astype(float)
+    y = rng.integers(0, 100, 5000).astype(float)
+    rx, ry = relax_positions(x, y)
+    assert np.abs(rx - x).max() <= X_JITTER_RANGE[1] + 1e-9
+    assert np.abs(ry - y).max() <= Y_JITTER_RANGE[1] + 1e-9
+    again = relax_positions(x, y)
+    assert np.array_equal(rx, again[0]) and np.array_equal(ry, again[1])
+
+
+def test_separated_points_do_not_move():
+    x = np.array([1000.0, 1500.0, 2000.0])
+    y = np.array([0.0, 400.0, 800.0])
+    rx, ry = relax_positions(x, y)
+    assert np.array_equal(rx, x) and np.array_equal(ry, y)
+
+
+def test_all_domains_needs_large_data(capsys):
+    with pytest.raises(SystemExit) as exit:
+        main(["--all-domains", "--output", "unused.html"])
+    assert exit.value.code == 2
+    assert "--all-domains needs --large-data" in capsys.readouterr().err
+
+
+def test_standard_figure_ranges_cover_only_drawn_domains(plot_frame):
+    drawn = apply_jitter(load_dataset(DOMAIN_MAP.keys()))
+    assert set(drawn["cultural_domain"].astype(str)) <= set(DOMAIN_MAP)
+    (x_low, x_high), _ = axis_ranges(drawn)
+    assert plot_frame["first_attestation_english"].min() < x_low
+    assert x_high - x_low < np.ptp(plot_frame["first_attestation_english"])
+
+
+def test_hidden_rows_do_not_push_drawn_ones(plot_frame):
+    drawn = plot_frame["cultural_domain"].isin(list(DOMAIN_MAP)).to_numpy()
+    relaxed = apply_relaxed_layout(plot_frame, drawn=drawn)
+    alone = apply_relaxed_layout(plot_frame[drawn].reset_index(drop=True))
+    np.testing.assert_array_equal(relaxed.loc[drawn, "x_jitter"], alone["x_jitter"])
+    np.testing.assert_array_equal(relaxed.loc[drawn, "y_jitter"], alone["y_jitter"])
+    hidden = relaxed[~drawn]
+    np.testing.assert_array_equal(hidden["x_jitter"], hidden["first_attestation_english"])
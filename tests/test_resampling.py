@@ -0,0 +1,45 @@
+"""Seeded resampling: results depend on the seed and resample count only."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from resampling import CHUNK_RESAMPLES, domain_ffr_intervals, frequency_gap_interval
+
+N_RESAMPLES = 2 * CHUNK_RESAMPLES + 500  # three chunks, the last one short
+
+
+def test_domain_intervals_do_not_depend_on_workers(masterframe):
+    serial = domain_ffr_intervals(masterframe, N_RESAMPLES, seed=7, workers=1)
+    pooled = domain_ffr_intervals(masterframe, N_RESAMPLES, seed=7, workers=2)
+    pd.testing.assert_frame_equal(serial, pooled)
+    assert ((serial["ci_low"] <= serial["ffr"]) & (serial["ffr"] <= serial["ci_high"])).all()
+
+
+def test_gap_interval_is_reproducible_and_seed_sensitive(masterframe):
+    first = frequency_gap_interval(masterframe, N_RESAMPLES, seed=7, workers=1)
+    again = frequency_gap_interval(masterframe, N_RESAMPLES, seed=7, workers=2)
+    other = frequency_gap_interval(masterframe, N_RESAMPLES, seed=8, workers=1)
+    pd.testing.assert_series_equal(first, again)
+    assert first["ci_low"] != other["ci_low"]
+    assert first["ci_low"] <= first["gap"] <= first["ci_high"]
+
+
+def test_domain_intervals_match_the_observed_rates(masterframe):
+    result = domain_ffr_intervals(masterframe, CHUNK_RESAMPLES, seed=1, workers=1)
+    domain = masterframe["cultural_domain"].astype(str)
+    is_ff = masterframe["relationship_type"] == "false_friends"
+    expected = is_ff.groupby(domain).mean() * 100
+    np.testing.assert_allclose(result["ffr"], expected.reindex(result.index), rtol=1e-12)
+    assert result["pairs"].sum() == len(masterframe)
+    assert result["p_value"].between(0, 1).all()
+    assert result["std_error"].gt(0).any()
+
+
+def test_empty_false_friend_group_still_resamples():
+    df = pd.DataFrame({
+        "relationship_type": ["cognates"] * 6 + ["false_friends"] * 2,
+        "cultural_domain": ["a"] * 4 + ["b"] * 4,
+    })
+    result = domain_ffr_intervals(df, 200, seed=3, workers=1)
+    assert result.loc["a", "ffr"] == 0 and result.loc["a", "ci_high"] == 0
+    assert result.loc["b", "ffr"] == pytest.approx(50.0)
@@ -0,0 +1,19 @@
+"""Risk scorer word cache: results and hit/miss counts under eviction."""
+import numpy as np
+
+from risk_scoring import UNKNOWN, RiskScorer
+
+
+def test_batch_larger_than_cache_counts_each_lookup_once():
+    scorer = RiskScorer(cache_size=2)
+    words = ["actual", "embarazada", "sensible", "actual", "no-such-word"]
+    reference = RiskScorer().word_rows(words)
+
+    rows = scorer.word_rows(words)
+    assert np.array_equal(rows, reference)
+    assert rows[-1] == UNKNOWN
+    assert (scorer.hits, scorer.misses) == (1, 4)
+    assert len(scorer._words) == 2
+
+    scorer.word_rows(["no-such-word", "sensible"])
+    assert (scorer.hits, scorer.misses) == (3, 4)
@@ -0,0 +1,65 @@
+"""Vectorized Levenshtein and Jaccard against plain reference implementations."""
+import numpy as np
+import pytest
+
+from masterframe import float64_values
+from similarity import compute_similarities, encode, levenshtein_distances
+from word_index import levenshtein_distance
+
+EDGE_PAIRS = [
+    ("", ""),
+    ("", "abc"),
+    ("abc", ""),
+    ("a", "a"),
+    ("kitten", "sitting"),
+    ("flaw", "lawn"),
+    ("ábaco", "abacus"),
+    ("Embarazada", "embarrassed"),
+    ("aaaaaaaaaaaaaaaaaaaa", "a"),
+]
+
+
+def reference_distance(a, b):
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+def distances(pairs):
+    a, la = encode([first for first, _ in pairs])
+    b, lb = encode([second for _, second in pairs])
+    return levenshtein_distances(a, la, b, lb)
+
+
+def test_edge_cases_match_reference():
+    expected = [reference_distance(a.lower(), b.lower()) for a, b in EDGE_PAIRS]
+    np.testing.assert_array_equal(distances(EDGE_PAIRS), expected)
+
+
+def test_random_words_match_reference():
+    rng = np.random.default_rng(0)
+    alphabet = list("abcdeñá")
+    words = ["".join(rng.choice(alphabet, rng.integers(0, 12))) for _ in range(800)]
+    pairs = list(zip(words[:400], words[400:]))
+    expected = [reference_distance(a, b) for a, b in pairs]
+    np.testing.assert_array_equal(distances(pairs), expected)
+    assert [levenshtein_distance(a, b) for a, b in pairs[:50]] == expected[:50]
+
+
+def test_masterframe_columns_are_reproduced(masterframe):
+    computed = compute_similarities(masterframe["english_word"], masterframe["spanish_word"], workers=1)
+    np.testing.assert_allclose(computed["jaccard_similarity"], float64_values(masterframe["jaccard_similarity"]),
+                               atol=1e-6)
+    published = float64_values(masterframe["levenshtein_similarity"])
+    differs = ~np.isclose(computed["levenshtein_similarity"], published, atol=1e-6)
+    # the published row scores caliber/calibre as identical; the distance is 2
+    assert masterframe.loc[differs, "english_word"].tolist() == ["caliber"]
+
+
+def test_jaccard_of_character_sets():
+    computed = compute_similarities(["abc", "", "aab"], ["bcd", "", "ba"], workers=1)
+    assert computed["jaccard_similarity"].tolist() == [pytest.approx(0.5), 1.0, 1.0]
@@ -0,0 +1,65 @@
+"""Grouped ANOVA, Levene and t-tests against scipy on the committed masterframe."""
+import numpy as np
+import pytest
+from scipy import stats
+
+from masterframe import float64_values
+from statistical_tests import GroupedMatrix, anova_from_moments, anova_grid, levene_from_matrix, t_test_grid
+
+METRICS = ["complexity_overall_complexity", "levenshtein_similarity", "complexity_syllables"]
+
+
+def scipy_groups(df, metric, grouping):
+    values = float64_values(df[metric])
+    labels = df[grouping].astype(str).to_numpy()
+    groups = [values[labels == label] for label in sorted(set(labels))]
+    return [group[~np.isnan(group)] for group in groups]
+
+
+@pytest.mark.parametrize("grouping", ["cultural_domain", "relationship_type"])
+def test_anova_and_levene_match_scipy(masterframe, grouping):
+    grid = anova_grid(masterframe, METRICS, [grouping]).set_index("metric")
+    for metric in METRICS:
+        groups = scipy_groups(masterframe, metric, grouping)
+        f, p = stats.f_oneway(*groups)
+        w, levene_p = stats.levene(*groups, center="median")
+        assert grid.loc[metric, "f"] == pytest.approx(f, rel=1e-9)
+        assert grid.loc[metric, "p"] == pytest.approx(p, rel=1e-6, abs=1e-300)
+        assert grid.loc[metric, "levene_w"] == pytest.approx(w, rel=1e-9)
+        assert grid.loc[metric, "levene_p"] == pytest.approx(levene_p, rel=1e-6, abs=1e-300)
+
+
+def test_student_and_welch_match_scipy(masterframe):
+    grid = t_test_grid(masterframe, "relationship_type", "false_friends", "cognates", METRICS)
+    for metric in METRICS:
+        a, b = (
+            scipy_groups(masterframe[masterframe["relationship_type"] == label], metric, "relationship_type")[0]
+            for label in ("false_friends", "cognates")
+        )
+        student = stats.ttest_ind(a, b)
+        welch = stats.ttest_ind(a, b, equal_var=False)
+        assert grid.loc[metric, "t"] == pytest.approx(student.statistic, rel=1e-9)
+        assert grid.loc[metric, "p_two"] == pytest.approx(student.pvalue, rel=1e-6)
+        assert grid.loc[metric, "welch_t"] == pytest.approx(welch.statistic, rel=1e-9)
+        assert grid.loc[metric, "welch_p"] == pytest.approx(welch.pvalue, rel=1e-6)
+
+
+def test_empty_group_is_left_out():
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(60, 1))
+    codes = np.repeat([0, 2, 3], 20)  # group 1 has no rows
+    anova = anova_from_moments(GroupedMatrix(values, codes, 4).moments())
+    f, p = stats.f_oneway(values[:20, 0], values[20:40, 0], values[40:, 0])
+    assert anova["k"][0] == 3
+    assert anova["f"][0] == pytest.approx(f, rel=1e-9)
+    assert anova["p"][0] == pytest.approx(p, rel=1e-9)
+
+
+def test_all_nan_metric_gives_nan_without_disturbing_others():
+    rng = np.random.default_rng(1)
+    values = np.column_stack([rng.normal(size=40), np.full(40, np.nan)])
+    grouped = GroupedMatrix(values, np.repeat([0, 1], 20), 2)
+    anova = anova_from_moments(grouped.moments())
+    levene = levene_from_matrix(grouped)
+    assert np.isnan(anova["f"][1]) and np.isnan(levene["w"][1])
+    assert anova["f"][0] == pytest.approx(stats.f_oneway(values[:20, 0], values[20:, 0]).statistic, rel=1e-9)
@@ -0,0 +1,73 @@
+"""Prefix-sum attestation index against direct counts on the masterframe."""
+import numpy as np
+import pytest
+
+from temporal_index import FIRST_YEAR, LAST_YEAR, PERIOD_SCHEMES, TemporalIndex, build_index
+
+QUERIES = [
+    (None, None, "english", None, None),
+    ("false_friends", None, "english", 1400, 1599),
+    ("cognates", "family_kinship", "spanish", None, 1499),
+    (None, "technology_tools", "english", 1900, None),
+    ("false_friends", "emotions_psychology", "spanish", 1200, 1200),
+    (None, None, "english", 1800, 1700),  # empty range
+]
+
+
+def direct_count(df, relationship, domain, language, start, end):
+    years = df[f"first_attestation_{language}"].astype("float64")
+    keep = years.notna()
+    if relationship is not None:
+        keep &= df["relationship_type"] == relationship
+    if domain is not None:
+        keep &= df["cultural_domain"] == domain
+    if start is not None:
+        keep &= years >= start
+    if end is not None:
+        keep &= years <= end
+    return int(keep.sum())
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_range_counts_match_direct_counts(masterframe, query):
+    assert build_index(masterframe).count(*query) == direct_count(masterframe, *query)
+
+
+def test_rebin_matches_direct_counts(masterframe):
+    index = build_index(masterframe)
+    labels, starts = zip(*PERIOD_SCHEMES["historical"])
+    table = index.period_table("historical", by="relationship_type")
+    ends = [start - 1 for start in starts[1:]] + [LAST_YEAR]
+    for relationship in table.index:
+        expected = [direct_count(masterframe, relationship, None, "english", start, end)
+                    for start, end in zip(starts, ends)]
+        assert table.loc[relationship].tolist() == expected
+    assert table.to_numpy().sum() == direct_count(masterframe, None, None, "english", None, None)
+
+
+def test_append_equals_rebuild(masterframe, tmp_path):
+    third = len(masterframe) // 3
+    index = TemporalIndex().append(masterframe.iloc[:third])
+    path = index.save(tmp_path / "index.npz")
+    appended = TemporalIndex.load(path).append(masterframe.iloc[third:2 * third]).append(masterframe.iloc[2 * third:])
+    rebuilt = build_index(masterframe)
+    np.testing.assert_array_equal(appended.counts, rebuilt.counts)
+    assert appended.rows == rebuilt.rows == len(masterframe)
+
+
+def test_empty_append_and_missing_years(masterframe):
+    index = TemporalIndex().append(masterframe.iloc[:0])
+    assert index.count() == 0 and index.share_before(1500) is None
+    df = masterframe.iloc[:10].copy()
+    df["first_attestation_spanish"] = np.nan
+    index.append(df)
+    assert index.count(language="spanish") == 0
+    assert index.count(language="english") == 10
+
+
+def test_out_of_range_years_are_rejected(masterframe):
+    df = masterframe.iloc[:1].copy()
+    df["first_attestation_english"] = df["first_attestation_english"].astype("float64")
+    df.loc[df.index[0], "first_attestation_english"] = FIRST_YEAR - 1
+    with pytest.raises(ValueError, match="outside"):
+        TemporalIndex().append(df)
@@ -0,0 +1,61 @@
+"""Word index HTTP endpoint: bad queries get a 400 response, not a dropped connection."""
+import json
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from word_index import WordIndex, make_handler
+
+
+@pytest.fixture(scope="module")
+def index():
+    return WordIndex()
+
+
+@pytest.fixture(scope="module")
+def base_url(index):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(index))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def get(url):
+    try:
+        with urllib.request.urlopen(url, timeout=10) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as error:
+        return error.code, json.loads(error.read())
+
+
+@pytest.mark.parametrize("query", [
+    "/complete?prefix=ab&max_distance=2",
+    "/lookup?word=abaco&limit=3",
+    "/similar?word=actual&limit=many",
+    "/complete?prefix=ab&language=french",
+    "/similar?max_distance=1",
+])
+def test_bad_queries_get_400(base_url, query):
+    status, payload = get(base_url + query)
+    assert status == 400
+    assert payload["error"].startswith("bad request")
+
+
+def test_good_queries(base_url):
+    status, payload = get(base_url + "/complete?prefix=ab&limit=2")
+    assert status == 200 and len(payload) == 2
+    status, payload = get(base_url + "/lookup?word=abaco")
+    assert status == 200 and payload[0]["spanish_word"] == "ábaco"
+
+
+def test_concurrent_first_queries_build_one_tree():
+    index = WordIndex()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        trees = list(pool.map(lambda _: index._tree(None), range(16)))
+    assert all(tree is trees[0] for tree in trees)